@@ -0,0 +1,51 @@
+from .harness import Skip, benchmark, patched, setup_django
+from . import synthetic
+
+CODECS = (dict(codec=None), dict(codec='zlib'), dict(codec='zstd'), dict(codec='lz4'))
+
+def compiled_blob():
+    from relocation.engine import RelocationSerializer
+    from relocation.utils import buf_to_unicode
+    main, sections = RelocationSerializer.deserialize(synthetic.page(page_size=100000, relocates=300))
+    return buf_to_unicode(sections['javascript'])
+
+@benchmark('cache.get', CODECS)
+def cache_get(codec):
+    """ reading a ~large compiled blob back: plain tuple vs decompressing it """
+    setup_django()
+    from django.core.cache import get_cache
+    from relocation.cache import Compression, cached_data, store
+    try:
+        compression = codec and Compression(codec, threshold=0)
+    except ImportError as e:
+        raise Skip(str(e))
+
+    backend = get_cache('default')
+    store(backend, 'bench-cache-get', compiled_blob(), compression=compression)
+    def run():
+        with cached_data('bench-cache-get', backend=backend) as ctx:
+            return ctx.response
+    return run
+
+@benchmark('cache.warm_start', (dict(backend='nocache'), dict(backend='disk'), dict(backend='default')))
+def warm_start(backend):
+    """
+    A restarted worker running the coffee processor: compiling everything (nocache), reading
+    what a previous process left on disk (disk), or a warm in-process cache (default)
+    """
+    setup_django()
+    from relocation import processors
+    from relocation.engine import RelocationSerializer
+    from relocation.coffeeutils import pejis
+
+    rendered = synthetic.page(page_size=10000, relocates=30)
+    def run():
+        main, sections = RelocationSerializer.deserialize(rendered)
+        with patched(processors, 'CACHE_NAME', backend):
+            processors.coffee('bench.tmpl', main, sections)
+        return sections
+    try:
+        run()
+    except pejis.RuntimeUnavailable as e:
+        raise Skip('javascript runtime unavailable: %s' % (e,))
+    return run
@@ -0,0 +1,128 @@
+from collections import deque
+
+from relocation.dtypes import mudeque
+from relocation.engine import BytesRelocationSerializer, RelocationSerializer
+from relocation.utils import buf_md5, buf_to_bytes, buf_to_unicode
+
+from .harness import benchmark
+from . import synthetic
+
+PAGES = (
+    dict(page_size=10000, relocates=10),
+    dict(page_size=100000, relocates=100),
+    dict(page_size=1000000, relocates=1000),
+    dict(page_size=100000, relocates=100, nesting=3),
+    dict(page_size=100000, relocates=100, destinations=10),
+)
+
+@benchmark('engine.deserialize', PAGES)
+def deserialize(**kwargs):
+    s = synthetic.page(**kwargs)
+    return lambda: RelocationSerializer.deserialize(s)
+
+@benchmark('engine.do_relocation', PAGES)
+def do_relocation(**kwargs):
+    s = synthetic.page(**kwargs)
+    return lambda: RelocationSerializer.do_relocation(s)
+
+@benchmark('dtypes.mudeque.append', [dict(items=1000), dict(items=100000)])
+def mudeque_append(items):
+    def run():
+        buf = mudeque()
+        for i in range(items):
+            buf.append(u'x')
+    return run
+
+@benchmark('dtypes.mudeque.branch', [dict(branches=10), dict(branches=100), dict(branches=1000)])
+def mudeque_branch(branches):
+    def run():
+        buf = mudeque()
+        for i in range(branches):
+            buf.append(u'x')
+            buf.branch(mudeque())
+            buf.branch()
+    return run
+
+@benchmark('dtypes.mudeque.graft', [dict(branches=10), dict(branches=100), dict(branches=1000)])
+def mudeque_graft(branches):
+    def run():
+        buf = mudeque()
+        for i in range(branches):
+            buf.append(u'x')
+            buf.graft(mudeque())
+    return run
+
+@benchmark('dtypes.mudeque.iterate', [dict(branches=10), dict(branches=1000)])
+def mudeque_iterate(branches):
+    buf = mudeque()
+    for i in range(branches):
+        buf.extend(u'x' * 10)
+        buf.branch(mudeque(deque(u'y' * 10)))
+        buf.branch()
+    return lambda: list(buf)
+
+# About 1000, 4000 and 16000 destination markers (one per section per destination)
+MARKER_PAGES = tuple(dict(page_size=10000, relocates=100, destinations=d) for d in (333, 1333, 5333))
+
+@benchmark('engine.deserialize.markers', MARKER_PAGES)
+def deserialize_markers(**kwargs):
+    """ per marker time should stay flat as the markers multiply """
+    s = synthetic.page(**kwargs)
+    return lambda: buf_to_unicode(RelocationSerializer.deserialize(s)[0])
+
+@benchmark('engine.deserialize.nested_destinations', [dict(depth=1000), dict(depth=4000)])
+def deserialize_nested_destinations(depth):
+    """ each section holds the destination of the next one: s0 <- s1 <- ... <- s<depth> """
+    s = u''.join([RelocationSerializer.destination('s0')] + [
+        u''.join((RelocationSerializer.relocate_start('s%d' % i), u'v%d;' % i,
+                  RelocationSerializer.destination('s%d' % (i + 1)), RelocationSerializer.relocate_end()))
+        for i in range(depth)])
+    return lambda: buf_to_unicode(RelocationSerializer.deserialize(s)[0])
+
+@benchmark('engine.deserialize.dedupe', [dict(dedupe=False), dict(dedupe=True)])
+def deserialize_dedupe(dedupe):
+    """ 30 distinct fragments repeated through 1000 relocates, deserialized and joined into processor input """
+    s = synthetic.page(page_size=100000, relocates=1000, distinct=30)
+    policies = dict((name, dict(dedupe=dedupe)) for name in ('css', 'coffee', 'javascript'))
+    def run():
+        main, sections = RelocationSerializer.deserialize(s, policies=policies)
+        return [buf_to_unicode(section) for section in sections.values()]
+    return run
+
+@benchmark('dtypes.mudeque.len', [dict(branches=10), dict(branches=1000)])
+def mudeque_len(branches):
+    buf = mudeque()
+    for i in range(branches):
+        buf.extend(u'x' * 10)
+        buf.graft(mudeque(deque(u'y' * 10)))
+    return lambda: len(buf)
+
+@benchmark('utils.buf_to_unicode', PAGES)
+def join(**kwargs):
+    main, sections = RelocationSerializer.deserialize(synthetic.page(**kwargs))
+    return lambda: buf_to_unicode(main)
+
+RESPONSE_PAGES = tuple(dict(page_size=size, relocates=size // 1000, alphabet=alphabet, mode=mode)
+                       for size in (100000, 1000000) for alphabet in ('ascii', 'hebrew') for mode in ('text', 'bytes'))
+
+@benchmark('engine.relocate_to_response', RESPONSE_PAGES)
+def relocate_to_response(page_size, relocates, alphabet, mode):
+    """
+    A rendered page to response bytes, hashing its sections on the way (like externify): text
+    deserializes the string and encodes the joined main document, bytes encodes the rendered
+    page once and relocates memoryview slices of it. Run with --memory for the peak allocation.
+    """
+    s = synthetic.page(page_size=page_size, relocates=relocates)
+    if alphabet == 'hebrew':
+        s = s.replace(u'lorem', u'\u05dc\u05d5\u05e8\u05dd')
+    if mode == 'text':
+        def run():
+            main, sections = RelocationSerializer.deserialize(s)
+            hashes = [buf_md5(section).hexdigest() for section in sections.values()]
+            return buf_to_unicode(main).encode('utf8'), hashes
+    else:
+        def run():
+            main, sections = BytesRelocationSerializer.deserialize(s.encode('utf8'))
+            hashes = [buf_md5(section).hexdigest() for section in sections.values()]
+            return buf_to_bytes(main), hashes
+    return run
@@ -0,0 +1,26 @@
+from .harness import Skip, benchmark
+
+RUNTIMES = (
+    dict(runtime='MiniRacer'),
+    dict(runtime='Node', stdin=True),
+    dict(runtime='Node', stdin=False),
+)
+SOURCE = u'''
+window.handler = (event) ->
+  for item in event.items when item.visible
+    console.log "item", item.name
+'''
+
+@benchmark('pejis.coffee_compile', RUNTIMES)
+def coffee_compile(runtime, stdin=None):
+    from relocation.coffeeutils import load_compiler_source, pejis
+    try:
+        js_runtime = pejis.get(runtime)
+    except pejis.RuntimeUnavailable as e:
+        raise Skip(str(e))
+    context = js_runtime.compile(load_compiler_source())
+    def run():
+        if stdin is not None:
+            js_runtime.use_stdin = stdin
+        return context.call("CoffeeScript.compile", SOURCE)
+    return run
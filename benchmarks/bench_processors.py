@@ -0,0 +1,177 @@
+import sys
+import time
+import types
+import threading
+from copy import copy, deepcopy
+
+from .harness import Skip, benchmark, patched, setup_django
+from . import synthetic
+
+PAGE = dict(page_size=10000, relocates=30)
+STUB_REAL = (dict(compiler='stub'), dict(compiler='real'))
+
+class StubScss(object):
+    def compile(self, data):
+        return data
+
+class UnsafeStubScss(object):
+    """ Keeps its state on the instance like scss.Scss, so sharing one between threads mixes outputs """
+    def compile(self, data):
+        self.source = data
+        time.sleep(0.0001)
+        return self.source.upper()
+
+def stub_coffee(source):
+    return source
+
+stub_slimit = types.ModuleType('slimit')
+stub_slimit.minify = lambda data: data
+
+def processor_setup(processor_name, compiler):
+    setup_django()
+    from relocation import processors
+    from relocation.engine import RelocationSerializer
+    from relocation import coffeeutils
+    from relocation.utils import CompilerPool
+
+    rendered = synthetic.page(**PAGE)
+    processor = getattr(processors, processor_name)
+    if compiler == 'real':
+        try:
+            processor(*((None,) + RelocationSerializer.deserialize(rendered)))
+        except ImportError as e:
+            raise Skip(str(e))
+        except coffeeutils.pejis.RuntimeUnavailable as e:
+            raise Skip('javascript runtime unavailable: %s' % (e,))
+
+    def run():
+        main, sections = RelocationSerializer.deserialize(rendered)
+        processor('bench.tmpl', main, sections)
+        return main, sections
+
+    if compiler == 'real':
+        return run
+
+    def stubbed():
+        with patched(processors, 'scss_pool', CompilerPool(StubScss)):
+            with patched(coffeeutils, 'coffee', stub_coffee):
+                orig_slimit = sys.modules.get('slimit')
+                sys.modules['slimit'] = stub_slimit
+                try:
+                    return run()
+                finally:
+                    if orig_slimit is None:
+                        del sys.modules['slimit']
+                    else:
+                        sys.modules['slimit'] = orig_slimit
+    return stubbed
+
+@benchmark('processors.scss', STUB_REAL)
+def scss(compiler):
+    return processor_setup('scss', compiler)
+
+@benchmark('processors.coffee', STUB_REAL)
+def coffee(compiler):
+    return processor_setup('coffee', compiler)
+
+@benchmark('processors.minify_js', STUB_REAL)
+def minify_js(compiler):
+    return processor_setup('minify_js', compiler)
+
+@benchmark('processors.externify')
+def externify():
+    return processor_setup('externify', 'stub')
+
+@benchmark('processors.externify.deepcopy', [dict(relocates=10), dict(relocates=1000)])
+def externify_deepcopy(relocates):
+    from relocation.engine import RelocationSerializer
+    main, sections = RelocationSerializer.deserialize(synthetic.page(page_size=1000, relocates=relocates))
+    return lambda: deepcopy(sections['javascript'])
+
+@benchmark('processors.externify.copy', [dict(relocates=10), dict(relocates=1000)])
+def externify_copy(relocates):
+    """ externify's copy of the section since it stopped deep copying """
+    from relocation.engine import RelocationSerializer
+    main, sections = RelocationSerializer.deserialize(synthetic.page(page_size=1000, relocates=relocates))
+    return lambda: copy(sections['javascript'])
+
+class SlowStubScss(object):
+    def compile(self, data):
+        time.sleep(0.001)
+        return data
+
+def slow_stub_coffee(source):
+    time.sleep(0.001)
+    return source
+
+@benchmark('processors.lazy', [dict(compiler=compiler, lazy=lazy, serve=serve)
+                               for compiler in ('stub', 'real') for lazy in (False, True) for serve in (False, True)])
+def lazy_processing(compiler, lazy, serve):
+    """
+    coffee, scss and externify without a cache: the page render (serve=False) compiles nothing with
+    lazy sections, serving the externified javascript and css (serve=True) compiles them then.
+    The stub compilers take 1ms per compile.
+    """
+    setup_django()
+    from relocation import coffeeutils, processors, run_processors
+    from relocation.utils import CompilerPool, buf_to_unicode
+
+    rendered = synthetic.page(**PAGE)
+    pipeline = ('relocation.processors.coffee', 'relocation.processors.scss', 'relocation.processors.externify')
+    def run():
+        with patched(processors, 'LAZY_PROCESSING', lazy):
+            main, sections = run_processors('bench.tmpl', rendered, pipeline)
+            buf_to_unicode(main)
+            if serve:
+                buf_to_unicode(sections['javascript'])
+                buf_to_unicode(sections['css'])
+
+    if compiler == 'real':
+        try:
+            processors.make_scss_compiler()
+            coffeeutils.coffee(u'a = 1')
+        except ImportError as e:
+            raise Skip(str(e))
+        except coffeeutils.pejis.RuntimeUnavailable as e:
+            raise Skip('javascript runtime unavailable: %s' % (e,))
+        return run
+
+    def stubbed():
+        with patched(processors, 'scss_pool', CompilerPool(SlowStubScss)):
+            with patched(coffeeutils, 'coffee', slow_stub_coffee):
+                run()
+    return stubbed
+
+@benchmark('processors.scss.concurrent', [dict(compiler=compiler, threads=threads)
+                                          for compiler in ('stub', 'real') for threads in (1, 8)])
+def scss_concurrent(compiler, threads):
+    """ Stress check of the scss compiler pool: concurrent outputs must equal serial ones """
+    setup_django()
+    from relocation import processors
+    from relocation.utils import CompilerPool
+
+    sources = [u'.c%d { .d%d { width: %dpx; } }\n' % (i, i, i) for i in range(200)]
+    if compiler == 'stub':
+        pool = CompilerPool(UnsafeStubScss)
+        serial = [UnsafeStubScss().compile(source) for source in sources]
+    else:
+        try:
+            serial = [processors.make_scss_compiler().compile(source) for source in sources]
+        except ImportError as e:
+            raise Skip(str(e))
+        pool = CompilerPool(processors.make_scss_compiler)
+    pool.prefill()
+
+    def run():
+        results = [None] * len(sources)
+        def work(offset):
+            for i in range(offset, len(sources), threads):
+                results[i] = processors.compile_scss(sources[i])
+        workers = [threading.Thread(target=work, args=(offset,)) for offset in range(threads)]
+        with patched(processors, 'scss_pool', pool):
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        assert results == serial, 'concurrent scss output differs from the serial output'
+    return run
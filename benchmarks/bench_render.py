@@ -0,0 +1,121 @@
+import io
+import os
+
+from .harness import Skip, benchmark, patched, setup_django
+from . import synthetic
+
+PAGES = (
+    dict(page_size=10000, relocates=10),
+    dict(page_size=100000, relocates=100),
+    dict(page_size=100000, relocates=100, nesting=3, destinations=3),
+)
+
+def write_template(settings, name, source):
+    with io.open(os.path.join(settings.TEMPLATE_DIRS[0], name), 'w', encoding='utf8') as f:
+        f.write(source)
+
+def template_name(kwargs):
+    return 'bench-%s.tmpl' % ('-'.join('%s%s' % item for item in sorted(kwargs.items())))
+
+DJANGO_MODES = tuple(dict(page, direct_sections=direct) for page in PAGES for direct in (False, True))
+
+@benchmark('render.django', DJANGO_MODES)
+def django_render(direct_sections, **kwargs):
+    """ magic markers parsed back out of the output vs relocate tags collected while rendering """
+    settings = setup_django()
+    from django.template import Context
+    from relocation import perform_relocation
+    from relocation.djangoutils import load_template, render_to_string, templatetags
+    from relocation.utils import buf_to_unicode
+
+    name = template_name(kwargs)
+    write_template(settings, name, synthetic.page_template(**kwargs))
+    if direct_sections:
+        def run():
+            with patched(templatetags, 'DIRECT_SECTIONS', True):
+                return render_to_string(name, Context({}))
+        return run
+    return lambda: buf_to_unicode(perform_relocation(name, load_template(name).render(Context({})))[0])
+
+@benchmark('render.jinja', PAGES)
+def jinja_render(**kwargs):
+    setup_django()
+    try:
+        from jinja2 import DictLoader, Environment
+    except ImportError:
+        raise Skip('jinja2 is not installed')
+    from relocation import perform_relocation
+    from relocation.jinjautils.extensions import RelocationExtension
+    from relocation.utils import buf_to_unicode
+
+    name = template_name(kwargs)
+    env = Environment(loader=DictLoader({name: synthetic.page_template(**kwargs)}),
+                      extensions=[RelocationExtension])
+    def run():
+        main, sections = perform_relocation(name, env.get_template(name).render({}))
+        return buf_to_unicode(main)
+    return run
+
+JINJA_MODES = tuple(dict(page, direct_sections=direct) for page in PAGES for direct in (False, True))
+
+@benchmark('render.jinja.environment', JINJA_MODES)
+def jinja_environment_render(direct_sections, **kwargs):
+    """ magic markers parsed back out of the output vs relocate blocks collected while rendering """
+    try:
+        from jinja2 import DictLoader
+    except ImportError:
+        raise Skip('jinja2 is not installed')
+    from relocation.jinjautils.environment import RelocatingEnvironment
+
+    name = template_name(kwargs)
+    env = RelocatingEnvironment(loader=DictLoader({name: synthetic.page_template(**kwargs)}),
+                                relocation_direct_sections=direct_sections)
+    return lambda: env.get_template(name).render({})
+
+SECTIONS_ONLY_MODES = tuple(dict(page, sections_only=sections_only) for page in PAGES for sections_only in (False, True))
+# Main document content worth skipping: a table rendered after every text part
+ROWS = [dict(name='item %d' % i, value=i * 1.5) for i in range(20)]
+DJANGO_ROWS = '{% for row in rows %}<tr><td>{{ row.name|title }}</td><td>{{ row.value|floatformat:2 }}</td></tr>{% endfor %}'
+JINJA_ROWS = '{% for row in rows %}<tr><td>{{ row.name|title }}</td><td>{{ "%.2f"|format(row.value) }}</td></tr>{% endfor %}'
+
+def dynamic_page_template(rows_template, **kwargs):
+    return synthetic.to_template([('text', part[1] + rows_template) if part[0] == 'text' else part
+                                  for part in synthetic.generate(**kwargs)])
+
+@benchmark('render.django.sections', SECTIONS_ONLY_MODES)
+def django_render_sections(sections_only, **kwargs):
+    """ what externified_view renders: the whole page vs only its relocate blocks """
+    settings = setup_django()
+    from django.template import Context
+    from django.template.loader import get_template
+    from relocation import djangoutils
+    from relocation.utils import buf_to_unicode
+
+    name = template_name(kwargs)
+    write_template(settings, name, dynamic_page_template(DJANGO_ROWS, **kwargs))
+    # Like the cached template loader, so section-only copies are made once
+    template = get_template(name)
+    render = djangoutils.render_sections if sections_only else djangoutils.render_and_relocate
+    def run():
+        with patched(djangoutils, 'load_template', lambda template_name: template):
+            return buf_to_unicode(render(name, Context(dict(rows=ROWS)))[1]['javascript'])
+    return run
+
+@benchmark('render.jinja.sections', SECTIONS_ONLY_MODES)
+def jinja_render_sections(sections_only, **kwargs):
+    try:
+        from jinja2 import DictLoader, Template
+    except ImportError:
+        raise Skip('jinja2 is not installed')
+    from relocation.jinjautils.environment import RelocatingEnvironment
+    from relocation.utils import buf_to_unicode
+
+    name = template_name(kwargs)
+    env = RelocatingEnvironment(loader=DictLoader({name: dynamic_page_template(JINJA_ROWS, **kwargs)}))
+    if sections_only:
+        return lambda: buf_to_unicode(env.render_sections(name, rows=ROWS)[1]['javascript'])
+    def run():
+        template = env.get_template(name)
+        sections, args, kwargs = template._with_collector((), dict(rows=ROWS))
+        return buf_to_unicode(template.relocate(Template.render(template, *args), sections)[1]['javascript'])
+    return run
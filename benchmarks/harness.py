@@ -0,0 +1,147 @@
+import gc
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+from collections import OrderedDict
+from contextlib import contextmanager
+
+BENCHMARKS = OrderedDict()
+
+class Skip(Exception):
+    pass
+
+def benchmark(name, params=({},)):
+    """
+    Registers a benchmark. The decorated function is called once per params dict
+    and returns a no-argument callable which is then timed.
+    Raising Skip from the setup function records the benchmark as skipped.
+    """
+    def decorator(setup):
+        BENCHMARKS[name] = (setup, [dict(p) for p in params])
+        return setup
+    return decorator
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'benchmarks.settings')
+    try:
+        from django.conf import settings
+    except ImportError:
+        raise Skip('django is not installed')
+    from relocation.djangoutils import relocation_add_to_builtins
+    relocation_add_to_builtins()
+    return settings
+
+@contextmanager
+def patched(obj, name, value):
+    orig = getattr(obj, name)
+    setattr(obj, name, value)
+    try:
+        yield
+    finally:
+        setattr(obj, name, orig)
+
+def measure(func, repeat=5, min_time=0.2):
+    """ Like timeit's autorange: find a loop count taking at least min_time and repeat it """
+    func()
+    number = 1
+    while True:
+        elapsed = _time_loop(func, number)
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    times = [elapsed] + [_time_loop(func, number) for _ in range(repeat - 1)]
+    per_call = sorted(t / number for t in times)
+    return OrderedDict((
+        ('number', number),
+        ('repeat', repeat),
+        ('min', per_call[0]),
+        ('median', per_call[len(per_call) // 2]),
+        ('mean', sum(per_call) / len(per_call)),
+    ))
+
+def measure_memory(func):
+    """
+    Peak allocation of a single call in bytes: traced by tracemalloc (python 3.4+), else the growth of
+    the resident size's high-water mark (see relocation.profiling.RusageProfiler), coarser
+    """
+    gc.collect()
+    try:
+        import tracemalloc
+    except ImportError:
+        from relocation.profiling import RusageProfiler
+        profiler = RusageProfiler()
+        with profiler.stage('call'):
+            func()
+        return profiler.stages[0]['peak']
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _time_loop(func, number):
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.time()
+        for _ in range(number):
+            func()
+        return time.time() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def git_revision():
+    try:
+        p = subprocess.Popen(['git', 'rev-parse', 'HEAD'], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                             cwd=os.path.dirname(os.path.abspath(__file__)))
+        out, _ = p.communicate()
+    except OSError:
+        return None
+    return out.decode('ascii').strip() or None
+
+def run(pattern=None, repeat=5, min_time=0.2, memory=False, log=sys.stderr):
+    results = []
+    for name, (setup, params_list) in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        for params in params_list:
+            entry = OrderedDict((('name', name), ('params', params)))
+            try:
+                func = setup(**params)
+                entry.update(measure(func, repeat=repeat, min_time=min_time))
+                if memory:
+                    entry['memory_peak'] = measure_memory(func)
+            except Skip as e:
+                entry['skipped'] = str(e)
+            log.write('%s %s %s%s\n' % (name, json.dumps(params, sort_keys=True),
+                      entry.get('skipped') or '%.6fs' % entry['median'],
+                      ' %s bytes peak' % entry['memory_peak'] if entry.get('memory_peak') is not None else ''))
+            results.append(entry)
+    return OrderedDict((
+        ('meta', OrderedDict((
+            ('revision', git_revision()),
+            ('timestamp', time.time()),
+            ('python', platform.python_version()),
+            ('implementation', platform.python_implementation()),
+            ('platform', platform.platform()),
+        ))),
+        ('results', results),
+    ))
+
+def result_key(entry):
+    return entry['name'], json.dumps(entry['params'], sort_keys=True)
+
+def compare(old, new):
+    """ yields (name, params, old_median, new_median, ratio) for benchmarks present in both runs """
+    old_results = dict((result_key(e), e) for e in old['results'] if 'median' in e)
+    for entry in new['results']:
+        key = result_key(entry)
+        if 'median' not in entry or key not in old_results:
+            continue
+        old_median = old_results[key]['median']
+        yield key[0], key[1], old_median, entry['median'], entry['median'] / old_median
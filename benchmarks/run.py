@@ -0,0 +1,53 @@
+"""
+Runs the relocation benchmarks and writes the results as JSON.
+
+    python -m benchmarks.run -o before.json
+    python -m benchmarks.run -o after.json
+    python -m benchmarks.run --compare before.json after.json
+"""
+import sys
+import json
+import argparse
+from importlib import import_module
+
+from . import harness
+
+MODULES = (
+    'bench_cache',
+    'bench_engine',
+    'bench_pejis',
+    'bench_processors',
+    'bench_render',
+)
+
+def load_json(filename):
+    with open(filename) as f:
+        return json.load(f)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='relocation benchmarks')
+    parser.add_argument('-o', '--output', help='write JSON results to this file (default: stdout)')
+    parser.add_argument('-k', '--filter', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimal duration of a single repeat')
+    parser.add_argument('--memory', action='store_true', help='also record the peak allocation of a call')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help='compare two result files')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        old, new = map(load_json, args.compare)
+        for name, params, old_median, new_median, ratio in harness.compare(old, new):
+            print('%-40s %-60s %.6fs -> %.6fs (x%.2f)' % (name, params, old_median, new_median, ratio))
+        return
+
+    for module in MODULES:
+        import_module('.' + module, __package__)
+    results = harness.run(args.filter, repeat=args.repeat, min_time=args.min_time, memory=args.memory)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+if __name__ == '__main__':
+    main()
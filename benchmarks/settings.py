@@ -0,0 +1,24 @@
+import os
+import tempfile
+
+BENCHMARK_PATH = os.path.dirname(os.path.abspath(__file__))
+# Synthetic templates are written here by the render benchmarks
+TEMPLATE_DIRS = (tempfile.mkdtemp(prefix='relocation-bench-'),)
+
+ROOT_URLCONF = 'benchmarks.urls'
+SECRET_KEY = 'relocation-benchmarks'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'nocache': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    },
+    'disk': {
+        'BACKEND': 'relocation.diskcache.DiskCache',
+        'LOCATION': tempfile.mkdtemp(prefix='relocation-bench-cache-'),
+    },
+}
+RELOCATION_CACHE = 'nocache'
+RELOCATION_PROCESSORS = ()
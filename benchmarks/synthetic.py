@@ -0,0 +1,86 @@
+"""
+Reproducible synthetic pages for the benchmarks.
+
+A page is generated as a list of parts which can then be emitted either as template
+source (the relocate/destination tags are the same for django and jinja) or directly
+as a rendered string containing the relocation markers.
+"""
+import random
+
+from relocation.engine import RelocationSerializer
+
+SECTION_SAMPLES = dict(
+    css = lambda i: '.component-%d { color: #%06x; .inner { margin: %dpx; } }\n' % (i, i * 7919 % 0xffffff, i % 16),
+    coffee = lambda i: 'window.handler%d = (event) -> console.log "component %d", event\n' % (i, i),
+    javascript = lambda i: 'window.value%d = function(a, b) { return a + b + %d; };\n' % (i, i),
+)
+WORDS = 'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor'.split()
+
+def filler(rnd, size):
+    ret = []
+    length = 0
+    while length < size:
+        line = '<div class="w%d">%s</div>\n' % (rnd.randrange(100), ' '.join(rnd.choice(WORDS) for _ in range(8)))
+        ret.append(line)
+        length += len(line)
+    return ''.join(ret)
+
+def generate(page_size=10000, relocates=10, nesting=0, destinations=1,
+             sections=('css', 'coffee', 'javascript'), seed=0, distinct=None):
+    """
+    Returns a list of parts: ('text', s), ('destination', name), ('relocate', name, parts).
+    page_size is the approximate size of the main document text, nesting is the depth of
+    relocate blocks placed inside each relocated block and destinations is the number of
+    destination markers emitted per section. With distinct the relocated content repeats
+    every distinct blocks (like a component used throughout a long list).
+    """
+    rnd = random.Random(seed)
+    parts = [('text', '<html><head>\n')]
+    for _ in range(destinations):
+        for section in sections:
+            parts.append(('destination', section))
+    parts.append(('text', '</head><body>\n'))
+    chunk = page_size // (relocates + 1)
+    counter = [0]
+
+    def relocate_block(depth):
+        counter[0] += 1
+        section = sections[counter[0] % len(sections)]
+        sample = counter[0] % distinct if distinct else counter[0]
+        body = [('text', SECTION_SAMPLES.get(section, SECTION_SAMPLES['javascript'])(sample))]
+        if depth:
+            body.append(relocate_block(depth - 1))
+        return ('relocate', section, body)
+
+    for _ in range(relocates):
+        parts.append(('text', filler(rnd, chunk)))
+        parts.append(relocate_block(nesting))
+    parts.append(('text', filler(rnd, chunk)))
+    parts.append(('text', '</body></html>\n'))
+    return parts
+
+def to_template(parts):
+    def emit(part):
+        if part[0] == 'text':
+            return part[1]
+        if part[0] == 'destination':
+            return '{%% destination %s %%}' % part[1]
+        return '{%% relocate %s %%}%s{%% endrelocate %%}' % (part[1], ''.join(emit(p) for p in part[2]))
+    return u''.join(emit(part) for part in parts)
+
+def to_rendered(parts):
+    def emit(part):
+        if part[0] == 'text':
+            return part[1]
+        if part[0] == 'destination':
+            return RelocationSerializer.destination(part[1])
+        return ''.join((RelocationSerializer.relocate_start(part[1]),
+                        ''.join(emit(p) for p in part[2]),
+                        RelocationSerializer.relocate_end()))
+    return u''.join(emit(part) for part in parts)
+
+def page(**kwargs):
+    return to_rendered(generate(**kwargs))
+
+def page_template(**kwargs):
+    return to_template(generate(**kwargs))
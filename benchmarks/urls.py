@@ -0,0 +1,8 @@
+from django.conf.urls.defaults import patterns, url
+
+from relocation.djangoutils import externified_view
+
+urlpatterns = patterns('',
+    url(r'^relocation/(?P<section>[^/]+)/(?P<template_name>.*)/(?P<data_hash>.*)$',
+        externified_view, name='externified_view'),
+)
@@ -1,10 +1,58 @@
-from django.conf import settings
+import sys
 
-from relocation.engine import RelocationSerializer
+from relocation.engine import RelocationSerializer, SectionCollector
 from relocation.utils import load_function
 
-def perform_relocation(template_name, rendered_template):
-    main, sections = RelocationSerializer.deserialize(rendered_template)
-    for processor in settings.RELOCATION_PROCESSORS:
-        load_function(processor)(template_name, main, sections)
+def load_processors(processors):
+    return [load_function(processor) for processor in processors]
+
+def prepare_processors(template_name, main, sections, pipeline):
+    """ Processors may have a prepare(template_name, main, sections, pipeline), called before any processor runs """
+    for processor in pipeline:
+        prepare = getattr(processor, 'prepare', None)
+        if prepare is not None:
+            prepare(template_name, main, sections, pipeline)
+
+def run_processors(template_name, rendered_template, processors, sections=None):
+    """
+    The relocation pipeline itself, without any dependency on django settings.
+    rendered_template may be UTF-8 bytes (see BytesRelocationSerializer)
+    """
+    serializer = RelocationSerializer.for_document(rendered_template)
+    main, sections = serializer.deserialize(rendered_template, sections)
+    pipeline = load_processors(processors)
+    prepare_processors(template_name, main, sections, pipeline)
+    for processor in pipeline:
+        processor(template_name, main, sections)
     return main, sections
+
+def section_collector(sections=None):
+    """ sections, or a new SectionCollector with the RELOCATION_SECTION_POLICIES """
+    if sections is not None:
+        return sections
+    from django.conf import settings
+    return SectionCollector(policies=getattr(settings, 'RELOCATION_SECTION_POLICIES', None))
+
+def perform_relocation(template_name, rendered_template, sections=None):
+    """ Runs the pipeline in the RELOCATION_WORKER_ADDRESS worker when set (see relocation.worker) """
+    from django.conf import settings
+    sections = section_collector(sections)
+    if getattr(settings, 'RELOCATION_PROFILE_MEMORY', False):
+        from relocation.profiling import perform_profiled_relocation
+        result = perform_profiled_relocation(template_name, rendered_template, settings.RELOCATION_PROCESSORS,
+                                             sections)
+        if result is not None:
+            return result
+    if getattr(settings, 'RELOCATION_WORKER_ADDRESS', None):
+        from relocation.worker import get_client
+        result = get_client().relocate(template_name, rendered_template, sections)
+        if result is not None:
+            return result
+    return run_processors(template_name, rendered_template, settings.RELOCATION_PROCESSORS, sections)
+
+def perform_relocation_async(template_name, rendered_template, sections=None):
+    """ Coroutine version of perform_relocation (python 3.7+), see relocation.aio """
+    if sys.version_info < (3, 7):
+        raise ImportError('perform_relocation_async needs python 3.7+')
+    from relocation.aio import perform_relocation_async
+    return perform_relocation_async(template_name, rendered_template, sections)
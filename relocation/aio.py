@@ -0,0 +1,38 @@
+"""
+asyncio entry points for the relocation pipeline, python 3.7+ only.
+
+The bundled processors (and relocation.cache, relocation.diskcache) run on django 1.4 as well as
+current versions (e.g 4.2), so this runs on python 3.7+ with a current django. The django template
+tags (relocation.djangoutils) still use django 1.4-era APIs (add_to_builtins is gone since 1.9):
+render with jinja (relocation.jinjautils) there, or hand rendered documents over.
+
+Processors are run on the default executor so they never block the event loop, unless
+they point to a coroutine variant of themselves through an ``async_processor`` attribute.
+"""
+import sys
+if sys.version_info < (3, 7):
+    raise ImportError('relocation.aio needs python 3.7+ (asyncio.get_running_loop)')
+
+import asyncio
+
+from .engine import RelocationSerializer
+from .utils import load_function
+
+async def run_processor(processor, template_name, main, sections):
+    processor = load_function(processor)
+    async_processor = getattr(processor, 'async_processor', None)
+    if async_processor:
+        await load_function(async_processor)(template_name, main, sections)
+    else:
+        await asyncio.get_running_loop().run_in_executor(None, processor, template_name, main, sections)
+
+async def perform_relocation_async(template_name, rendered_template, sections=None):
+    from django.conf import settings
+    from . import load_processors, prepare_processors, section_collector
+    serializer = RelocationSerializer.for_document(rendered_template)
+    main, sections = serializer.deserialize(rendered_template, section_collector(sections))
+    pipeline = load_processors(settings.RELOCATION_PROCESSORS)
+    prepare_processors(template_name, main, sections, pipeline)
+    for processor in pipeline:
+        await run_processor(processor, template_name, main, sections)
+    return main, sections
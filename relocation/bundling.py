@@ -0,0 +1,249 @@
+"""
+Splits sections into a bundle shared by many templates and a small page specific bundle.
+
+Fragments (the items of a section, e.g one per relocate block) are tracked by digest
+across templates into a stats file, and an offline step computes the bundle layout:
+
+    python -m relocation.bundling compute stats.jsonl layout.json --min-share 0.5
+
+With RELOCATION_BUNDLE_LAYOUT pointing at the layout file, the bundle processor removes
+the common fragments from the page's section and adds the whole common bundle as the
+"<section>@common" section (identical on every page, so it's cached once by browsers).
+It has to run before the processors collapsing fragments (and after coffee, which adds
+its compiled fragments to javascript):
+
+    RELOCATION_PROCESSORS = (
+        'relocation.processors.coffee',
+        'relocation.bundling.bundle',
+        'relocation.processors.scss',
+        'relocation.processors.minify_js',
+        'relocation.processors.externify',
+    )
+
+Only the sections externify emits references for are split (the common bundle is served
+through its own url), the others are left whole. Note that every page having a split section
+then gets all of its common fragments.
+"""
+import os
+import json
+import hashlib
+import argparse
+import functools
+import threading
+from collections import deque, OrderedDict
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .dtypes import LazySection, mudeque
+from .utils import to_unicode
+
+BUNDLE_SEPARATOR = '@'
+COMMON_BUNDLE = 'common'
+BUNDLED_SECTIONS = ('javascript', 'css')
+
+def bundle_name(section_name, bundle):
+    return section_name + BUNDLE_SEPARATOR + bundle
+
+def base_section_name(name):
+    return name.split(BUNDLE_SEPARATOR, 1)[0]
+
+def section_bundles(sections, section_name):
+    """ Names of the bundles of section_name present in sections, the common bundle first """
+    return [name for name in (bundle_name(section_name, COMMON_BUNDLE), section_name) if name in sections]
+
+def fragment_digest(fragment):
+    return hashlib.md5(fragment.encode('utf8')).hexdigest()
+
+class BundleLayout(object):
+    """
+    layout: {section: dict(owner=<template name>, fragments=[[digest, fragment], ...])}
+    owner is a template containing the section, used to build references to the common bundle.
+    """
+    def __init__(self, layout=None):
+        self.layout = layout or {}
+        self.digests = dict((section, set(digest for digest, fragment in data['fragments']))
+                            for section, data in self.layout.items())
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename) as f:
+            return cls(json.load(f))
+
+    def save(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.layout, f, indent=1)
+
+    def common_digests(self, section_name):
+        return self.digests.get(section_name, ())
+
+    def common_fragments(self, section_name):
+        return [fragment for digest, fragment in self.layout[section_name]['fragments']]
+
+    def owner(self, section_name):
+        return self.layout[section_name]['owner']
+
+    @classmethod
+    def compute(cls, records, min_templates=2, min_share=0.5):
+        """
+        records: dicts with section, template, digest and (at least once per digest) fragment.
+        A fragment is common when used by at least min_templates templates and by at least
+        min_share of the templates having its section. Fragments keep their first seen order.
+        """
+        templates = dict()
+        usage = OrderedDict()
+        fragments = dict()
+        for record in records:
+            section = record['section']
+            templates.setdefault(section, OrderedDict())[record['template']] = True
+            usage.setdefault((section, record['digest']), set()).add(record['template'])
+            if record.get('fragment') is not None:
+                fragments[record['digest']] = record['fragment']
+
+        layout = dict()
+        for (section, digest), users in usage.items():
+            threshold = max(min_templates, min_share * len(templates[section]))
+            if len(users) < threshold or digest not in fragments:
+                continue
+            data = layout.setdefault(section, dict(owner=next(iter(templates[section])), fragments=[]))
+            data['fragments'].append([digest, fragments[digest]])
+        return cls(layout)
+
+class BundleTracker(object):
+    """
+    Appends fragment usage records (once per process) to a JSON lines stats file, shared by the
+    processes of a site: each batch is a single write to the file opened for appending, under an
+    exclusive flock where there's fcntl, so lines of different processes never interleave.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.seen = set()
+        self.seen_fragments = set()
+        self.lock = threading.Lock()
+
+    def record(self, template_name, section_name, digests_and_fragments):
+        lines = []
+        with self.lock:
+            for digest, fragment in digests_and_fragments:
+                key = (template_name, section_name, digest)
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+                record = dict(section=section_name, template=template_name, digest=digest)
+                if digest not in self.seen_fragments:
+                    self.seen_fragments.add(digest)
+                    record['fragment'] = fragment
+                lines.append(json.dumps(record) + '\n')
+            if lines:
+                self.append(''.join(lines).encode('utf8'))
+
+    def append(self, data):
+        fd = os.open(self.filename, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+def read_stats(filename):
+    with open(filename) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+_layout = []
+_tracker = []
+def get_layout():
+    if not _layout:
+        from django.conf import settings
+        filename = getattr(settings, 'RELOCATION_BUNDLE_LAYOUT', None)
+        _layout.append(BundleLayout.load(filename) if filename else BundleLayout())
+    return _layout[0]
+
+def get_tracker():
+    if not _tracker:
+        from django.conf import settings
+        filename = getattr(settings, 'RELOCATION_BUNDLE_STATS', None)
+        _tracker.append(BundleTracker(filename) if filename else None)
+    return _tracker[0]
+
+def externified_sections(pipeline):
+    """ Names of the sections the externify processors of pipeline emit references for """
+    from .processors import EXTERNIFY_SECTION_RULES, externify
+    names = set()
+    for processor in pipeline:
+        # externify itself, or a functools.partial of it with its own rules
+        if getattr(processor, 'func', processor) is externify:
+            names.update((getattr(processor, 'keywords', None) or {}).get('rules', EXTERNIFY_SECTION_RULES))
+    return names
+
+def record_bundled_sections(template_name, main, sections, pipeline):
+    """ bundle's prepare: the sections to split are kept as sections.bundled_sections """
+    sections.bundled_sections = externified_sections(pipeline).intersection(BUNDLED_SECTIONS)
+
+def split_common(tracker, template_name, section_name, common, items):
+    """ Records the fragments of items, returns the ones which aren't common (items when nothing is) """
+    fragments = [fragment for fragment in map(to_unicode, items) if fragment.strip()]
+    digests = [fragment_digest(fragment) for fragment in fragments]
+    if tracker:
+        tracker.record(template_name, section_name, zip(digests, fragments))
+    if not common:
+        return items
+    return [fragment for digest, fragment in zip(digests, fragments) if digest not in common]
+
+def bundle(template_name, main, sections):
+    """
+    Sections with deferred steps (see relocation.processors.LAZY_PROCESSING, e.g compiled coffee)
+    are split once they're read, so bundling doesn't run their compilers while rendering.
+    """
+    layout = get_layout()
+    tracker = get_tracker()
+    for section_name in BUNDLED_SECTIONS:
+        if section_name not in sections:
+            continue
+        section = sections[section_name]
+        common = layout.common_digests(section_name)
+        # A section nothing references the common bundle of stays whole
+        if section_name not in getattr(sections, 'bundled_sections', ()):
+            common = ()
+        if not common and not tracker:
+            continue
+        step = functools.partial(split_common, tracker, template_name, section_name, common)
+        lazy = LazySection.find(section)
+        if lazy is not None and lazy.pending:
+            # Recording only doesn't change the section's fingerprint
+            identity = None
+            if common:
+                identity = 'bundle:' + hashlib.md5(' '.join(sorted(common)).encode('utf8')).hexdigest()
+            lazy.defer(identity, step)
+        elif common:
+            items = step(section)
+            section.clear()
+            section.extend(items)
+        else:
+            step(section)
+        if common:
+            sections[bundle_name(section_name, COMMON_BUNDLE)] = mudeque(deque(layout.common_fragments(section_name)))
+bundle.prepare = record_bundled_sections
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='relocation bundle layout')
+    subparsers = parser.add_subparsers(dest='command')
+    compute = subparsers.add_parser('compute', help='compute a bundle layout from fragment stats')
+    compute.add_argument('stats', nargs='+', help='JSON lines stats files (RELOCATION_BUNDLE_STATS)')
+    compute.add_argument('layout', help='output layout file (RELOCATION_BUNDLE_LAYOUT)')
+    compute.add_argument('--min-templates', type=int, default=2)
+    compute.add_argument('--min-share', type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    records = (record for filename in args.stats for record in read_stats(filename))
+    layout = BundleLayout.compute(records, args.min_templates, args.min_share)
+    layout.save(args.layout)
+    for section, data in layout.layout.items():
+        print('%s: %d common fragments' % (section, len(data['fragments'])))
+
+if __name__ == '__main__':
+    main()
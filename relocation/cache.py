@@ -1,13 +1,33 @@
 import logging
+import threading
 from random import randrange
 from time import time
+from collections import OrderedDict
 from contextlib import contextmanager
+try:
+    from queue import Queue, Full
+except ImportError:
+    from Queue import Queue, Full
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
 
-from django.core.cache import get_cache
+try:
+    from django.core.cache import get_cache
+except ImportError:
+    # django 1.9+, aliases only
+    from django.core.cache import caches
+    get_cache = caches.__getitem__
 from django.core.cache import cache
 
 from .dtypes import Timer
 
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
 class NotFound: pass
 class SkipCaching(Exception):
     pass
@@ -15,25 +35,186 @@ class SkipCaching(Exception):
 def compute_recache_period(options):
     return options.PERIOD + randrange(-1*options.FUZZ, options.FUZZ)
 
+class BackgroundRefresher(object):
+    """
+    Recomputes stale entries on a bounded pool of daemon threads, at most one pending
+    refresh per key. metrics holds the counters and the refresh lag (seconds between
+    serving a stale entry and storing its new value).
+    """
+    def __init__(self, workers=2, max_pending=100):
+        self.workers = workers
+        self.queue = Queue(max_pending)
+        self.pending = set()
+        self.lock = threading.Lock()
+        self.threads = []
+        self.metrics = dict(scheduled=0, deduplicated=0, dropped=0, completed=0, failed=0,
+                            last_lag=0.0, max_lag=0.0)
+
+    def schedule(self, key, job):
+        """ returns False when the queue is full and the job was dropped """
+        with self.lock:
+            if key in self.pending:
+                self.metrics['deduplicated'] += 1
+                return True
+            try:
+                self.queue.put_nowait((key, job, time()))
+            except Full:
+                self.metrics['dropped'] += 1
+                return False
+            self.pending.add(key)
+            self.metrics['scheduled'] += 1
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._work, name='relocation-cache-refresh')
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+        return True
+
+    def _work(self):
+        while True:
+            key, job, scheduled = self.queue.get()
+            try:
+                job()
+            except Exception:
+                logging.getLogger('audish.cache').exception('%s background refresh failed', key)
+                with self.lock:
+                    self.metrics['failed'] += 1
+            else:
+                lag = time() - scheduled
+                with self.lock:
+                    self.metrics['completed'] += 1
+                    self.metrics['last_lag'] = lag
+                    self.metrics['max_lag'] = max(self.metrics['max_lag'], lag)
+            finally:
+                with self.lock:
+                    self.pending.discard(key)
+
+refresher = BackgroundRefresher()
+
+def get_refresh_metrics():
+    with refresher.lock:
+        return dict(refresher.metrics, pending=len(refresher.pending))
+
+def _zlib():
+    import zlib
+    return zlib.compress, zlib.decompress
+
+def _zstd():
+    import zstandard
+    return (lambda data: zstandard.ZstdCompressor().compress(data),
+            lambda data: zstandard.ZstdDecompressor().decompress(data))
+
+def _lz4():
+    import lz4.frame
+    return lz4.frame.compress, lz4.frame.decompress
+
+# codec name -> (header byte, loader returning (compress, decompress))
+CODECS = OrderedDict((
+    ('zlib', (b'\x01', _zlib)),
+    ('zstd', (b'\x02', _zstd)),
+    ('lz4', (b'\x03', _lz4)),
+))
+CODEC_HEADERS = dict((header, loader) for header, loader in CODECS.values())
+
+compression_metrics = dict(compressed=0, raw_bytes=0, compressed_bytes=0, decoded=0, decode_time=0.0, errors=0)
+
+def get_compression_metrics():
+    metrics = dict(compression_metrics)
+    metrics['ratio'] = float(metrics['compressed_bytes']) / metrics['raw_bytes'] if metrics['raw_bytes'] else None
+    return metrics
+
+def estimate_size(value):
+    """ About the pickled size of value: the length of strings, summed over lists and tuples, None for anything else """
+    if isinstance(value, (bytes, string_types)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        sizes = [estimate_size(item) for item in value]
+        return None if None in sizes else sum(sizes)
+    return None
+
+class Compression(object):
+    """
+    Entries whose pickle is at least threshold bytes are stored as a header byte naming the
+    codec followed by the compressed pickle. Smaller entries (and old ones) stay plain tuples.
+    The size of strings (and lists of them) is estimated from their length, only the entries
+    compressed are pickled here, the cache backend pickles the others as usual.
+    """
+    def __init__(self, codec='zlib', threshold=32*1024):
+        self.header, loader = CODECS[codec]
+        self.compress = loader()[0]
+        self.threshold = threshold
+
+    def encode(self, entry):
+        size = estimate_size(entry[0])
+        if size is not None and size < self.threshold:
+            return entry
+        payload = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+        if len(payload) < self.threshold:
+            return entry
+        blob = self.header + self.compress(payload)
+        if len(blob) >= len(payload):
+            return entry
+        compression_metrics['compressed'] += 1
+        compression_metrics['raw_bytes'] += len(payload)
+        compression_metrics['compressed_bytes'] += len(blob)
+        return blob
+
+def decode_entry(value, default):
+    if not isinstance(value, bytes):
+        return value
+    timer = Timer()
+    try:
+        value = pickle.loads(CODEC_HEADERS[value[:1]]()[1](value[1:]))
+    except Exception:
+        # e.g written by a host having a codec this one lacks, treat it as a miss
+        logging.getLogger('audish.cache').warning('Could not decode a compressed cache entry', exc_info=True)
+        compression_metrics['errors'] += 1
+        return default
+    compression_metrics['decoded'] += 1
+    compression_metrics['decode_time'] += timer.elapsed
+    return value
+
+def store(backend, key, response, recache_strategy=None, compression=None, **set_kwargs):
+    recache_period = compute_recache_period(recache_strategy) if recache_strategy else float('inf')
+    entry = (response, time() + recache_period)
+    if compression is not None:
+        entry = compression.encode(entry)
+    backend.set(key, entry, **set_kwargs)
+    return recache_period
+
 @contextmanager
-def cached_data(key, backend=cache, commit_on_exception=False, recache_strategy=None):
+def cached_data(key, backend=cache, commit_on_exception=False, recache_strategy=None, refresh=None,
+                compression=None):
+    """
+    With refresh (a function returning the value) a stale entry is served as found while
+    the refresher recomputes it in the background, instead of recomputing in the request.
+    compression (a Compression) compresses large entries, compressed entries are always readable.
+    """
     class CacheContext:
         response = NotFound
         found = False
         recache = False
         set_kwargs = {}
 
-    if isinstance(backend, basestring):
+    if isinstance(backend, string_types):
         backend = get_cache(backend)
     timer = Timer()
     ctx = CacheContext()
-    from_cache, recache_time = backend.get(key, (NotFound, float('inf')))
+    missing = (NotFound, float('inf'))
+    from_cache, recache_time = decode_entry(backend.get(key, missing), missing)
     if from_cache is not NotFound:
         ctx.response = from_cache
         if recache_strategy and recache_time < time() and backend.add(key + ':recache', 1,
                                                                       timeout=recache_strategy.TIMEOUT):
-            logging.getLogger('audish.cache').debug('%s is recaching', key)
-            ctx.recache = True
+            if refresh is not None:
+                logging.getLogger('audish.cache').debug('%s is recaching in the background', key)
+                if not refresher.schedule(key, lambda: refresh_entry(backend, key, refresh, recache_strategy,
+                                                                     compression)):
+                    backend.delete(key + ':recache')
+                ctx.found = True
+            else:
+                logging.getLogger('audish.cache').debug('%s is recaching', key)
+                ctx.recache = True
         else:
             ctx.found = True
 
@@ -47,11 +228,16 @@ def cached_data(key, backend=cache, commit_on_exception=False, recache_strategy=
         raise
     finally:
         if not ctx.found and (not exception or commit_on_exception):
-            recache_period = compute_recache_period(recache_strategy) if recache_strategy else float('inf') 
+            recache_period = store(backend, key, ctx.response, recache_strategy, compression, **ctx.set_kwargs)
             logging.getLogger('audish.cache').debug(
                 '%s (%.1fs/%s/%d/%d)',
                 key, timer.elapsed, recache_period, exception, commit_on_exception
             )
-            backend.set(key, (ctx.response, time() + recache_period), **ctx.set_kwargs)
         if ctx.recache:
             backend.delete(key + ':recache')
+
+def refresh_entry(backend, key, refresh, recache_strategy, compression=None):
+    try:
+        store(backend, key, refresh(), recache_strategy, compression)
+    finally:
+        backend.delete(key + ':recache')
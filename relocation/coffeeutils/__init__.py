@@ -1,716 +1,26 @@
-from base64 import decodestring
-from zlib import decompress
+import io
+import os
 
 from .pejis import compile as pejis_compile
 
-def coffee(source):
+# from http://jashkenas.github.com/coffee-script/extras/coffee-script.js
+# md5: 9150da4bae81baca229436606f50278c
+COFFEE_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'coffee-script-1.2.0.js')
+
+def load_compiler_source(path=COFFEE_SCRIPT_PATH):
+    """ Loaded on demand from a plain file, so no process has to inflate a packed copy """
+    with io.open(path, 'r', encoding='utf8') as f:
+        return f.read()
+
+def coffee_context():
     if not hasattr(coffee, 'context'):
-        coffee.context = pejis_compile(decompress(decodestring(packed_coffee_v1_2_0)))
-    return coffee.context.call("CoffeeScript.compile", source)
+        coffee.context = pejis_compile(load_compiler_source())
+    return coffee.context
 
-# from http://jashkenas.github.com/coffee-script/extras/coffee-script.js
-# decoded/decompressed md5: 9150da4bae81baca229436606f50278c
-packed_coffee_v1_2_0 = """
-eJzsvfl/HLexL/r7/SuoSa7MMVtSY2k00PRYR7HlRDmy5CvJ8TmPYpzhcLhIFElzsayQvH/7w1rf
-6lko2Yn87Hfoj8WuQaMBdKFQqBV979NP/9fKpytfHO3sTKfPJyf7x2f+x5vj/YPpycqP4q68W4f7
-e2dnx929e5NY7TRWu3t0sutvpaeP353s7+6drchaiGrlr9OT6Zt3Kw9O915PD8enocqz6cF0fDrd
-Xjk/3PYtn+1NV75+9GLl8f5keng69TXu/a/VnfPDydn+0eHqydHR2fDix/FJb1wjuj+8KODKyfSH
-8/2T6ep4eHEyPTs/oZKN8eZVAQd37+1ND46nJ6eDzdHh9O0Kayn0Mh6d7e2frq/OFG9Vk/Xx3dOz
-8cnZKTofV76cetsajUa+zvnW6dnJ6qTaunswPdw92xteVeO708Pt+edCw9vr26NSc31RQ+N88872
-ndXJ5WU9rLZjixM/M+MJw8SYRlptV9P16Whjc33nyI9kVFfbo9LM+uSz7fXJ2tpwazTemGxWW7dv
-T+8en5/urW4NS//T1P754VlvyKl93/r6ZLQ9qtf3d1Zv0UvmR8W9ev3tnqeY1e2RWBvf3fdT/NPT
-ndUtP+qh77Z0MQldvJme7E55FwyXq1urF77O0JddVX6sd6c/nXkkLhlQfM+Vff/c0KMzvFd4udF2
-6W4cuts5GJ/5NkaTBTjzGKt2/FRknE09znaAs+lnO+vTjLOpx5nvyZPC4WR6tLPy4ORk/O7+9mjb
-Y+xwMj5bnXhMDrvtWaRuhyFsTw8WvYFH6Hhja7Pyt6dn05UA9xB1MD6dnYryYhtEH6tbgTruiM2r
-q+HdyfjgYDVQssceI/2T6duT/bPpyc+l/YSfarfaq/arV9Xr6qB6Ux1WR9Vx9UN1Up1WZ6OIh7vH
-J0dnR2fvjqdl5i8vObIDbmOTHr+T2FtB8dZnk/Utj2JPVAG9K+He7dvhr0dGWA+FwrYyZu6Iq+p8
-rtfTA89F/Ep9ll90IaMY+x9XY/ZURkuPLuLgzo481zodjav4y3Oyox+nj6fj7f3D3SfTtwf7h9PT
-1SG/+fX+9sOfjk+mp6e+mdkqk4Oj0+nT4+nhF3525ksfBYyh9nh7+9GbY/8++2fhzuHZOL1Huns2
-3v3m6PRsZ/+nL44Ot/fDrfHBomf/dDKeLGz0m/GJb3RvehruFnJjbx0IjyF2Mj58kbCxkOP4tcOe
-9Su28AHPK/wMDrfW/HIiqvRPBI6Qe71V9/va9otgcvZwZrUXjklkuL7X63KHutwd7XmWP7zwtLTj
-Sae+fXuLdb3ruUohpslMeeRpu55mP6uXVLkjYqX90e5GvVmdpZvTan/4+age7qyNxPr04HS64qu8
-6lXZrl6lKnd8lbGvd1VWcCDkPjEuoLLR7FKtFmA9sq5xXFrbZV2N/boa+3V1seXnYbzpRxSGv3Vr
-NBq8ePjs60dPHrx4+mww3DqZjl9f+Tu0zli7d08DxUxXa4+hRWNdSPR8xLxJENJqb3a304tN4xSs
-jv1AR/0x3r7t2XKh/dWtNTEsuJ1U04hbmlaxvl3GvFUJIu76amb4/QW5AMfrWwvZdWpvNXDtenMY
-xjkcXF5OAvDFg8ePv3/45Ev/u7zD029ffPnwyYtBYmdp9J6M0mN+QIs5O8P/xmxL9/3z3VaYTNbh
-1fr70DwJSJ7ktuJzz188eEYDo2W3ur0m/IyMCXFiKeIyz/pXULdZUPfoyZcP/yu9yjKkRETwij/v
-ndODv/Sl55jq4kUZ+FPgTjtemKh2R4fnBwfVq3SZjG7V1b5foItwU7bY/er1+v6ot/wSJYfxrak1
-cXnpps6LgaP9wF92/UVseu63vyHj2h785eGzh188/frrQCn+rVe3b8Xe72/76t2PR/vbK3VZKbc8
-u4ozUZbSQVpKfq35sdLK8QuvvxYvL6ecHi8v8+N75fHJ0Ddx69UMyQeuU/naq7t5SLtsSOFmF1b5
-wgGHu/8RHt3JN3fmHh0O87Aq38q2b+j1KLQQ7z4K43z01aOHgY+8DiVPvv36T/j1/MWzR0/+XH79
-RwF67CeWlFeeJ9EiyW0MrvwI/L+xn5DNanJ3d3o4PRmfTbf97C/YZ8Gp6iDsvpeiw973OnXXl8HO
-w+yfjo797se3ptPIGy92kkC6cVwWQp8j7WeOdDG47/91x9X+JlsJvmHax45Te7sj3+LR8Wq/1nGa
-Cj9Pb0asbTlk03s+2tnYKVKrCPMTJ/ScTWgaCdh5XDjlDfydzWF1OHozilN13zff+eHnzZ96PfS9
-hhp8OQwP74zk+tGIVfLbyKvRrSMi4YPqKLxgdRIl5OdnJ34XXg2DqU56M1n9MAoj8Zjfi/P8Q//u
-6zKth35af8jSF5jN/prsMRt5DbNhgtoSMcCre5PR1Ctlt8RC1jLJLGk3rvW4w05v3/Ya0cnRmxd7
-08PCDaJOtxsJ5Cs/hxF6+Pj5wwJ/8eDFF38pP+58XqARQV88fvD8+WA4Hb23qeffPWJtvXj239TY
-YLidH0/P3y137hPU+cW+YDctaxOvk4Ex5mYhR/JUSQxsN8x+7oeWya3twM92b6HMU/g+k0YKhScE
-3L69H348/K8XfpMKP70w2Ou2rM4dLxV6UTPwytUJ5/kbnttven52i7EPv0362buVlsbwQwQHzlo2
-IClUXu5I3OkD2M2OF7aXsJsfRjuZnH7A5F9e/pBnfTiJDG/0Om9gfrFXe2uCNrDj0UlgVIf+4jew
-I3+Rm9Wb0a3J7ds/9LB/5P/nM3iUt/MLf+/Y487zPMbx9jPHq6ZhOcQ1QUv7B765Vf7ZW8ceR34v
-38593g+TtROr+8FHUX9ndpl4fhRl1DeeBo4z8yrNFAbmWzmOrfg65zPDO0/CKohuN43Lz/YOjcaD
-nv889pK0p9hU7VWqxsVc4jJ7mOEk3lSD1UG1E+d4lvfsZUGnOs54jC8dfwy++vbJF98//K9Hz/0q
-+hDexDTT5bxpOgoGoygBXScUeulORPJeH8Qp4nLJG781hnf3N8Z5EWRuMiUek4SUvzx8MvhZi2OO
-jVRZvvYo3f6gBeL10fQm0TbihbeyLPbnVBjqbHctdZbGe7FXRrPb01dKG/Fd+dOZdRHHowbujo+P
-D955etjYrerNYpM6hxIbDTPFmLDjiYnNc+ku8fmwVzO+tbvmeVxf6ns1JxbGkq/8z8eP/9szqUXD
-8jvfzxyYZvLHYVK1ZzB5i7OL1X1GHvPVvgrjmo68EDVa0K2X0V8Hutv2F8+VQFOBJIkTBN7Qk+y2
-+7s/ptOvtSDWza7B3bz/V/usg4VEQIaCOX1ksQlo4TL04sF7lx/XyXpzOmHMeH5hBZtBXpG0Nfb2
-21tzcsZK1McG3zx9/uL7wVr48f5V5vlI7Gu79PVVTzzcnkXw9H3a3P4izkWug42N8jaVzIL8BhF+
-Kdqcm49521hB7lZvdx+T1LsFqZeQML5aHfqp8mNYjXt16HvDQ5sRuojaRYDKCGlgm7N7AG354c43
-D549+JpupV/lHteMK6Zg+/ce33305G8Pnz1/+Hz0enRxVQXHQkWW8h+iqEwejB8+O1n/YW1teDra
-2vghbOqnYTEd+0tYTEmAf71xvDk68gps+Xm0OToeRs0pMZ5q8F1YEFVawxXxE+Ia22HdbHClrho8
-//abeB3y1w44469TeX2h8svt0fNB0JxnmsgqYVW0wWrw1+f+z7OHf374X+H2w+8Ib4TgKPNUgRyr
-KMVWRbLN3VSDPz19+thfvn3yIN3O4wwD8SJ0FaTnKk5vmOwwuXfu+D9ra36Er/wI10LJICj4G6z+
-RX7Gv2C15+/EtRQH8dXTZxGBjx4/jL2+ePQYCP1TGMHjp0+/CcPDGg9C2EbBNjpJ71OwXyU2FUS0
-Df5wRbOGmrkpWjCDxw8ffOlR+v13qYmD2SbmSXm5E+Ng+tPH8GBU59WP1dvqp+pd9c/qQfWn6ovq
-y+ph9VX15+ov1aPqr9V/Vo+rr6sn1dPqm+r/VM+q59WL6tvqb9V3/1/4Pta/HRV/J/frDKu/jr4l
-74dfmd/S6q3+xp8oTtBh9X9Gf0vOvuqFh5KLs/omFkYPY/Xcw8ED5TnB44D60bsP86pEXrf/z+kS
-n93WKHJAv69uebYyrJ7ePZuennlMBRlvNHh5OFjz++N4NL57Mj0+8FLx6r2XJ/d2q8FgSCVfh1/Z
-jXK0PS2OmmCADjzJXy4v64pt8yP2a4t+HZ2f8Z+p6mngc/F3dN6WH9kl5H9OyOGQBrB3fvg6+G3j
-Fj4J7s4sYITW9nf2pydxU1sdZqnE4/eNv9Mv9A16NAQloF8e3qVfsjc9mW4fTfqFp9Fe0S87PH+z
-Ndv3yXR3+lO/6NXpbI+egsYHuXAdvqq+N2o1uyACkpJBqKjm05MTT/KDN/unp35MK4O17ahPbZG7
-bRS0sHnBvGyZYX3/dVhqr7Ias1t5H8HLFBFa+Ul92xsd3/XkPGGzB9WqXt9OZrSJv/itazzay+bV
-KA0dvT3k4niUmQLj5W7D1cHT7zzPnZAIMsnr/WprNI7mg+e9dwp0v/o6GnWHxe7xmuwer7PdwyuJ
-+6Qk7mcF7j8GwYjV28xubfnmvkss9DwpT5eX3xV9k5SpV6OJ7//bY88LvhifTldDO77B77LEewDx
-f1jlp3+sDuLT932PPbbevSpouJ9ocTo9/OroxMvD6c63Tx4/9JtleM7vVF1u7klyjIXStEWWG39J
-N8Igk3Dp99wnXzx8+lXBfG7/vn+J2Ovaq6rfrxh24d6zh48fvHj01M9FvP3j+OB8mqbsVrT8MJUw
-0q+fc39nbRJUkPLSG4Opf87vT+OT3fOwak8hjZwNEz4DJ4uD4fMw4WbESVAaTqan05Mfo54wLO/6
-qLTAFs4npeLK26OT7ZXBJ2uTtU8Gn/gxbXnq+a6Ydydk0tjZmGyG+WPkf/p2/2yy5/u9mPjZ9W/V
-JVrMqF6PpYGw0u0R3f/i6dde0HmYa9y+nWtcXlKNx0///OiLfP/s5Hyaa+x4FaTAgb1nMIT67HgW
-tk3PR7EoPR6dj7mix+nZ/mFoLtfzs/7iYTTervsmxucHZ/nOyqsrLycPGVdefRU0rXFZmGkRdn7S
-OhgzimO0z0EYi1zmaY08YzJ6eD3PCMqMF93J/Rq0o9G9emt1oxaba8N76ent4XB7dDw+CbzU73iB
-wcihH3Amk8xs8wsUqZTc5StbM6558PxFfrhMAxix/zs+eXC2Wg8zWXwy6JLTdfT4urfjgyoS8upW
-UhppR35QDV6+9Hu3197jtMYZ9mSbesha0Nb4IETPbOf3RXdVJHB0WX+2RSFEgz94oVcM7+ct2m9O
-x0cHXsXMjWzljVdUd8Rw2C0abFpcXrs8nj6OcRlbNMoZ0qqvaNNdG/2f1a0qiCPA/0Ia4vvxe4jo
-9XVo3kpEFMLCaKKqJNjePR0fej3/n9O/pL5WJ8FkevHD+dHZtNuuktzShWV3FfyDo5FH5+3b9Wej
-cQ+LS3E4ri7yW3S36qtrkPhm/BrPbFeekw2rn48xLgAtNltkfDHafTMOxLzHETYuq24SFtJWj6X3
-vaHVQiRupbfOo+mCizYhMor13Da1JoZ3Xx3t+1ZXBsOrPu/p6zNxBfRRMu6jZLwQJVkIW7SOgw1s
-wRoOe+M/gljgl+/phy7foNfS0uXr5voJg9S41NgbdKzrhnpvgBFFaepwfswXmU2EWSExdTKDzjjn
-fSK72p4RqUIPwRG8Ex3BZS/fzvLT/S+6L6udZFLnYwoU9+frMLk7mvh9PUb3TP0lioe7YSXm+LPV
-ukqux3ufDvqysH+f84MQ5ULhMqcrk/Hh4dHZytZ016t+nlfvrfzj038Mhsn0eO9einsZ3Fu93w3v
-DfokVywTg7Xp2nhezpxjT/OzN36Pguy3tHFaXHGXCibCJAbXn/c5c7SpbtE2cNRT0+69vBcUt5cv
-wwtM8xq+9/eXn94b/nL8LELEvcHaqlf5BgFZg+Fa+D2Z3/r5kz0D0LPp7sOfjnttnxan84xvxUta
-u0EJJCPy3H5UXUSER04aTWUh8OOV5/1FNPjs1fp+iMw6GL3e2A8GnoOA6T1/ERHFO9ES+/Q/Hz55
-PhjuxnFkM3pwOMQ4s4usyez1Ee91zyxGrfN79/wExGl4+dK/4255s2WcfS/sxoG3bw6vqHIwR60N
-UkkUlldX38SlUAyab2biMiiyYgFOS8+fDAafBCtkabxaPeTm0iF/98Nq10vRC5urskGMN5yl5s0+
-vQyjofA9QiGp3Ncwu8Iv/vQBO/qiDXJWY/GrvsfCvMDjCWOLoiXubEVTzKOy8mIbWQM/P/QS9v7p
-3nR7NTku73BTx4h7O4YX21lHOz+OKw2hqmnTP0y/i/I/uyuE1j/vtRc4bdZ+c4es+8Ozaklvcy2P
-+8+tcftMbwqLxXA87BltEi2UwmSUCCVwlfVNPj1r0FWM3VxmICqmGtbdnZ0glnP70s71OyhvaIld
-LJmUxp/Xw+1R780KDfTed2M7WADSers/HtXd/E3+vvdXx3dG8zglA9hw9vnP+k/zX3dGM3Wr8VyR
-18An/beIXONObwj+sclCQ9zxeP9kbuaKcaXYlr2evj4pQh8NzW+HzDbHdP71wXBO41+HlWMu6isY
-Uq4V87jrqj/ZM7a8a0Tc8ejpPAPxfReFaUaQCu8RJUxiMZMZySdwSC8ije8PkqzjVeAcTjDYjIEN
-RQq9H7b3TFrdTBw2ZwJ88P8exP5CpM7yED6w2SH5fW5mo+ABa/Ntc5PnotkqAlKwIfo5+2p+zu77
-XTsKTNvJmr3D4pS+GZ+M30x9D57vDbudhTPr+f+OF7bmxdidFBt1+7bnFLe2vIRAdqQQmDQKJUW+
-PUsxTMP3WJM4stYGLwdB0PokyFkrYy957QZbTezZixeh9YhQL1pdXu4F6PbtgZfTUwTy06+/efrt
-ky+/f/D8+aM/PxlUofpaGG3BdIn2u7oqb1KIpbfzcTKgMPr8Uv/Mkrqv9fWDF3+Zu7+P+2S7mqny
-ql+FD3m26hNUzZaymQr/iQrP//LoqxdzFX5KFS4vdyjCZqu4fGdihUIj2ZpWGtkKfCdXGxacrQ5i
-TOsWU2Um1eukv2zxUJ6tuVCegFwmwFI/sd2NZOnl7f6QbbxBqO/5hos1KVTO1qP7g26LhWU/f/rg
-PwdXV7neTq60ms17F/m6MehmNuiTjZ1NbjPy8lmqepWvm/mRuCnsDLkU79flcI7W+lyjr/Mv3nqz
-9hr0mCy1BCMMsw2sJynnAJ4qvsK2Do4mr1dy1aK2BEF87BWXwaf3BtVK9K552fqTuLKYVSbwvM9G
-lHQyTpJIYrQ7ozeJ0YyDwW60k9WDoB8Gerq8rD/zHKBofX5Qu59Ny4/paHI1jQ41uNGSluP7DC62
-aTXY9fSRDRbbl5e9ql5HO7wXNYpeJl0/BoXY2jVWr/4+MBxwt4+Xj2NEARd7x2RCrbY37twZp1wH
-xCyw5KJwd1gM3SBLTz5bibImPbIqlMiWQxe9UhljW3mTKOpVyR3wSsPFhI0irwe+l3D4aukmM+tD
-W5Yos0zmnHF+9W2p1xF2tbfuVdatkhUqvKpJGY7is9He/clne93k8/Jjba2b3LlDPoSQQpq3qUkx
-HPv9tQtJnaRthtKVrS7rhimbaiZDdEw2ksma8DPjlcddBINTU1cxRenKbzfbt7IdMwCDTwb3Q3qs
-v+MLooUkGUiyGYm5Xy8v/zxXNvSvNZpC4glhfr3WLgb3s6q7FUqH8XbsPbLKP6CeX2a9ivRrO2hs
-23z+5z2hGUFrjCUM5uKTZiwKmFokD78vpsHLhcXJPolOds8PiqG6ejOaJItedRQW4EHMeaU4+lew
-P4e0tmFU8V5lqWp4EVPdaLLCrVsRP5eX7LEUcXcRrZPbC03/xWof6oawJm66OPhsJwT+ZuX+ycOn
-RasvDx14th/tMNvchhkDzwvRXbweRT/yeEjhCKu71UWQHDvSx6vsYu5uCY+i12TYOImhgMWwcTKT
-n9DPDbl7ure/c7aakwOLkWe4/7kIm7bXzdP9FNK1OoAxYDP2mN4xmSX4vWFFCMiWoOr15vDKY5/4
-48HII+9q53M/yQefFTb2HsR5tIWBvimL8igu1aOZpbrI/B9MNcP1EIGdA/HQfOgT7xnMksGSszcq
-zX4uhn2pP6EiGcd2RiGjolRd3/nsh/WdGEd25OWC6rAXR7bTbyZZjUJGCOxlXlNdakE6q44/zLVx
-HA1gU7/57fV7nDEfHfVXbhBQFllY45bvUbZKylqQfjzFX5Ay6+9O+hbR88NoLfVyewyH4baHEekJ
-WbceLjBWbFVM24P8NB72GRQFb8xs7wvsFAsiqROlhe2eke51wZELYk/7Zq9xDIfYuh933K0u7uv9
-BqPm8suaFKlJMdskDGhzkkzB4Nsk+jGVL0pMEG+K3nl5OS5BHGMK4hinMIgHMdsl/oi6TIbXCnCn
-AEm1yD8ojCH/LmpO/pk0CHaP6ze5+MVfnj39rvwo2Sl9HDD36JIUTObq3bofhchuMLt5YRHNpXAH
-RoOAtrWt9X6E18vVjZenL59vDu/tVgtPhphk40eKS/bT2Y2v+mFiRb4drG0V4fblH28zP1FSfbkj
-OHSwNuNWjwtw5kiAk6O3K8/fecHtp4dpefpFuTZYOTpcCTTvl+gqjLx+y+xH9J6PNlKkRJWjJKoU
-IVENwkPh1/St/5sOgQilfhRHOx7YP4x/ypET/keOjQhP+iH5awqhqBA+EdrZOt/dnZ6EZ8Mz09Rl
-EufCGI7CrbjZh9pHobWTd6GNca6wf+h1wVhyMD4NA0xncATo9Pw4xGDGGFrEdoTxTMOwzg8PpvGJ
-cz+c8IYHR0fH/hIHv/Uu9usrBqfHxfhwO+QFDqqjkxDeNKj2T7sQk+Kvh2ddCEqpvCLlgUH1bupv
-JRQeHnUFi0eHpfBoZ6eUhjjluUU8LlHLz0KY5c5wnDjXs2FvnnZHuyW0ZzqsHvk3jMJuwGgMEgio
-yS170Lcc/nq5ILzV/tlemoXTUM1PZMDa4fmbiLzjo5Pwe/9NBg69/P9jaPj77/fGp9+cRBR9/z2w
-/P33cb+O0JZn8hHIOqNH3tnovAz0kV8Cd589fP7w2d8efjl6ROkVwwLthnyre39f3fjjgzv/z/jO
-P79/+VO7c+fl+Y7/b3Pjjy/f8t+fDlc3vObnl+Gn3er9W52Xm+9VD/3j9U8bL7fHd3Y21y7/Xm/F
-mJbLv7/c/vTl3fsvt9dW73fTjbU7mwH2T4QMC9/jYDC4/OSTT4Z5YX96f+jrvTwsHQzvvxT3qq9C
-zfvdxp3R5ueXG3fWPn15739/9vnty7/fuj/aHF1+/vnno/uXq/5Gtzl8KTx0+/Kzzz0offHL+y/v
-Xr68eyErdTW8Vz31TeXG1+55Hefe3//whz/49/nDJh+ALysjuEw/h/f/OLwMg3h5+ukf/FuHCn/Y
-HN79dOib2Q6NhsHdq/6UhsrewN9/7As/8QUvP9n8NNx8eTf/GH76yb3q1N/9Ryj4B7/7j3D3H/eq
-P4cGX97zXfoBjjaHG3/feHnPN/0yVo7108gvX2745zbpVilH4fDT3uNDj0aP9/03u+82L+pKX/k3
-v/XyrUfSoe/z5b0LdZVnZe3+MP9cUPlodO/laZjdP3hk3PeM+YEvOPTXN+G6RrQSePaBL/K93qve
-hh5OwzArP0N+isL73X25vTm87Drf6Nex0T/ei0Hud0LW1Vr4cy/8+TT8+d8pVzzlZ8asrPDns8/C
-X08O8W+8xJt/j7VHflU88e15XjH4v4MSsv/iv78JYYPV4MuHjx++CIHpXz71FX8abUS+E5nOIAKh
-IX/nP/2dzz6LPaRufFlIOIjJYbfiMEJ5uMZxhG7/6e9/Gl3Qfuj+919CdkGIuY89s+jF4Ez30vyz
-b2Nqw4MUKf/k28cpSeDLh189evIwJGV84WtRRkJxcOdkgrWYFRDyBEJOyJejL8oyj6Lp1YCSD/op
-EknODQGOs8kTJeGh9DMcpNSJ0NT9EEEXwuj+A+2mLIZNL7JPqGsabBzksPpxtCBFpZ93sDzIP0bH
-XRvlz5OZSvnFWTiYoWPlV9W7d53/e/ruzdbRwen33UXc1ztZPTvyu4qq/nS0/a7T1Z+C8a5rKoyu
-M1UQDrq2wuEmna2en3mNPAYKuepZ3DU6UVdf5OAhISoKWOyErP4WpNROqOrR4Y9Hk2jv6YT21bd9
-aVM9PQ5ZUrHQVA+i2b0TbfVopxO2enHyrhOu+i7s0J2sq6/CsH37cQPvpKy+CNtyJ1X1IkgBndRV
-QncnfcsJ35001SMKj+6kb5vmvZO2enBwvDd+cv5merI/6aSr0hx2qq4SSXRKeCxEr0inZPXX551S
-VSSSTunqy4d/+vbPfw71mypMeqfKW4y3/JhVWw1Gg07ZXPh061WnXOUvrJKuQ3xmp4V/i/24CU5P
-zvyM+Al6+OLbZ086rSoWw9VpXTEDXKebKhogH++fnnXaVGQi7HRbfeXp4M8H7473Om1jYkunXcxt
-6Zra4/4szNq4a0QIG+gamVrqGpWAv41PukZXg7t37/q7TRXDwbrGhBeYTs66pq2ee4nTA54q/KZ+
-MGWv1bjqwWTiqcZPmqmrksN/tu/pvTOiejY+3J12Rsa37ozy3Qw643u7H65NXHGd8ZMXdvvOtBWz
-wnfGpvJEXcZVlOHUtXUFO3zXenIJEkTXypAz1LUqT0VEV6vDAu/apoppTF1rqqwUdG0b8BPw9/Cn
-WNXPYYl87lpXxfXfWU+U5GXorKhgVO2srEoaVmdVeDr2aXUVWEhnm8BPOmtCHlNn28BuOmsTXr48
-8r1YF1A/6FwdHu6cKEg+2T3tnEfcs//unKq+CNJq53SVs486518nJCR1zlRR4elcG+wMnbOBr3Uu
-L6nnR+cnHjOirquYLeUhUYVAdg/IKiZOeUhVj73o6gFdhbwpDzRhIUauIWpTfeUZhajbUPY8WPL8
-Dxt/lNZd+OVJaT+QxalnEJ7yvvN9eE4Rb0T+4DmFb+hRKFYBevqVhzxT+m9/aaqUUeZB40fuVVkP
-eabkNw4P2FjkAVfxYHzPezwh7CSuJjzXeORb9Cwj54l5WFVREfWQDglm/toEM4q/mri1eKCNG40H
-bNgE/NVVQV/17Myzh6CaesjPedJDPSyrqIR6KPCIpK36H7qaUUd9WVP9ceyXx/FZV1d/9NJuJ64q
-z2XeBJUjMGnZDSKfHlSm63mHhb+DkPBKNh0SNX1VpGjarrfFqbqjDUqJjnY8pboYDal0VzY/5dss
-nM3/8q2mXVf5Jv12r/3TfjfUKjwQOJSH/cO9OFPtm+glCuq2Y96LSrsu5tk1flQh1a6RYX+tGv9Y
-4DaV8Q2Gi/99P1z9GMIObGzXz9Rs645nN7ai4164qvVjvPAX34zfyFvfSs5XbP1wiv5fWd9Izkq0
-vgHmN6ysHxcPfLOqY8mV1reb5AHrm/bSgfXNbviLH6YXHlwd3sZf/UMxldD5+pQj6MJoUuKga7ts
-mqicf3TVXzx+vAjiV2RXUhn9ouxyGqNflV3JbPTrscsZjX4Zdin90S+uLmXf+PUUyx5FWEc4CGR+
-WXUxG9Ivqo5SNv1y6nLuol8/XT+9xRf5EYQcS794OmRc+gXUlexOEejxTrj6VtfC1Q/pTizwLa/F
-Ev9qXqISgSCj9ceDgR6jqcfDAePZsuN/qS4bdjwcKbSksohApbNmnqvq+ORo+zzKPn4VbdTVhqrq
-zfBXxL/S/9UR1pWKf0NJG0vSXzf31/6b/jaxryb2K1Nn0vGL5x/vu3i+p9JFp0sT7uXHXbznL6zQ
-SxfzF8+CZbrEXyJdmvicSMPUacz54iWEOl1ioYm//CX/Ct02CcVNwrG/xMKE68UXm2qmcfqL7F3i
-G7ULLkK992LS+81dBLskRPpLvJf6y5cmYddLB3W6iHRR6ZLvmTBxqT+ZXlqml/YXfU1hRHJqDBeR
-LpEYbeo2Yb5NCPGX8LjJ75cuXkSMyDLlEqrYTLT5jWTsz0s/Kl0kLjZ1a9MgbHoxXML7uTTh5SLL
-JY46jUy48kunS+jPpTZleiMv7al0ie9eF+qr0yMzv2X6OXdJhKtz3XT1+/r8JUgl/aulaxyqyGtp
-7lrTNdar8xuyq15yNewqE879pU0XnS6xjshELBLhiYK+gj+ZcBWuEVmJCkQeef+SX+8XXNQvvDTl
-12bltZSdo5M3DyKv7fpG7uJwT1rp3giHnZXwmWlyoK+IjntT/hiV3e27UWpLvnQ5U2FnY28z3VHz
-d6L/PNzTXS7Mbd19ezI+Xt0ID/dibFaajj0tN5M5NFTr1TJdvw92q+34wNgNu+yGW3ZD1EvviK6H
-n6yQzg/UC4fLmlBL7+ild5qld8zSO0sRIpZiRCxFiVyKEimW3lmKA7kUB1J3CwiQV2iWk4A0Hzg7
-sv3QivZDKy7FnKo/sAn1obSl5IdWBJrn/Q8Lnq3C3+DUgh8lBGzd3T/9thT0InavVvvdzcxd0u9X
-04Ku5kfXLK2uFlU3S6vrWD0c4Nh7YGaSo4K7AEl2Ybszz/g3SOipBkfR5jLoN+I+qBGdGvEjXdyM
-XrrK9NJVppeuMr10lemZmUrWw3nc6GZRvV6NmVnJ1scFTbWzFbenfK4XzaC2C57ZuKY+zUJ0iw16
-+wuhdrB15Ol7vsJSDDdLMdwQhjf65YTftNP17s3udNloPYexZga10RK4oFq7pFqgsnjUVliy/AG7
-7IFFq7RZytjMUmI1S1FplqLSqP6ooj1zdcEkG/1By9rM7BPhqMAFtcySxgLyNvpz039w6e5qlu6u
-xn3QyNv6w6otRXIrP6wB9WHVPgzf7VIRpZ1l3NEYvaCFdmm9anB6NH7d55Ut4XmjV7+/rw0oiiIE
-Fc8PoD/SWS7+3hZ7cubS9WBFnxZ792iytvOHRdIbX4Q3ThmbvPbMnEXb+zwq7cycPU+RjXPVZtj7
-061XjA94zozD8/rP0Yz22Z6lGZxne5Yvi+vYnuUMJ4xhWUXH8X2n4RXDbt2rOiNaRXdVr4JcUGE1
-cs/4Z75ztfSB+br6urqB08w/0ix6ZL7a7O5bqhHvn39kdh+mRxZxfze7A1Nttbl88DPL6It4vjB6
-WLR1i7r+JQ/Nzmt4KEcEVRt8I5lZwzg7ZzicbXOWFHib83peTYRwS/Rv0Kzfqvs3msWrR9Smv0T6
-NxdKszOvFaO3hjMDtL/0wYXb1cIHq40FnDUHk/UbFTPT/ODkxEt0M3XEfJ0Fi1pAxx7sH04Ozk9D
-CFO/Bk3OYPrT4hqzknBw+s0T+Hzfs5IxPXcdvQqz7Kml61WIdtEzVHlxP3Y5IxY9Jf86Tix6Sv91
-rFj0jACzpNuzA1zPqMVyy4CQy80jcrl9RLK9qt/xAlzP2gVenLxb9LJ2Ya3CC0N4eLzOzop0i5+T
-ee6XEMCsAaE8pgpl5g4DtIgdCxgWNtgwZ4xSM1wvxnEseHc1s+/FaIKy5cxU1Uurzs76rCngu5Rt
-Nt+7WVIv4PBi93x8st2Fp65mHmuXNV9d7B/+OD05mxO0xKxZoN8VPVUt77S3zJICEnz1C16rr/ZT
-xTmTqW9lRg0RfbvAz3t0uYkSloNV/vazvD9Eug6Hw+veTP+ihhYZi2canqGYr45O+BqcqWx+TuV2
-YeXFjBYWCi+vxzCLOSXpqv8AqIIdXBqm7ujtYaEUD8aB3T0cv5nmwsJVUqJmKRT0db5IgX17nGiW
-27GZtWPBOPB1mIXNLiec5sN0StF8mFIpYCxZsJHBQLLBOPpMnXZ2guIb9evMTWKc72SgC5yhX9st
-qB06Z5yg9wDsJEsfWNYXDCkzj56eTY8XdSUX1desq+seVkseLvWvfclZjTMnXXNBqj+1pln6RFP0
-z8UPmoUPMn1qpn57ff1l3Sz3kphZ1r5ULoItZ6O39854akS/liwjmq03s0k/2uFsrLoIRok8UTOb
-UcvFKj+ngdM+PDgtnPjahmZaWi6FtbOWzdLJAryYRW8SzqqY3bfiZ0MwIBHIsYS9zm3asyakf1ez
-M7LA0+Pl28esDcnXDWE48xVtPV9xbWFFsaDFxU3KBU0ublMtbXOZ2VjMGpVY68ufmVnkMYRzejiZ
-LpQYrVmGksXium2X4XpJ/evmcckj89P5vkfc/MS+95H5KX7vI9iE55L2C1fih/TcGtxfnWm8pCoP
-e70M7ybhdnXYXTeYWaFg1iA27/xbyGVnbWOLvHqZS888OEdZMVWpp9tdXVVnMQR640J0GzG2RHWi
-0p2smk5Vbacr25nKdW0l6hDXLkQIaxey2xCV9K0I1dlK6M5VXt8PQSkmhNV7jTwEqtgQTO+V6RAt
-VIcQeq8Eh8AOGeLmvR4rbOVV1hCc04T2/Kbm1csQAmXDzzactOtCFLjX7/xv4zZDNGi44yU9r45J
-HSJCw4Pht45QeIHUmB+cV4YC5Lcvr9+EqCYZorl1fEb73nR8RpvNEAMaXsj34OVVVYeYz/Ck3QxR
-nwHyd7wwpdvKi0va+t8hfN4LH7KpvEghPaxCwH4b2zb+uTb2rX3fNrYgfZlNI/P92TSydjOEYQbI
-j8bFZ5Wv52KZ9tPrIiYaDwXzX4iTqyMGjNqMkZUBjDd1iM0PhrNQ0oQSE8L0g1EslJhQYkNoerCw
-hMbD3PnpCIFqMs6miSURI0psxujIAMbS+IgKfcrYngp9pllSzeZVFYhH5WsM2IoPtDIUJRB3dbwb
-r7IAziXA19EhxP1Xo7s0OH1DeL9jwouxayZfZQESSbVp/LZZOn4T0hoWjFbGOlbTgFpLA2pDszLO
-VBseSWTSus0YHhweqzdjdHAAwyslarGRbuOLWqwHmwdvy+BtGbzNg7fXDd5dM/iWOhEy9xKA8D4Z
-ojKv02fI664FonpeQXOhz9Cq84MwESMuLOWIEOcn3isRzoSo9/DbI8gL9vnpNg7eBdqkFr3A6OoQ
-wh7u+N829VoHslWlkpdGMuSosYSaAEWkFFACVADppYI1uoASFSQrNQDRhaoBojeF3hQaCzMbQUK6
-KkhXhHRFSFeEdEVIV4R0FZEe4kx/EdbVAqyrhHV3LdYVYV0R1hVhXQHrClhXwLoC1hWwroB1Bawr
-YF0B6wpYV8C6AtYVsK6AdawnUTaYAOSuaK8JUMa6JqxrwromBGpCmybcaMKNJtzQ5iU0cKOBGw3c
-aOBGAzcauNHAjQZuNHCjgRsN3GjgRgM3GrjRwE1TcNMQbhrCTUO4aQg3DeGmIdw0hJuGcNMQbhrC
-TUO4aYCbBrhpgJsGuGmAmwa4aYCbBrhpgJsGuGmAmwa4aYCbBrjBJiJMwY0h3BjCjSHcGMKNIdwY
-wo0h3BjCjSHcGMKNIdwY4MYANwa4McCNAW4McGOAGwPcGODGADcGuDHAjQFuDHBjgJuywwYgd0Wb
-bYAyblrCTUu4AVNqCTct4aYl3LSEG9q9RQvctMBNC9y0wE0L3LTATQvctMBNC9y0wE0L3LTATQvc
-tMAN21rLBh6A3BXt5QHKuLGEG0u4sYQbsGlLuLGEG0u4IeFAWODGAjcWuLHAjQVuLHBjgRsL3Fjg
-xgI3FrixwI0FbixwY4EbV3DjCDeOcOMIN45w4wg3jnDjCDeOcOMIN45w4wg3DrhxwI0Dbhxw44Ab
-B9w44MYBNw64ccCNA24ccOOAGwfcOGhJdcZNAFJXEaKyhJsAJdxEiOol3ESIyhJuImQL5Khewk2A
-Mm4SKAEqgNR3xk0EJSpIVmoAogtVA0RvCr0pNJZw40HCjSi4EYQbQbgRhBtBuBGEG0G4EYQbQbgR
-hBtBuBGEGwHcCOBGADcCuBHAjQBuBHAjgBsB3AjgRgA3ArgRwI0AbgRwU0R5SaK8JFFekigvSZSX
-JMoHKONGEm4k4YYkbkkStySJW0LilpC4JSRuCYlbQuKWkLglJG4JiVtC4paQuCUkbgmJW0LilpC4
-JSRuWSRuSRK3JIlbksQtSeKWJHEHKONGEW5ILpYkF0uSiyXJxRJysYRcLCEXS8jFEnKxhFwsIRdL
-yMUScrGEXCwhF0vIxRJysYRcLCEXF1ZM/JfYJbglOCQYJJgieJcovEsQxxLEYQQ4jABbEWArArxE
-YM2LsuYFrXRBK1NgZQosR4HlKLAGBdZKW9psiY+01HqAVFScfMuFNFpiKS2xlNiKJghl1IyxBUok
-FCEaQUtPWCqz1EcisJYYU0uMqaXXb/H6LRhTC0y0wEQLxtQCKS0YUwvG1IIxtWBMLRhTC8bUgjG1
-YEwtQ3ZhTC0xppYYU0uMqSXG1BJjio9qglBGz2YMEwNrJWGYWFmALJVZ6iNjmNhbS+ytJfbWgr21
-YG8t2FsL9taCvbVgby3YWwv21oK9tWBvLdhbC/bWgr21YG8t2Ftb2FtL7K0l9tYSe2uJvbXE3uKj
-miCU0bMZw8QGW0UYJoYYIEtllvrIGCYm2RKTbIlJtmCSLZhkCybZgkm2YJItmGQLJtmCSbZgki2Y
-ZAsm2YJJtmCSLZgkM063xXjQkvGgJeNBS8aDlowHLRkP4qOaIJTRsxnDZGSIEHXb0hOWyiz1kTFM
-JoiWTBAtmSBamCBamCBamCBamCBamCBamCBamCBamCBamCBamCBamCBamCBamCBamCBamCDaYoJo
-yQTRkgmiJRNESyaIlkwQ8VFNEMro2YxhMlVEiLpt6QlLZZb6yBgmQ0ZLhoyWDBktDBktDBktDBkt
-DBktDBktDBktDBktDBktDBktDBktDBktDBktDBktDBktM2TUtJPWtO0lEKVZ8appu0sg6iZEJ5CV
-ooWE6whmPa2mXS+BeKx18Zwei5tWpo0XlseadsAIOrRZxAomA9TYBTOsGIx3K5pdzcSDGlthhg2D
-WV+qZjDrV7F+FWtTEcr8VMg2HjUEj5KW8bghbeL5RAn/DXHqCKl4YlGj42FFjYkHEjVtPIYI/p3k
-wRFB4EkuHJFMzk08j6h4Un2BjccSuXgq0Ud1ot24zn6XrjMbD6m6oY8b+lhOH+0NfdzQxzLXu4on
-2fn5D+fXfcRZDAfMpGmcmY5wot518/HBs1Aw/tt4q3D+zr/7rYKMYYqnwpCnwpCnIkDKFiiJJ4Z8
-FoZ8FrERTRDKqBVDrSS5MEI0gJaeaJP0Ik2Rx+PLUXdJLDTkBDHkBDHkBDFwghg4QQycIAZOEAMn
-iIETxMAJYuAESWAenyK690uFREQD54iBc8TAOWLgHDFwjiSwSa0xmZ0UTwHNU0D1FNA9BZRPAe1T
-QK0U0CYFVEcB3VFAeRTQHgVTHwXTHwVTIAXTIAVTITOckcTdb8ynzTRKwVRKwXRKwZRKwbRKwdRK
-wfRKkRTLJh57yUTfJp5/yQqyp5yiYDTCYDTiYDQCYTQiYTRCYTTZnxKI0hIigKgVjbAVjbgVzQJX
-NItc0Sx0RbPYFc2CVzSLXtEsfEWz+BXNAlg0i2DRLIRFsxgWzYJYNIti0UWn8BtjX6dQ4teQCdIK
-CTvRjXjwOxUPAh25YFSIZ8ya8nNmg820VXwS4qNOOPbctMwdmT8cWT8iNLMjq2bRxNalOptiaiLv
-bgEtbLZVuX39vCcW4sgMEiGa9+y1gTnEwRriYAxxsIU4mEIcLCEOhhAHO4iDGcTBCuJgBHGwgTiY
-QBwsIE4UVnGjXt7wh2v5gy7W4ACEKf9VFE7q8YZ2ltFOjshv+lRUShTA66io1PkQKkKT/xpBlSg+
-TVF8mqL4NMXuaYrT0xSJpxGJpxF+pxF+pxFzpxEbZ4pj3VCMkyEfeyQiW6CsVVG0k6Fop9iIJghl
-1IqhVrJW5UirovioAFkqs9RHVqUoZspQzJShIACDKACDmCmDiACDkACDmCmD8ACDmCmDmCmDmCmD
-mCmDmCmDmCmDmCmDmCmDuIO2xB20FDPVUgRCXKa2QNmNRNFTLUVPxUY0QSijVgy1kt1INbmRKN4q
-QJbKLPWR3UgUg9VSDFZLERItIiRaxGC1CJZoESzRIgarRdxEixisFjFYLWKwWsRgtYjBahGD1SIG
-q0UMVstisApdS6JrSXQtiZolUbMkapZEzZKoWRI1S6JmSdQsiZolUbMkapZEzZKoWRI1S6JmSdQs
-Qc0S1CxBzRLULEHNEtQsQc0S1CxBzRLULEHNEtQsQc0S1CxBzapQsyJqVkTNimhYEQ0romFFNKyI
-hhXRsCIaVkTDimhYEQ0romFFNKyIhhXRsCIaVkTDCjSsQMMKNKxAwwo0rEDDCjSsQMMKNKxAwwo0
-rEDDCjSsQMMKNKyKJ1SRI1SRH1SRG1SRGqBIDVDkA1XkAlXkAVXkAFXk/1Tk/lTk/VQU9KMo6EdR
-0I8il6ciUV+Rw1NBwFcQ8BUEfAUBX0HAVxDwaQ8toAGILlQNEL0p9KbQmCoYIQwXk4oii4oig4oi
-e4oic4oia4qioB9FQT+Kgn4UBf0oMrooCvpRZH1RFPSjKOhHkUFGkT1GkTlGkTVGwRijYItRMMUo
-WGIUDDEKAouCGYaklAKiC1UDRG8KvSk0pgpGCMMl6EdR0I+ioB9FQT+KXMmKgn4UBf0oCvpRFPSj
-KOhHUdCPoqAfRUE/ioJ+FAX9KPLbKwr6URT0oyjoRyHoRyHoRyHoRyHoRyHoRyHoRyHoRyHoRyHo
-RyHoRyHoRyHoRyHoRyHoR6mUbSqU/ZXTnIVyN5rH71Vr9XPt+//VDKD695SaHHDT/FKK8W+t5QeY
-xQJSwhbp8abV75qUckQRpVbVyK2qkVxVI7uqRnpVjfyq2IAGyErRQgnWQjJWBDGEFo9ZlFr0VqK0
-kLBVI2OrRspWzXK2apa0VbOsrZqlbdUsb6tmnqOaZW7VLHWrZrlbNUveqln2Vs3St2qWv1WzBK6a
-ZXDVlMJVI4erRhJXBP0C1obHc7V0r0wKErtqi0mxmBSLSbGYFGSB1RaTgoywAFqUWvRWJgWZYjVS
-xWrkitUsWaxm2WI1SxerWb5YzRLGapYxVrOUsZrljNUsaaxmWWM1SxurWd5YzRLHapY5VsfUsWy2
-cYAbiPSmOEoN+UkNuUkDlM0t5C815C415C01FKtrKFbXUKyuoVhdQ05VQ7G6hryrEaI+LN211Fs2
-vJDn1ZDj1ZCNzcDtauB1NXC6GvhcDVyuBlG7Bk5WAx9rAvGYtADRsaoBYgwKY1DoQmmApTealsLG
-DHExQ0wsQHlaiJsZYmaGeJkhVmaIkxliZIb4mCE2ZoiLGWJiEaI+LN211FueFmJlhjiZIUZmwMcM
-2JgBFzNgYgY8zICFGXAwAwaWQDwmLUB0rGqAGIPCGBS6UBpg6S1LKjfhWzeS7HWSrL2hjxv6uIY+
-3A193NDHEvrwU97UwWfb/HoBQTcu298tuQT9qeH6U8hvaSK2RGMDikQjeZQrvXX4IoIIn2wV8cVE
-fFcR6jdB+qw99YRvsIr4qDDR16ATLPIBdNKjMxR72mqydBoKwpiM6ROTCF9bXURN4ZYnED8Wo2My
-j7GMPJIoGxptPb0amWVRSzMpWFqyLMKyJGFZkrAcIE3VspONhGVJwrIkYVmSsCxJWJYkLEsSliUJ
-y5KEZUkisiQRWZKILElEliQiSxKRJURkCRFZQkSWEJElRGQWHyohIkuIyBLCsIQwLCEMSwjDEsKw
-hDAsodzLottLUu0lafYB0lQt45oUekn6vCR1XpI2L0mZl6TLS1LlJWnykhR5SXq8JDUeUWGSlHhJ
-OrwkFV5Cg5dQ4CX0dwn1XUJ7l1DeJXR3CdVdQnOXUNwl9HYJtV1Ca5dQ2iWOe5El+EJS8IWk4IsA
-JSUwQJoeyFinNSTpWKXYnCYIZdSeofYy1g1hnQI8IkR9WLprqbeMfzqmSdIxTZKCQySCQySOaZKI
-E5GIE4mgQKnQAGlIZVZweJPE4U0JRGPSAsRwVA0QI1MYmUIXCmNQpTfS3Yvq7hHleZf71Y7ejF3e
-bOjXx2CZ3/rOnvxtYALFQCfJQCfJQCfJLCfJLCfJLCfJ3CbJyCbJjCbJjCbJjBYhqueoj7xoYVqT
-MK1JmNYkTGsSpjVZkhkyKGuAeAyvJvBuZXnCtCZhWpMwrUmY1iRMa1LjwNzsRA8Li52RYukAP4sT
-/CyO8LM4w8/iED+LU/wsjvGzOMfP4iA/i5P8LI7yszjLz7LD/Cw7zc+y4/wsO8/PsgP9LDvRz7Ij
-/Sw708+yQ/0sO9XPsmP9LDvXz7KD/Sw72c8WLbb9VfSTGy72u1RLAn3IG/q4oY9r6EPd0McNfVxD
-HzeHbNzQx3X00dzQxw19XEMfN1lyN/RxHX3cePFv6OM6+rjx4t/Qx/VBprrkwUSoHBtBmTARLAdf
-UC5MAlG3HHxByS0RLAdfUCpLCs9F3XLwBbJZMiwZrBiMcdDBF0hpyTAvNwxmfamawaxfxfpVrM1y
-8IVgaDOENgO0GaDNAG0GaDNAmwHaDNBmgDYDtBmgzQBthqHNMLQZhjbD0GYY2gxDm2FoMwxthqHN
-MLQZhjbD0GYY2gxDmync6CZm5IYbvYcb0enhusaywkniusayqrGsaiyrGsuqxrKqsaxqLKsay6rG
-sqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsqrZsmK2fzorIUKlU9j+NWz/
-GrZ/Ddu/hu1fw/avYfvXsP1r2P41bP+a2f41s/2zUwEyjHEQ2pjtXzPbv2a2f81s/5rZ/jWz/Wtm
-+9fM9q+Z7V9HagunztqaHTVLDs+CSUOINITHAOVgZUKoIXwaQmdsRBOEMmrFUCs5WLmhYGVCf4So
-D0t3LfWWg5VpagzNjKGJMZgXg2kxmBWDSTGYE4MpMZgRgwlJIB6TFiA6VjVAjEFhDApdKA2w9BY2
-jpwXoEuokBVg76VI9opSQntJUm8pSb2lJPU25dkJq9hWkU8IoPz1lvLXW8pfbyl/vaX89Zby11vK
-X28pf72l/PWW8tcjRH1Yumupt3xWAGWyt5TJ3lIme4tM9haZ7C0y2VtksrfIZG+Ryd4ik71FJnsC
-8Zi0ANGxqgFiDApjUOhCaYClN/rIYWH5lji+JYZv6eAGS5zfEuO3xPctJb1bSnq3lPRuKend0vZg
-Kend0j4RIerD0l1LvaVpsbSHWNpCLO0gFhuIxf5hsX1Y7B4Wm4fF3mGxdVjsHAnEY9ICRMeqBogx
-KIxBoQulAZbekqhm/8cbJmMdYT9QajNhP9FV69/Rmn9JhrOhpTYSVejf/r6lOuNJwtX8I5RxmM6W
-TdiJRZswhR2RbmVItTIULGZIxzKkYhnSsAyFiBkKETMUImYoRMyQImYoRMyQRmYoRMxQiJihEDFD
-6pohbc2QsmZIVzNQ1Qw0NQNFzUBPM1DTDLQ0AyXNQEczCAYzCAYzUNwM9DYDtc1AazNQ2gx0NoNg
-MGMo8ESEL4361e1+Fa94WoDhk6a/aT5xo9K9R6WryzEgESoZonQQSARLwiwdBZJA1C0Js3QaSALR
-QkmYpQNBEoghtHjMotSit5IwS8eCRNChsZIwi5NBMiwZrBiMl6KEWRwPkmFebhjM+lI1g1m/ivWr
-WJuKcJX2cverOAnScv2fcyhBSikI31kO5xM48751/Ps/lEC36ZVzEHwAXSmXcfz5eyVRU0ufT5P4
-oExDe3Rjinwl67rUlXF+clVSvIooFiGqaUgXMKQLGNIFDGvTUPeGjNeGbNcpCSTXJDZkiAsZYkJG
-FlWTJ/rfrK+Pt77+hx76oUtOiqacFE05KZoyUTRlomjKRNGUYaIpr0RTDommHBJNOSSackg0ckg0
-ckg0ckg0ckg0ckg0ckg0ckg0ckg0ckg0ckg0ckg0ckg0ckg0ckg0+2RwW5AToXJ2PKEnguUkfEJQ
-AlG3nIRPOIpgOQmfsBRBh7rlJHybyMg2JAS0QFiGFYNN5xVCOhffMhpC53QkPnCYYcPguNxa5ohp
-gcYMs0Eo1mQ5ET+hMozeLl0EfrxuEcnLWMeyo1HIwCZgYRMwsQkY0gQsaQKmNAEbmYBpTMD6JWD+
-ErB/CRjARDJw9WfDsdlwbDbc/Gy4+dlwbDYcmw3HZsMtng3HZsOx2XBsNhybDfbNVLKBCRjBBKxg
-AsYvAeuXgPlLwK4lYM4SsFgJmKwEbFYCRiuRjFI9VDLrlWDmqwz3UJmKeqhk9izBDFqCWbQEGa/6
-qGTWK8HMV4LZrwQzYAnL0yDIn23hz7bwZ1v4sy382Rb+7NjAz/qKSXxk9jMmsXD5x0vSbUugQ0tl
-QphX3DKvuGVeccu84pZ5xS3zilvmFbfMK26ZV9wyr7hlXnHLvOKWecUt84rblElbd05EvInK5RMF
-PaQT3jwUnB5t5+XkBbagqrWdqyO2/G+mlqnctCfMf6ltt7TtZJgWZMoXZMoXZMqn2V3ynV7QHqm6
-FqquhaproepaqLoWqq6VP5/25CLak9fTHnRcCx3XQse1TMe1TMe1TMe1TMe1TMe1TMe1TMe1TMe1
-TMe1TMe1TMe1TMe1TMe1TMe1kiFfEfIVkK+AfAXkKyBfAfkKSFVApQLaFNCmgDYFtCmGNsXQphja
-FEObYmhTDG2KoU0xtCmGNsXQphjaFEObYmhTDG2KoU0T2jTQpoE2DbRpoE0DbRpo00CbBto00KaB
-Ng20aYY2zdCmGdo0Q5tmaNMMbZqhTTO0aYY2zdCmGdo0Q5tmaNMMbTppfLL+9QygMnwG9Xej8d0Y
-QGciMGV9kwFyQx/Lz8mRdYPza3KTskb+vaDzQAQOBBE4EUTgIBCBk0AEjgIROOND4GgPgXM8BA7y
-EDjJI4Haj6+NSdRhVDZlUQcQGhg76EOwkz4EO+pDsLM+BDvso/c1OHbch2DnfQh24IdgJ34IduSH
-YGd+CHboh2Cnfgh27Ec8ZNkQlDtVUFwVFFcFxVVBcVVQXBUUVwXFVUFxVVBcFdCmELqRYclgxWCM
-o6BNMR1VMR1VMR1VIVgjwapmMOtXsX4VazOjTTElVRMpapCiBilqkKIGKWqQogYpapCiBilqkKIG
-KWo6VSaCFGTGqE0zatOM2jSjNs2oTTNq04zaNKM2zahNM2rTjNo0ozbNqE235YBSv1rEjGa92Ohi
-rjG6FLnG8/BiFfJgGSvTnQXicQQCPzxYdLfgbc/D9GASA/1uI8Om43caGbYdmTivgJDoil7jSK1x
-pNU4Umoc6TSOVBpHDjlHTjhH3jZHiogjPcSRGuKghTgoIQ46iIMK4qCBOCggDvqHg/rhoH04KB8O
-uoeD6uGgeTgoHi771uTNV9RvtvfrDfrBOOH3eT+9pvyc/bAhxZI6iiV1FEvqmp9rEnDNvEXA5VjS
-sK7NdbYBR8GkjoJJHQWTOgSTOgSTOgSTOgSTOgSTOgSTOgSTOgSTOoSNOoSNOoSNOoSNOoSNOoSN
-OhZxQB8eEfjyiMCnRwS+PSLw8RGBr48IfFZE4GsiAp8OEfh2iMDHQwS+HiLS10F61lT2GRHBviOS
-4Z41NRX1rKnswyKCvizycfaD0IcuVgFNlgBNCrvWsy+noalrPfs6qQQbWi75aC+QGstzEQi+TZ/z
-kOJX/JzHDcv+XbLsrHTAgChhKpSKwhYkvCmh1AbJyfGYzd+yvBeHLcjjJOBxEvA4CQq8jmBmlwLO
-JwHnk6Dg6wSyUjRm0FhmrYIisBOIxyxKLXrLvFcA9wKeLAFPlmAJPIK5sARzYQmWwBNhwcqFZjBG
-VdivYM4swZxZgiX2CJbYI5g3SzBvlmDeLMG8WaImSmzIhRWgxi9TKXLwjZS0BzU4y1QIOMYFHOMC
-3nABN4CAs1vYm2CW6xnlvxjMIv1o/n8fIZa5J/wION1P4FA/gXP7BA7uExJfjBA1WWhqWGhqWGgC
-mLlTADWeKpGksNvUsNvUlLyTQFaKdg3aLZGklMGTQDzWojeLChYdl6BS2INq2IOYGa1m9qCa2YNq
-Zg+qmT2oZvagmtmDamYPqpk9qEZKT4Ytg9kYVM1gNh7FxqNYX0ozmPpNtk2/XGHb/K1viIpSKBVS
-KBVSKBVSKBVSKBVSKBVSKBVSKBVSKBVSKBVSKBVSKNUSPGXu23wgzgR6Jo2h+RUQSOZBBfOggnlQ
-wTyoYB5UMA8qmAcVzIMK5kEF86CCeVDBPKjaaxFofiYCmcFQtR8fgZoc2Bryp4YDW8OBrSGVajiw
-NRzYGg5sDQe2hgNbw4Gt4cDWzIGtmQNbMwe2Zg5szRzYmjmwNXNga+bA1syBrZkDWzMHtmYObM0c
-2Jo5sDVHGzmwNTYeqK0RLGjDHqThwNZwYGs4sDU2KY1NSsOBDX1YzCrEjO7o7ofTnWYu7Y+rKWcE
-UlQlYk4Fgk4Fok4Fwk4F4k4FAk8FIk8FQk8FYk8Fgk8Fok8FCz8VLP5UsABUwSJQBQtBFSwGVbAg
-VMGiUAULQxUsDlWwQFTBIlEFC0UVLBZV5GDUrCw0TFlInyF7z5cMZj9hIES0WntJW4bpL98tKAK+
-hV6SPnagC5wrhR+SVZKskuSVFKukWCXFK2lWSbNKTC7TJJdpyGUacpmGBKYhgWlIYBpSlYYopSEp
-aUhKGpKShqSkmaSkmaSkmaSkmaSkmaSkmaSkmaSkmaSkmUSkmUSkmUSkmUSkmUSkmUSUvlFn/dTe
-nHpyY2+6JkJE/SrfjL2hj98lfSyxAimyAsE/waxAlgRwS/K3JZnbknCdovnjbcjsENmjxC5SNyRw
-QjRXeBqH9eCsHpzPg4N4NExbOG0Mh43Fs8ZEgfLDdKaYxgtq8utocusEKD9MTh1N2NESD5N0DeE6
-ytaiQPlhkqGZuFm0RFIMSX2DA0qWSpI0SUn1JemRktRISVqkJCVSkg4pSYWUpEFKUiAjRPUc9ZE/
-cwCHnYTDjlTJAtJ4ymcOIkg9lc8cQKOUcONJuPEk3HgSbjwJN56EG0/CjSfhxpPMjWfpiDWLI9Ys
-jlizOGLN4og1iyPWLI5YszhizeKINYsj1iyOWLM4Yi1+GmomKYKdtGbZSWsJ7idFzMv2lp27Ztm5
-a5adu2ZL+v5i6b7UUGwMirVYglVZEJkl1RycQYA1RLBgEqq5hWpuoZqDe0SwYBKquYVqbqGa23Ye
-kyyAx7IAngT3MdnOY5Jp55aF81gWzmOv15NKDcXGoFiLBZMsdMySrmShK1noSha6koWuZKErWRa5
-z+L1WWw+dCULXclCV5p1L1GRZLBicB+T8xlolilQlilQlilQdnEGmmX6k2X6k2X6k2X6k2XJfJZ0
-CQtdwkKXsNAlLHQJC13CQpew0CUsdAkLXcJCl7DQJaybRyVTKSxTKRLcR6WbRyVTMGxRMH6O6l6e
-U2wEirVX8MjC8hx58hw8eQ6ePAf3nYP7zsF95+CSc/DDOXjcHDxuDh43B4+bm88dc8zx5pjjzc3n
-jrn53DHH3G2u/gV4FPzYo9SEYs3NG0EcpY05pI05pI05pI05pI05pI05HIPqcAyqwzGoDglfDglf
-DglfTsxjkeV9OZb3leA+FsU8FlkWmBP/GhaZIam0tgCJFHiDQEGBSEGBUEGBWEGBYEGBaEGBcEGB
-eEGBgEGBiEGBkEHh5gNvWOygYMGDGe4jcT7whkUTCgon/BdIkWUysYBC4VgmU0vbdYvtusV23WK7
-brFdt9iuW2zXLbbrFtt1i+26xXbdYrtul1vS6e6HWzTbslf/Oq6clgTHFoJjC8GxheDYQnBsITi2
-EBxbCI4tBMcWgmMLwbGF4Niaa/H3Mz0Rrfk18efKxuxoX3a0LTvalR1tyo72ZEcOVkf+VUfuVUfe
-VUdbtyPfqqM93JE71ZE31dG27mhXd7SpO9rTHcyDDlu5w07uYBt0MA06bNwOhkEHu6CDWdDBKuiw
-bzts2w67tsOm7bBnE4GCPkGeAconURKdgkxBpbERTRDKqBVDreSTKA0lshJVR4j6sHTXUm/5JEqi
-eBA86D0RtAAoASqA1E85iRLaUAtlqIUulEA8Ji1AdKxqgBiDwhgUulAaYOmNpqXwXbBdcN0A5Wkh
-9gvuC+YbG9EEoYxaMdRKnpaWpoWYdYSoD0t3LfWWp4UYOfg42HiLdIkWyhZx7wJSP2VaoFq10Kxa
-KFYJxGPSAkTHqgaIMSiMQaELpQGW3mhais6FQz9w5keA8rSQ6oWzP3D0R2xEE4QyasVQK3laLE0L
-KWoRoj4s3bXUW54WUuJwiggOEWnh7WJnh7CjQ1q4ulp4uthJIeygEHZOSALxmLQA0bGqAWIMCmNQ
-6EJpgKW3cHBjsryq6BliJ2Xmk1VzRKRqficRkXnYJbtX3Xx058YgvzSnI0dRBqXGElgiPWWauAIq
-gBpgA9AQqFFXo65GXe0IbNBby0C00KJdiwoWjVlWoSXQoQXHSvGaFFXLtKgENwzGo3EKCiwlgzWD
-2bOS12ftANVsChSmQGEKFKZAYQoUpkBhChSmQGEKFKZAYQoUpkBhChBxE0G00KJdiwoWjVlWoSXQ
-oQXHSvGaNAUsIifBDYPxKE2BYlOg2BSwSB3BInWEYlOg2BRAT6DTTnDYCc46CVA+uJuUfpx5giNP
-cOJJhFBGrRhqJfNpWfZlSyaCCFEflu5a6i0f3E3mA5x7gmNP2Kkn7NATduYJO/KEnXjCDjxh552w
-404syNmCmtkZKOwIFHYCCjsAhZ1/wo4/SWDpDcGzZBCsYRCsYRCsYRCsYRCsYRCsEc9fI56/Rjx/
-jXj+GsbDGvH8NeyINeL5a8Tz17Au1rAu1rAu1rAu1iyev2ZmxZqZFWsWz1+zuP2aGRJrFrdfs7j9
-msXt1yxuv2Zx+zUz4dTMmlizuP0ap1CpEpOmKCRNUUSaooA0RfFoisLRFEWjKQpGUxSLpigUTVEk
-mqJANDWXmKVwnIpCjpaay9FSLEdLUJ8Zc+qjSl9B4rr5jN2NxHVdiMzNZ+xu6OM9p4xT+H6N8P0a
-4fs1wvdrhO/XCN+vG2x6DTa9Bpteg00Pof51g00PUf8BtCi16K1sesgFqJELUCMXoEbgRoYlgxWD
-8VK06bHI/xqBGhk2DGZ9qZrBrF/F+lWsTUW4uiZMyfWS1VS+tyzPUqJ0PuWSfcJLIoxdqv6O9xuz
-LPgVLf1SWLCkc7Bw3TKO43mEH5xnGv6hcIy2/2ViBHHtYgSxZ20sgjgOVAjBg4lxGjdZJps2M1F9
-8636GyZ6PRN1lIHisDIdVqZDBorDInXIQHHQhx0yUBwyUByWrkMGikMGiptZ0FQkGawY3Pffqlkx
-NhVJ9sTHFGT1zXEwN2vsPWuMBJVyFEwBUVrWGAQVnAcTwbLGIHE4yBY4wkXgDBeBQ1yEa+bXGBMx
-2HEuGe6vsWZ+jTGBgw54+ZgOfsJhCxy2wGELHLbAYQsctsBhCxy2wGELHLbAYQsctkw+axnyWoa8
-lslnLZPPWoaulslnLZPPWiaftUw+a5l81jL5rGXyWcvks7boUPp//BfdbljTe1iTpOBWieBWieBW
-ieBWieBWieBWieBWieDW8rmcAloCHermQybZ560lvKQZlgxWDMaQ6GRJFtIqWUirZCGtEn7RBKua
-waxfxfpVrM1ysqTN6e6eukq6e5Lupae03mdJw0l7fj0sPmkvzZJMSYU2wfFId1+5WVTZlxm7WeL0
-E5wC9QOcVn1zI5B85FXv22l+36d2pPAlFY+pa8oxdWr+mDoS/iH7Q/SH5A/BH3I/xH5I/RD6Z2X+
-XrCcm8XW9bFyTNz/uNJ+wloJ5HIUyOUokMtR+Jaj8C1H4VuOwrIcBWM5CrdyFG7lKNzKEW90CLdy
-CLdyCLdyCLdyCLdyCLdyCLdyCLdyCKxyCKxyCKxyCKxyCKxyCKxypjCemyCKG3HjenFDkbVBwdqg
-YG1QsDYg/TCBqJtNthFkpWghm2wVLBMRxBBaPGZRatFbOX0EpgsF04WC6UIx97xiNgvFbBaKuecj
-LNA7nTXCXPKKueQTzPpSNYNZv4r1q1ibinDFT0ksckexEzY3zpablXttPnIcFAvCaUrhbyEcJ3+5
-Uf07onHyB53V7yYuJy1lUxfhTZqcdBQWuIOnJnhjfsWz/lKPkvr+3az+f/ULsRnV17KDfIajjCcA
-SiN///yh7wiUVBZcgkYxlyAMepIMehIGPQmDnoRBT8KgJ2HQQyxkK2HQI69jAi2BDnWLQY/FN7aI
-/sqwYjDGQQY9CTW8RTRYhlkd9jpk3EPsV4bZGBQbg2JtFuNeOYbe3Kj5N3v2NQE05sb4e0MfS7Wx
-cuhXtDbqAv/i48wCSg2x9oaSWRskszZIZm2QzIqghQSibmbtDZJZGySzNkhmbZDM2iCZtZk/e6Ip
-6VBBRmJnTzTzZ080M2dPhCeYeblpCd8fzd/VkGG+gWG+gWG+gWG+gWG+gWG+gWG+gWG+gWG+gWG+
-gWG+scChncehZThkRyWk8j4ObR+HpUiyJz7u9wBkK0goLhJCAOueUCwCa2uWyazCmD57E/59FvI3
-5/mJZ1meXfqdOYT1GMsYVkvNI4gn8en2V9nH86s3vyNB/IZlzxvQ6EvH+NAxvnMcoJx/QSdX4HvH
-+NwxvnYcIZRRK4ZayfkXgvIv6JyLCFEflu5a6i3nX9AZGPjmMT55zL54zD54zL53zD53zL52zD52
-zL51zD51nEA8Ji1AdKxqgBiDwhgUulAaYOktr+Abu/cHLNtsgzGb/2NXcEHBknM2fiPxqymHpETb
-4GB0nIuOY9FxKjoORceZ6DgSHSei40B0nIeO49BnT0MvJRKgAthLZpmLUGJnoX/co9CzMX3Z8Sm/
-kWldbCZUaei2Z+dlxl0qg4k1zaPhptIUC9E6HguRY5KJQBpeSgLrrIj5G0Nanlpb/6ZH6XFvxe/i
-swthpJJTSQ65oWPhJI6FkzgWTuJYOIlj4SSOhZM4Fk7iWDiJY+EkjoWTOBZO4lg4iTNkMiwZrBiM
-cVDkETsBTuIkmQwbBrO+VM1g1q9i/SrWZok8Kh/asKoXeZQJNZ7hnWz/NkYfLgokSr2ZEscQoTxk
-Q5EMEcxINxTLkEDUzUg3pOFEMCPdUEBDBB3qZqQbxDRkWDJYMRjjKEg3CGzIMC83DGZ9qZrBrF/F
-+lWszYx0YwrSzSzSw123iYCsOM11gfNTCBIrhvB0KGKhE8Sryt/2+k0BISXR1VGiq6NEV0eJro4S
-XR0lujpKdHWU6Ooo0dVRoqujRFdHia5OE7E4ZLg6ZLgmkPouATDIaXWayCSBBiC6UDVA9KbQm0Jj
-OQAGp+W7NoZUWZcx1M6HVJHty5Hpy5Hly5Hhy5Hdy5HZy5HVy5HRy5HNy113fpv7ece3ORwH5D6q
-sSt/r9FFm0z2Ws4eivhbXAQxCcsQVLy2pItHsHxMj7TxCJaPspE+ntrSAFkpGjNorCgSpJUnEI9Z
-lFr0Vj4BRwp5BB0aKx/Tg06eYclgxWC8FH1MjxmUBfT1BEtWR/Jyw2A2BlUzmI1HsfEo1qaifn/N
-D9v9XhTzf8mxfb1S7ltzv28n9s1nED8S4WhPGv9jPoMooL4IqC8COouASiKgkgi3VEPPgj0TMYQi
-wV1BcFcQ3BUEdwXBXUFwVxDcFQR3BcFdQXBXENwVBHdlrhE18t0PljVSfakY/HG3bkWuNQXXmoJr
-TcG1puBaU3CtKbjWFFxrCq41BdeagmtNwbWmltg9JLv7MxDI/Grqo/rVyG9ssM03Jf7b3UQc3Liv
-rolIcTd+khv6uI4+bsT1G/q43v1d3FKW3FKWLCsByu5vclBZMq1ZclDFRjRBKKNWDLWS3d8Nub/J
-pRUgS2WW+shOb3JzWXJzWXJzWSSSW/i3LPxbFlnkyYyLUqEB0kCKKxyJ5RZ55RZp5RZZ5RZJ5RY5
-5RYp5RYZ5TbHjKVAmZ8ZFOPs0qCYXihMGmuUK1hADr79FKGf17cwywNyMlUE+TeoKG7RYEg6xNd+
-8IUffMrHwn0GgRLyJGRICIvL5L/fiIkrcKibTxTeMOP3RTL8DrwVpC1DWYauDFUZmjIUZejJUJOh
-JUNJho4MFVnBtaXg2SLNuIDUdwlagCpMmnABDUB0oWqA6E2hN4XGEjNX7CNxNZkSapgSapgSapgS
-apgSapgSYgMaICtFC+UEPZgdIoghtHjMotSit3KCHuwSNewSNewSNXMo1syhWDOHYs0cijVzKNbM
-ClEzh2LNHIo1cyjWzKFYM4dizRyKNXMo1syhWGMOdImV1hQqrSlSWpOzSJOzSJOzSJOzSJOzSJOz
-SJOzSJOzSJOzSOMzERqfidAIi9b4TITGZyI0/EIan4nQ+EyExgchND4IofFBCI0PQmh8EELjgxCa
-fXqPXI0CvkYBZ6OAt1HA3SjgbxRwOAp4HAVcjgI+RwGno4DXUTC3o2B+R8Ecj4J5HgVzPQrmexTM
-+SiY91Ew96Ng/kfBHJCCeSAFc0EK5oMU3ELYKkqtonCeBKK0pFZRbE8CUbekVimkViExukVidIvE
-6BaJ0S3Lj2yZaatluZIty49sWWJ0gtE6pVax/MiW5Ue2LEm6ZUnSLUuSblmSdMuSpFuWJN1yGyEd
-qK1woLbCgdoKB2orHKitcKC2wiHZCidjK5xoqXAGtsIZ2ApnYCt2BrZiZ2Ardga2YmdgK3YGtmJn
-YCt2BrZiZ2Ardga2YmdgK3YGtmJnYCt2BrZiZ2CrmqGNvKIKXlEFr6iCK1TBFargClVwbyr4NBW8
-lwreSwXvZQRRt2CQOTIVc2Qq5shUzJGpmMNSMYclCUgEGwazvlTNYNavYv0q1mbBoGBhOcTyDFie
-AcszYHkGLM+A5RmwPAOWZ8DyDFieAcszYHmGsTzDWJ5hLM8wlmcYyzOM5RnG8gxjeYaxPMNYnmEs
-zzCWZxjLM4zlmfQtGi/Ai/lYKFVLcqqomvG+ctZSgXO0TsoKCdrATV7ljeJz/blJxX/kSNt3pO07
-ch450vsduY4ceY4c2QIc+Y0cuY0ceY0cOY2cpWXpLK1KZ2lRJpD6LqE8cA45SwvSWVqPCUQXqgaI
-3hR6U2gsB0CxT/zSZxAEvoMg8CEEgS8hCHwKQeBbCKkBDZCVooVywgt4XQQxhBaPWZRa9Fa2EzBD
-fF1B4PMKQjFmyL6sINinFTKMl6I9hDFD+qACwYbBrC9VM5j1q1i/irWpCFeITaI5EJgDgTkQmAOB
-ORCYA4E5EJgDgTkQmAOBORCYA4E5EJgDgTkQmAOBORCYA4E5EGwOBJsDweZAsDkQbA4EmwPB5kCw
-ORBsDgSbA8HmQLA5EGwOBJsDodk55xAbJcRGCVlRssPNIQpKlpxIEtTckQqqbvpHKuTWIXNJyFwS
-gpaEHCUhR0kmfjQUit0glqFBLEODUOwGYQ0NQrEbhGI3CMVuEPfQIO6hQSh2g1Dsxm1Ws2mnLCK7
-4WmnbrNnY6IinrqruGbflPjsjxhfYEgINpgQgwkxEIIN5sZACDYQgg2EYIPJM5g8AyHYQPI1Yg6H
-pgjAASMs/TmV93CYinohBoaJw0b8Cjgk/ctgIRksJAP9y2BNGehfBvqXgf5lsOgMFp2B/mWgf5l6
-HodMDTNMDUtwH4f1PA6ZUmbqj4nD5KqgBWxp/Vpas5YWp3UfxnJsYTlKcjF7ZrX+xmzAeZSC6aiG
-TicwOJ3A4HQCg9MJDE4nMDidwOB0AoPTCQxOJzA4ncDgdAKD0wkMrG8ZlgxWDMY4iIpaRkWwwWXY
-MJj1pWoGs34V61exNouG1bI8h1YwzUkwzUnwXAaYieWSILHfCGVcE26nSgSx8krdjTJ4owwuC1lR
-4uYDKzf0cU1M8PwhJIXDQFVQtE8r2qcV7dOK9mnl2B7W0B7WYA9rsIc12MOQXWYa7GEN9rAGe1iD
-PazBHtZgD2uwhyGIJcOSwYrBGAftYYhZyTAvNwxmfamawaxfxfpVrM2yh7H4bImT5iROmpM4Xg7f
-rEqgLSAwT8fWGTRm0JjBsXUG7RocW2dwbJ3BsXUGHRt0bHBsncGxdZEoZwRTdnqdYafXJbgvmMp5
-wZSdX2fk5kfcdPNoyT+FdHOBfPMIFhzCP2XgnzLwTxn4p5CdLpCeHkGHugWHah6HzE1FrITgPg7V
-PA6Zo8qoj4nDZLQjrciRUuRIEXKk8YTEus1qe7ozPj84ezA52z86PO0umuQXDkwmoiPsFenoVBWP
-tw8vUQd2ls5IjZ9JPx6fnE4fnpwcnXQ754expdVxtTW8ONs7OXq7cjh9uxLvro6HuTKrN7wo8MrR
-6vDix/HJynh9PNq6ezD9aXoS/q4OLy9FdfbueHq0szK+NRocnr/Zmp4Mbt9eDfVO373ZOjo4/X5j
-vHl5OR6un0zPzk8OV8ZX1G7sZeKbOtw92xsV4I78dFxtl9IC3BlX01I2pbKrMKyt0dne/mk1GW14
-nGyPNg7PDw42q+loY7Paibfuno23DqbV7mgwqPZGdbXv/73y/16PZHUwEuuxTnqt0+nZo8Pj8zM/
-sooVv3uXGnr3rsrXdGOEOgURvacODo4mo9Hg/NBP5/7hdDvgZr7CxdVwPbzIm9HcvfXp3ePz073V
-N8Ne+75/TK7voKCU2md35x9IvR1XP1Qn1Wl1Vp1XP/oxVG+rn6p31T/XdzxFrK8PL05Gkw2aFE/d
-saE+XW6cbN4/HS2+0a0ej0ZhLvyYjkeehobV6WjH37h9O/zdON4cru/vrObXOu2h6fLy1mnuOYB+
-YocXvu6tV8OLf/p5jUN8u7J/uBJaGqY5np682T8cB4J767t4+7m8ffufCXmDTwZr83XWfHHCxANP
-GD0i2Dt6+83R6X54k/v+5jcBcyvTgLoVT7YHfogrg7XVvTUxXBt0Lw9z6/MPr/r7Lw8f/nQ89Vg5
-3PUP/fPuq6P9w9VBtTIYdu9teuXbw2l8eLodSj0+xf3B9HB7xSNsP5DpoAvvtjr7csd+xR0P4wtW
-M+Sw+qC6OJv+dNaxIb8Zn032qrOj19PDbmFTVRhX1ydOX3J4VHkS7d5UZZDdP6+GV36eXo1GKk6Y
-H/HBcJbbPLi8jO8dMLI3PvDP3fUTsT9D/H7y/YrtlYVx+wW8aBwLlk4Vie6qULMfzeu7Z0fPz058
-v6vDQjtbJ9Px60CHfhnVHzjUw1UxrGZWx9UPo2Pf4+vZ8j7Nv970jEcFFAWa3j88PRsfTgL5Pzg5
-Gb+7fbsQ/edibiiZVBI7X3njl9r+8cF0ZZzW28rx0enp/lYoOFvxrZ5NO08xJ2ue0NK8+l/Hw/XT
-t/t+qlfTgpqMfXuim6RFcjz0TDdCczgfVtMFdwKOh1V++nRDbA79+4f1Xv1w30/8D9UP8dewW/33
-T+2rz+vbt1/duTNcT/MXX0V2P6WqxydH2+cJL99vhJFt+n/Vj3f/ONreoP3kp1Dy/R9HFzv7J6dn
-30cKn27Q1rL6k9/chpt3cbc6GC+oJzbvUnmVKk+ODs7fHC5vLN1Pzc3XLQ2mO1fVeX6n6Ymn5DeJ
-vd6djA8OVn+sdqv9aq/sSFV402q7mnK2en6Ls9Vh3oPP13/yTHnit9zTg/3JdLWu7ohP/9/mvkW5
-bSNZ9FdIVEoGwhEtZfecu0tqwvJDTpw4ceI43uzSXBeeJMSXTJCSZZH/frp73gOQlHPu3rqpikUA
-856efnfPp6+/ARAAgmu/g60Hcuu80Xu+b60BthQowZpr4MHVjtgdHAfrgHwD5Z3zMlKt3zl7+5ee
-GHr7bLczvwxPEUZ9OeNV/nFTrvK2S3UtLsUhxrFAjSueMPmTaxYIKKBoPhFfuvH19ewuhJKr8Wae
-L9YVsE0xYM9yYSolglAleB5qR/j3Kh7TwUxgkTpB68XLV5eBvV2wmmleVe6mIYlKuZxXGBRVEHVh
-ZbIX5Sz/7W6RhvrTdbyewEciMbKpbnqbhRGj8bBgsy7+Bh3mM1hSbDazmoXWoC42EfovqQ3YdwAO
-aptaozGE9+kE12bdw7ZP/xbsDKMnl1b8CVNYLDnLOYDMzN8h2adYTs5FmZMTsb6H1megZgrbciNB
-9Tzq6TlUd9U6n8Ms4HsVwSjkl2HQfVyly+s8GHHcI2vfidmlc9cPvdcJS/GM9XOzct3Hk3wG5xP2
-BZYo7wIqAxoNRymnkwwg8ht2wxMbtDQTHIfUJDLlglADYAE00hPQ1RXMDA8XT8Wreb6eLOGUiicY
-UYm8bcWH94t4nvcCDZsBrbb9YidZuGvJnVTI9Fm9brdwHFbL5ZpmHu3kA6H0GA/6eolNduMs47Y8
-wVKCeWqpAmjIs5OTdqpwjdUB1pQVFJC8Tq6Ac7Aan8TV69vFLytYsNX6TiA6d9Qsjgbu5IduARA4
-Rl1sjCe92hfuVhW4RqxdLFYs2UWn5ztnxgBo7pTNhNNJnk7pVaTwkmAlxVwD6ClQs217zcKqQL/A
-bHFb7EL0Ya0l8L/2Eqr+2meRs8KyO2oyiNx+qI43fkIqLOunvC3ax5LQPSKjdLtNVOOpHHuYcWsY
-UZvAYtBuZ2pEUa/dvlmWWevM7RzO3vVyFa/uvAFoLKE4nkHwIejEnTCBn0kvAP4YX4RJh/DHywXI
-ZOwv/x1FhomDJ0BC17MYTvzj99njMQtif+4EB/byuofYhQaSK1KQDDMtY/bTC1ikTie6T3g+TEe4
-PkkX4QWQVBxpCoH9SMrUwqXxAGiV5+9kL3s2ItHCUsJhcwGTnPVvJ4B/bTiTm6DXFJpIoyiC8fUT
-IHIKEDIBdwgk6qBl7oBiwCrjBffVAhqQYFizDZwFJgoCaw/01m6PysJhfULfCcHwtrf18Pl5ns4A
-JAW6qVFWCXoZFcoztUJVGMnVd9urleM+zmZyZ1nRj1H+TywlgLvLGewybIXa5ewi72ewyymwJxny
-IAQ3IJPiOiKvRFveRWL3ZB2eRfjpQwBwGkcChYgCFvGrlqs1zCNdLtJ4DSAjnqOmbXjIjPqZNwtS
-cNBUEphKqhUl/eQi7ScwlRi43WQE3Tk9nZxIdiyAw0ZjBj6Et/CBytG+62nkDou1iww+dunoYpnl
-1Z+ho6wAJnYCbOwVm7IZm7MFWzJHM6HUEuwJe8qesefskr1g37Hv2Uv2A/uRvWI/sZ/Za/YL+5W9
-Yb+xt+x39o79g/3B/sn+xb5iH1gCa5iwJGVJxpKcJQVLxiyZsKTkR6gPS668E6KpNvBD4rjA/lbr
-FXDAyxWPSdikA426iSRKSrFgSPGQ2QT8wRP4J+pnplOemN82cNBiZvDmw4dqA+P58MEuafaFJVNO
-4qM1D6BX+afXxXbr6PPk4AS8SKHKARnEbThy/CbQCUCQg+dkt0Ag+z/ZHJBgpCLB6bCX9icS3ODT
-m8vfLt+8u3wOa9/MO/2TJxNYz/k1yLSwa/hUzOI1MFPsAz5IvipJ8WGer8Y5+xf+zPIZbCz+AsF3
-ta7YV1R6kVWw8fhTcmGiPv/A/mjARIC6nje8Bor9pkEiwKXZsWf2F1rPRT4G0Tvjbfup71SKu09B
-oOH5HmYwut85pBuWo2ymGYDhPoTAwcXA3ZMkM8tv8hlPIrW5m0WxnGW/LWOkztutUJKiLpTHBCCL
-dd8iwliX88/AbqTdsvoNVQiI1aHqIFXD+BmOOVJ6/eLZbFltVjkpkBuGLT/77A2N7mozvwZEL4Uk
-kGPW8ScpJqXxYrFctzYgpMSta2hAaDRwOAidMeAlzRijPiaWrJJgs4EBk9Mqu7er+FqgK28K3nBj
-IK81nhZXGSmJZsjK6hk0Qprv6B4AbiAxADVMO0P8pux+mLN8tBPH+AnyVDBMHKDDDITBKi8CkK0K
-cdzDnDhyjYCTwbBwemASRY96wwLbb1r2V8vl9Zu8yIFTS/exG0AwuDf824idvlwAr1uu7y466clJ
-J71Qz9vtEriOah0iIlMTETxJimwByA4pB5ICdLVxmsAeSzqjef8hDMMb/zye5m/oY51l6ycKqnFT
-nwBWNcR2gGs3DsVKI2HrBETkAKkAAot6+OFHGIO/WgBzpc2XWH21z4VotF7FN4Ce8mfAimWwoCF8
-0OWF4BPDX2QPNeAB1jBicNLc6VufL7WQRMtSDMbi4Op6ho4aHjpxKuy8aSL2+3m5ANDFA9Q4WcWE
-S4YzOT1FUtAGgpXYSsqpFjnwQ38vt6sY9D1YS/G5MQAM4C6L7/UpquCpAJ8FqGSPO1IsrgClIU/W
-4cFAabhzOMK0R00LBCUTIzbEnV8jsz+pO3bdzj6hQXEsBi2kEjRseawvdZnqm+Y5Cz4xPGdBPCeA
-zgSYzr7EjAix9yVP4nAoH4FfwOo5VB/zUlXPL8b9HKunvBzmVB0hEZB4+9weyk5pzDQBsnbKg+5m
-GW3fAgvwT7xO2+d6aeunB5v1AbRcQJl1A5XFY/siDNoBkxynXUvjgRrL3JcspwDmuM05gFosK4Qo
-LsFZKhcbm4dyxWW5GMORO05DFflz5wvRMu+dJhb8D//9BA4ySYJ+DSFMNXwSY+dvvJeKvnulBa8P
-A7KZd2Q8ZkvUAziQrVmPBJ9qWqd/hgCHgIOGIxBdkitUfsKRbVyswKoXjJxCiIudXv1+hEgSRy6r
-5DSxvN7Dh7ntLGGH3ZqbRTUpi/Xh/mWhg0OQm/CAUUg7NZrr/G/Ds1Gv3nRZXc6v13cNDOietv3q
-BjKP6Dqsph6s7XDZQa3n2mlq5wxGHIb/wDAEx6gHAJTV7fgQ98DSflrr2aV6KVC9+6RWSHbfDh0q
-C6SwBkQk3VmjQB8Cp9KPJyftxKohNTb2iKpr0l+n7FyaPzzknRyWDQAj2/T13tbGE1c2SIw4qRow
-Qj3DFno2W/hmuVwTu9zQMbLStZV2aaTyvtASB9A/S9hAb40RK5tBYgwgMTHkbnwB/wNI5EDtxiMy
-S1msoHx2BB7gv+3VTwbSKJV7skDUKwYh8qtAFoCJIx2+5oq1KSuvSUW9QLkVxEkn7QR94ON7fh/E
-V5NWtXD0tRVIuXk2IMZGWlXgNzyRy0DQM+9AwNGGF/Ib2G4DoWgNtHJPK1GROafl/ZbfDoIwwHFF
-QS9t3EDc3ENsTl/tGuxZAgLWIAh6vzIJSSSv/BSSdYBgh4y9TO3uZ2ZNE1c1R+8b0Q4IC0WToivv
-14+fUXMh9yT8jyT3FAvuKeWJ5J7aYaqpvHtWhSVRar7SSJ2pfGcptJRJ2jmOdBqVljCqW2UKpj7C
-gcMpduzTQwCWpKhPFQsJILOLxA43NDZGbtiu/49yPbE1qFI/L1bR18lA33knsPRsrXsErgR7czR3
-fXjdCA9+d8dYYHalVHYAoeRdNW8+ygVs3YzP1dYVF7N+gVuX8/mwsM9yGIl9dA7uFI6y/fxE7ucO
-oIHWliAOfU9YAbswadhGgVUL9vf87xEDXsWCTdY+R6eMBTqP2SC7QGv6UhZ1EQa7GgGSWPo1lkPl
-JGVv6kQDltdIqSRlnHLp1OHCAndvhGlPlY4WXUCNrv4d28nQdFNI4YigDH9YeAoV2q2AZaJI2ah7
-N6hGqJZk4YAhPIW6qV8jar2sa7FNG7UaYkAEglo4GyM0uryVUBTFFicFmM11mUmMMHpmhFFASsjJ
-7oz4HeaIlV6V63wVz/iTY9wvaVd43MjsNnEYLhdo0whhpuzZFNc0IJ0JBNW1/AmSfQJBvUOpkTGj
-rlVv4AqVjCStejG3qqNRg05WsN3G+KAEJfWc5clmPM5Xgd+REnWeO++VHNKg5ogljIuejzGQSmco
-9kaPEtipEOU7MkUCrCyX1z1BGVEfZT4kKPeoL47ZtF9rWU8ZGShl5ZRtt1UTx1iyRs6IkKeicGX1
-u3JgGGiKvQGKLbsIeorG99zx4VMwCIFhVqhBeAQoi2zaTZabRaZmO3BLkRpJe/8JG5/52QUElK9u
-0EgE1FZhDQEbIEUHOfyEdcnwt3ErGDwKHlklO/BotdnffzpstJQg+9RL3NWs65EU/Dxq1fqsnXh5
-UH88cOBjgCCjGLA3RfnRGqzM4y8QgD351z6Jf+zDKG8aDsGbBzD85MdDBsKwJlwpqLA7CiMJHEpb
-CTQjcxnlBwgJmcXgpg+UD2xQwE1H5TdxLp2hN+5B0JLAYWn6TYd3agoj4rprW/+OTsu7vTsvHG6Q
-00iBrLQaiYqQXRK01cTSS0aYBcu84ilqRJiCEmA/uWcaPwYq2G7AAtOkBzGuj41yDjID8J6VmfmQ
-+gKYhV9MA/ts8VabzZoGMjXuU1TUaksRF6drL3O6j4DsIavO2ENpzKJWbaPMF1HP4+2a6vWmfyux
-z58p4GFf4/6kn5ycvLJINvXSTLefrJfzMt3jC6A8Aeq7r5uNDvkF3AvHACFIoCodiLs9zLHW4xpP
-ywdpmx4KCJ4gvXsgz/CAhmXlWqN1juLBTSqlk78EwnWgkUuptVdTjDeCxyVgk3Zsg+A4XwDPus6z
-OviRQNPkqpr4Y7Al4Z+/RKFZm4ZgZ/XwPJyPJtQmo6NSCwmNQsEbRtjfu3IX3wCFbjzrsFiFYs8K
-+4PPpRFpIQQ+AilVyAe6RR+xW57O5Ofsdqhsuc2GXELp5CUrOsF/vw+VVRfdtIRwq/RAQ1iTUb/w
-+hgf7APtYcZavJatj1khPD4ilDXFl3Fk7Kzk01WA4EvjyrfbVEx+ON5ui1E0+kIeltyrzKYIvRk9
-009Ww09Kq0HFDRVXmGmw6QndUdh4Lr4H9kQdJI1Bk4gMhgHpN9AHQBnICoPw8ouCDGSAA4c5kNcO
-Ty29nmWfdc+ENqo0wDB3hAZRNqfSAhYdFZ/9uV/D5qnj+jTHRsc8F2vkKDKje9+7B7VYUn4cA7uf
-3dlrnTsnS45nvJtz+4PWykxtrcxUaGUmpJUhWJ0QgTAGM/GMxnEF5WLETq/6EBUAj1dHyxUNJ608
-eAqky4QYgjpiJR4xdiU4tjKyFQIrKjILU/jO7nEG6M0YOe6aoevZaO8dcntADH0mUxnUp8c0Cqks
-2KxT+BOyQfMJNSb2lAePv4aTkYV2/0zx3VGH1MqWTujrxwGcvgRdVEgURU3AZ4oQURpg47YBvFtt
-JUA04OPmZUiVNw31hi74PJF4O+kNR8agrxzcy+rn/Fa7X8DqoBzCSf1AIknger5zu9gA2+3ROqe4
-zmkz863qAgOOAwpGTkGAlZcS+zRwYP2Yh8pTQbWjpKyEgM+oIJxCzGGyUpI8aa4goltdhtL+Ipfh
-zOXn7XHSahyiuEIodBUAdKqzA05XKOa1qOnWcrOuyizHYMNYe3Uirs0BxyIlwsZyYW56YIvkvBUv
-lou7+XJTOY2i8rI7nQELhyr9oaGhT8JAS6Nw7EHsQj+/dQlLKEOFnLKW+0gQmWAlu0weaeJIb97J
-96p/xCQWpdjZ+nVHMjY9uVtzgIgkvterpiaEaS1Vl4QtfJPxBJh1YWYx0Kv1UFn/isuJuHUjjy1D
-tXPOr1BxPYY/56MdRQIpvkYMwwErpD+Sp3gH69YXP1NgOfR5hu8SWg3gMtVkIAN3YO2sFe08asF5
-bpmw5Ucevs6Z6HEc2fhaBnoXyiIkwzoTPWHnhAESElufoLLcFOorarYTZt3G2u+UzUi3IQwTod2S
-kLWcPqVlAva9u8rJ9SUUvImIO58qYju5KPsTILYJnw4nQpOwZxoD855nPa9znmHIHgFHYkOG5fVv
-w2VRztb56uUcpYdyLUSYZiuPZ+MBkiLXfEKx87GZxxXN4z7hMUxELpLc9MTISVaI+sC81qoooPmJ
-L/NgagC19nrLchGONOeyuMfSlK6hqbyY9UsYXQEcTTlihb2wGfC+jpVpIDhjYb4l8L0EjgxIFIba
-AIzTB2BWemGqfjMxHM1JpO5yP4CT7od5Iy1BaaPGWQskyV+rhkEKRPfojPhDiR/oSNaig+wKyHlH
-yhuiESJC62zX+FbB/he2VTbXuRt0HEXCU4yjUKfHs4bLoRU7x9jkq4qJojfjJOBgjEIy6IRAC7AJ
-4FLQ3A1bZFDRIMCtDDCgqOOstDWmDTaojOVR4yYKNqTJPU6psb1BApvljlGdmQGOlIYTY3fNveFG
-NXvuSkFa0Qm5TtHBscQ4Fsvg1CKxKQqsVmCl0B5rTHXKqmwMyviDtQi+Wkj0pIEZiCL5aupJtDgR
-ditWQRajGSAbBiWIjEA11lrl1Wa2VpXEKKmU6CuStR8p6FBhvqIWkpElgW3QGqi3PdEN1Hxkcbm7
-KAz2gsBt1AnkujArhKV1v4MtSnkTdWUgQaW2PEPOZxGyJZY0MwAkckCMAfSNkDdW3tHekKKgY/l/
-I/LJbCkWIJdJiTiLhNUGGssIjFmBXWcs63C3iTFmapnN9IELqIZceRqKBpCdYfoFq39JMRQVn+/X
-ratAMtoCrTuXca3H9OL0M6A4RijvKcXr9g91BkPjAK6YuWQcBiLioyI+cGgGZQ9p5LJ6vmjzJMXQ
-Yjt0d990KSRQzpZixeLqx/wOPV+MiJOQFAO/gmPrQIqe47N3PONFhFpNwbFUGpNB0IVt7QVD2tzR
-fiOuvwgvUbfE18fkXFJB7ZFyralRsQfvLI7WtO7YgA7NYZ95nhqxTQY1q2G8GOf8hwP7rYVZoMlz
-tePrpYnZTmebqrwBooi7rR+l3Jp/3MSzirtF0bEq4EeBAjuEs7FeNq9eQxBhTW2nXGbWaM4GnlrF
-CmHTQlgQgSD65TMg5MrPBZ+hE3iDiSYkrVjWqq2Xz3imK62XWCWDKuTFyf+FYcrVOr+GU4mxb35t
-/MRz41sDj9hAjg0U0h1HDkQkrglfRVZP+p015p83gK6sAYnn85ERvUQnroMevMOCdgHd+J/QmLpx
-jn17HjrEw91G6e3VjqVyt4Ghk5wfymX2bKUBg2YK4hItuTh2EZui0rSQ5MZss966NudmNYGkTNHx
-RxWF79Y2qaJydfzC+DoCdnwoO7xQJl06Aky+/dZ5O2ITPsOtyuHP+UiBp9yMQcd++vYMXQgmncCM
-DkbRE3K6+248COd82LHXiHXMGiE0z7HXK/gDvc5ZdsGvTOtXptErIMGJ9o2QG4iT406PTGimgSWp
-jxAeMQeIP8hIOcLK5RzIBepwe0HFbNTw4Hung8wk/jo9pV+qW/pGPYlvhtpPO0G/Rdwu/ikbgdkz
-8x6GZhG1q49TAxSenPwUryfdOKmcIqemRHTBvzmL7q9s1H2tpAwRSLzg7g4m3NrD/uKCJ4MY/unF
-3/JEPnY6vfj0NLr2AwyudxY/HHmY++TkSvByfUODrixBhQjP2OKVyau5icUr6cDtY/+QV8XA11LE
-N41xY+BYwpwDtm8hB6FEB7xQh8P3Zg5nzUdcOeJ5Z3zgHG8UTFj2AABPuXAl7MwEGGUG7LyT3gz+
-9bNfK+c160BzBIgiuG8RMMuAdvwS9Vs7sZbSt0SUIBlC+6A3eqUYd7F6qJ1VyjPox8Yzy3hEkW6X
-2L+dUnDsSFdqYB/d09V2RCAtByTsyPp10QvkEDioHQkmARyJlhJXEb3sIguaMWeG1rCjmGnz8YrN
-+Y3sxz8fY+lWxA0B09Os9rTTARzhXailZr7lGN1UxI2agM0bw5oB+I1pIQFWSRFsM4bbbXAWAHbI
-MdmBIyvlaGNvm9bMmd9uO7Bq/PScLMuCioVNBWFRtQ1yEAK2PbcykkQKAXda563ttvX3/O+B1ncE
-0uCFQB0WMMg9e/M6ueKXxwUOrSmzDCrKbLKUqj0h6BivH4rkOrZVe52Sju1XzTG8P/NHQAzNzPWL
-aBkN1yAIUeDuBfc7o5wwKkEkBXN+xhZcNdGfXyz6c2G1nA3nxNJNXEVuLQuXtEtM4psczRGlVH61
-6CTLAHP9UuoWop1lC+O/6vR1TmxtzbGB1YITKXDUTtwxMVNJLibkoHMFM0kwbQmKi+rr6TkKCVfw
-ZrzdXrmKSwoYIV9r1O5734Jeypx374C8DYUf6Qhg/UoGnl9ZAwdWiKRJ2EelXEHbqueUH155+lTT
-llsR2na01jABo0XRcjLQQal8BWJrTu3nqFNosl1iIOMMFkUQY0E7ATWGs5MTQo6zjmPahAO2C/pN
-YEboFCCtPO5+1BC+5qmdHxK9ZnyTGgLoamqHFUhZx5CzOuQPOtSysHeimw0C42MlvtDnWUdKy0G4
-xz8YjoK+fbayo6pp2U4kJMq9+vDMhAr2E/8kJq4eOyE9tuUsl9NZTEUSnUIl+fkSPXai0rCIKK5v
-OcgrQ5sREbE5tiF+FOxTzzwQMOXK/Geg8hlaR/nkIYZ+bbLy9H/iCX1WeKo81ik9Q6G+bBbZC2iz
-4so5gBxcUuz6KVaDAT7cvC/ViCzARjw7f5aLNLf5z6i5q1n6UwO2GldZDiPoB5BqZzaN3izkHw1S
-x7MYuRRS0Tlu9xZadB3mY4rglMq7GLNueIaJKl8/E978e52saekOZrBIpAVVr6/xVZTJgGxuN/Hi
-EEz6Mxk1U6t0BeAmrOryo9hhU1EGJPB4t/PmF2fZUwUNzeFoliyqmQUDQArL3Etabb4A0ZWnXniM
-jeseY2P0GMu4o1GWc2bSNyGNXN0xm1hpUYk7puVXkeU6OUkmBTNUUCeACJALFEp7RrsWBcY9oTXZ
-1RalyYkbPdpzsSiKBZv2pxS2WTW5ZqH01JA2AVZFxEIXfNoVw44IQFzLKS5p4cIuy/IZnKdWoTYU
-CHMhARo925wAG+OfYdIooj1pH6cmYjJa8+UqhxUC7mwJT1Y7xLO1CISFI0kpoexIg7HTSFzBC6qn
-7T/YmgPNA5lLjtJ9lT0VIwKIZBHPnuHLvFHWl2PTWX4sfwu7NrAzUSR8Msz6Kl5tANMSji9oVJBT
-RF85fYZSFP5NRW4Db6rhVgKihink0MSXMUA0cyd8cmI68s8XQfs4UkPBDCCYNFTaxpVNPLZjbBVY
-/zOceKf9Np5NCb/XjZ6CH3C4uIM4TR4Ex8PGcw2xkZzzqYjup3xMSVzdEFbh9zD1/R5K4b9Regx2
-aVwc2mfk1gulgLtwjm9YMsobqpPtucHAmAFmHNXQYr7AlFrPrLRztTgRfAvcuIFU3N4rmxBLjZLB
-UtpHSudPahb4bSOyCVtEEKoB85E+auU9E3VD69RKU9YOg0JkSaGcWKvbD3QuIcWO0AtBloiYO6p1
-KryUnpcY/PAlPh1CY5GqOxEsFiNER6pU6vpxMNtt8IFYqoCN7dC7MaaW7IwVtniCZ0zofzXF16/U
-sQnHTN1YUQMQXZjWz0Tk69k6J14FIBxf6z2bonxj6GuNiFNSDG5lZqMGIhc4LU80wXMe8gaWXqGI
-fY6ACbYyDyWnaVrHKGfydrHTmos0t8zyt6LUupWB4u/8UaKVOZc+yQm64LieqjqAIHN5RiDcFgpo
-sEUr27uIR+LZQf5bZ5L2OXBBgCUDrimGXvd4zgH2MvFTrVByjfIUnAL6ZJ6/gAOnbj3O+3AAkR3R
-S4H90kVM+CTbw1euUsnUyhOt+A9MDQYil8c+7Y9IxspDZ3GAWZE6jIGcRs/MbOQEGz3A+VNxvE2O
-nF/sNsYMl0cisLPjrvqr5lGqYvhC30PZcstrsjX+Ivb+JzKBxiZox6ouwpKaq8tvomKoUyLQUlPk
-+XaL/4/x58mJ/jngQVNrgN4yyukdz3ADvOS4jphuJWqTvVHkZ+ilBbazyURe9F+Dd7MV9Oz3GXUe
-BS3JaSbAZcrsCN1Hdqb/wovHtB0k24UfmKiDmsxx1ZHdVsLnqKdRJAgWYRbtzNH32DoQXp8CksxT
-KIUMCtr0FeIVweCCPKZ0cYD1msgosENhycMpfP5mpNzfp710+Bf9VMLTX/XTBJ7+axQx7e2ITfm7
-tOf0Gd+2DO/ECTqo7cg6YaBV9LIOEFSO0hSa6IwcLbDIBb8d5D0UtPK9Xnc2hNdOXrPZU6UqxkTF
-d06C4h/Yj/3KSXZ0Y81dZUpxFQBKe0PwudB+rCCDFfymwbVHZw74RBrNgjSaxa7k+841tlydnCxE
-Qo12GM7I7m37ML+G3mauB3L4jM/Yc/7MkKwJfy7Evhm9xRjW3qweuTUIL5UIPXPOV5Nj+oxfogl+
-An8A5HoTXg5mWvaZNWine7Oe4AvO0GIpNSUTE85P49pu4euNFIVu4KfjsCdpeZgNkt46AqGEVugF
-n3mtMEVihvYFCyIhwkiF376M2AskOZbY6cRDxDpVS2u9BFlTsXyt2+UqQ7ie2ThEKAnsXXdiFtJw
-BiBHztD3hA96BjXsbL0E+xzt7mzoQU8buhxtxYUA1JZLd1cjCIrE3UWRyRoeXh/yZ1QDv8OrXq51
-Iq+nxil7fPGUEnndI+yNccPHrATU4wPddwB0P/DvbKD7QQHddweB7scvAbofBdD9KIHuGMgJcgLC
-jTPc19EUYIa0ex7gzCxYYhu0qy+UMf0OJB6xJmThRn0QqWcC7TlMZdASOWbhR744HZ+eR4Pw6oCz
-wUY64FypbTB9nMLjR8AQrR7ajlUB8vYcjtBpGuvi1+EogJGKo7XBi64CKt7pBHRxzP20djxwTbz1
-uJ+pBbHQ1p6DoS+zqlCBX4Hol7eysoIVWN7mmbTImdPTE04H3W4XOCdJTidcXz84AOIkBg9C8ARR
-A4gGvYwDjB3CERtHXXIn1CUGMYzoYrOpz3IewQfT/9v4YOPgA3koNULY7EEIzLDu5PUXOdgg2rUr
-FWZtCuqLAu5QEM0b7BuKst4Oip4mP42E1eLWmgOi/Js4Gk5qIpwCM/IEZIdYfkqGXlaXn8pqDYtb
-xrNL4XRpcnSEIrWsXdsO/QZBSixpZnE+DJkL11t4j+t+2RCOt88PcOpN3Hcnl14PGZ8Kd4cJnwr3
-h6lxSVDW6AZWFPBPmEkeLNO+lp8iE6Q4RF8J+F+43J2h3Zk87yYDq6Kb8MIO25nUvuH560ysMZy2
-OgVLt9tw0uHnqKKccOszBl8EhJx0IXKfwGSKEx6gB4VhlohrNA6jpeO1l/BgOJK53lxv9iFxfUz4
-4unzKUzAEaFLn6P6TAwV+cD3kpok/gxFs6sDLhraDiaUBsJEa9m+ku3WN3oJd2H6iW0F1ifFlyvW
-OPggLBFHHTmoc2P9ekByMCcXDGp5mhJpPP8C++/+Gz7wfg9zu4dknftudkn5ZFZOZIJWOShl3n/p
-U2zuAAiwhGVQFrYJkTYRc/rJ22E/c2uPiFX5CKzKDf+sWJWPFzf9j8iqXPHPw48iuu2qS1TKxMQ/
-rbVSQSu3IF7JVqqL235FuuKnw2rESssKaHLpoxRnf7Fu8JlZRoN3EtfXjNnOJTFiLEdviCmFcVvi
-eczj58R9mktgLA2+NBZom5ghf2i1EtGPz2orsoYBfAJRQQ5gffGpvyZPl2fDNZxfN15mwaf8yhsM
-u1ILBp9lXvBBABAl30f6mkF7ra5kAvkF4m5FFokAAhaCTqxWFc8wtfYAaS5viVgZtuBNLV9ZtMEe
-wSqcsAWm/GAzvDqB3k+j/jXXkKxyPqNDC9JapaScRfqiYxjWc6uCpdKMVHGJ557LWx/bs0hldrgD
-iUhndrijzA5zvsR0mwrk9PVjIb4GBt1mLdrXiiVQqnCVFQeHYmcTcxFVCCKf1QFeWeYmqLv0EtRZ
-GNBBco2NuPnrhDXMXKyhbpkjviqUWJJJsy1q37UHaGKpW4weHINwkfpI44TYYXwDpGDp+P+iPyZr
-2EqgX4lIvNmxfBf2JnP1nJWoL8vxjbTsftK0pO7OpPM2iBSChm652fQO5PqXF1kYs7yx/vjVvERw
-NSeRX0iX/N1DiKNtkXHU04RhefqgICmjYn5YQFFLd+0wwb63zf7EConen5Uq42ySfmvHZbHEmHET
-cY+T72uX1JMwJiqK/gPsqUJ0US/xsqUkB+0jgKEpAC6RAk4SWYusa78OLUukOw+efGGUFS3uoSAr
-Ed76+piDm4APtU2DWKp7jidibIiec7LB/XHUtao2nX2pxY4BGrmASdTnatPhmEDhXgM41i4wOJSm
-C6ti+SYfONdBJNNXGtnZJ/jpuXT6CK94Oux0ylGEqkHHuTOxLs1A/4pvdcS3Vs7SxZFWvl50EsHQ
-sZqWVzv/jE1ESqPuY0zyZK5vKS5NJoWpcWubXEzJEn8FguGE8lp4qi60vLuTGRzskTzwxuiBR1Pl
-eC+44oTw2l4MPVcCRK7vm3XJAyakqjscihC83Lp2uYyY44FoueslF5n0Bs4tD0R3co4HohWsUrjB
-KvZ43WHWTuY/EBL4Px4Q3atEem6iDeRNLlbuWfEC5EWJ5cebeGX5q4tnFSJxLDRY9Qgon+odF2z2
-5lPy0vY1Er5juZr7EktiiUre+CayBd6LbMFnuwPZOMkwnt3VnTdIPoz3V/RyGbqpIeNmdlGGEfrZ
-CI2TaNzgJBp7F2+YWZkLOLSr6JfGdTgOv3Q1QGKGzhLDUQ0w2K4X2mtNuVIsDnTPlWMmwCpiuZMD
-PVNhViYNPwEUNVy/HwTvo93rT7AKZaI/0wyaDyXcM5OUSGSVRvLtdsgL4QsxFK2Zj3DURoJuE5do
-59D4XOMcU56b+YUBIfSWSnegT44XPk1RRZgYQa2CWeDU5mLJNVmHU2WUc3d/NrDX1/xFM/7IBRnS
-noqUghS1HuVCG3lxFaoQiZX+mi0DNICJEP8UdW4kWNKlRKwY4veRlSmr2KmKUEO4GDqOuGO8nVrU
-wl8y94WajpuLq+9XvkIvXpJWtlvZSKTy0KXS3IqcXYy+R8kwHgFvLmP5ylWlHS6qHPdE3eJdzMpr
-3m47ubJ38rD0ASvmhBX5fQBz6gU4Mxa08Scm4mbLoocLuAMYuKc3qgjnqsxO5N1riCjHQUFRMZ5g
-5JTzstw+9z7+vnAudXZzqooGd16VBr7xxspGr25ZpJZJmJL4TK0oZSHvBCcneKlXcBpIexXNwk0E
-7PWrb9za03OtI1y7C5X2/lv9g6tfF/qXcF2gn/Wlrl9tprB15mVx0UNEjt6dlfmCuXvbZxJVqsv6
-0C1bj1t4jZsXaDxJRf4rak9QgsjSgn8v9ToaZ/UPNK9IPG+rX8x8BXbPPIysPm2wRmdiKOis9kgF
-tKiGCuvINN3okrtLpAZu9+OE8hMwDpqn23O7xm0MKJNKwxC8MaAbS+bCTFv5rcCJ1L9UnSAaZCTD
-5PaldrnD6u9PHKdAVbn7OP12OtAdpRc5PVW/hNozwNxaxulInHiv2yMEW7kzPhBKSY1vfWxMY+Ue
-9SYXH/FJ3kjf6AOEXdqeSPYmDhrdhqRNSPghJfYWG8r4KTKByKpF80bAklO85mnyCQNvlRqmcaVp
-6MdiecTAVIfC6hGx2ifHLpbumxOjpAVpxzjNiAMwAGAHKrHdCseZjjW1P7kOh2eud6AR0JrRubnU
-6vMgTB+SGjZxUsOm1qKR6tfeeViyxDELqmyxyFWxexw70NcC721Cpv1yVsnAbbECrj2wYcIemXQC
-41I+9A4zbiQdXnOeAxYmipuR74TR2zvn221mn8nWXnxpHZMk0kk00WuKxPO9jcjucBze4XeuB7S4
-HYszFovfTy0f2zqQRoYfwnGZDIqaO1Nxn+5SN1w4q5Ukua3LlOUcHaZikZ1LZ+ugb7RYuU6LxKvj
-grLw6eI6Ox+qZY6mwZKeb5ifFsr7Eq4gwc/+RNZuhSmpWS9mwXwwHqLId1vvHSc1k/1PXYGms//d
-p7wwd7K5jiFGkUQ3JguLERZMmhD269VbEf+2a/iI91yrz02LISofN8W7y+LM0ii0zowbYtu93r20
-Qy8tGzte1isM6uWQ7hizaw2GQauNyetY0Do5aQWj3jAQ2ezgxXbbwj0XmVpTytRaD9hK6YbFyb79
-YaWdojG1rx1OaZNyunVYBV2H2aDojSPA3G7KBCv02r4rD034dBbTGvn7NJgQ9ZsIGtCwL2rfHhbM
-ahv8JbFLpRMIRy2eDLINTFJIeXLFmtRT/GHaDNR/hc5+BBd42RKw+PBHJtrkPLUDiDOZGK/u/+KQ
-+8M3GFme4H8OMXmjblMqybqK/S0QnbcHjTA6UgD1xfNrjaJy9E5SlpgVEDnANndKcBXBJTw7hsBk
-mwDMqgV0j6LKD9bX7blI1jFSyH70NR3AeSrqrjo22blVIaWgfND1sXY3yhFDrZgzBOfi18hdPlVR
-L6fz5FXdr/v7UsWaFGJoRweB1gfRs8PnRZiRtBUo92w1JVvjxLxlHWgODE5nOg2tloWhaiBWuWd7
-OPiFmPBRCSKGHvPrdELqpXutedIrtF/3ReqrXtuCTmW41iOVbbfCD9Q1JvUMJAwohlnUhJIFSDGz
-2V3LjEF8OjICOITGmmE+rFd3OkmqX6WDCfcxB0xdhfYWHQb5b8fsY/blZP+Bu8manH2+8E6Cpju/
-hDfkgeu9ouZLvYzkMPt/szB/ks3q+xPbd0FK49VmwDYsTULXtnvGsmig8kUbNkIo+wCUkIUgjSCK
-dCPlMClpZcZNKvaMuNuk86gVbNSFd0HrkZQO1ddAer70KBtYZkmOmvhIBSOJjlS4JgrfDLKeTknb
-5CsAp4t/f2w/hU3k6J1qdWPQYdMpVvhC07Z097A0jV+WCiWzDDT2lbeZx4xn+hYwZMKzGgzpBO+2
-+IkuXraGnyVcM2Wo0rL7eOFd+jf2nhc4BmkPMBlN8NJrlXistpsvMNL4oEBEbKs4H9Vys0LXAvnD
-MQ9K+4coh+lAE/pjcuvCC3KZkHoMzIYnk61YPpbKrhKr+KXl7YK32wn+tbNkiXf0035NIVJD04Pp
-fWQNxCRHFcOgcCmj38J3TdmoHD9wUcoKGGtJF+wWpRsFtrBlISlld6TMbNZSNklz4kstROIH7e0t
-vl/7126pqFAR/Kln63RhvGBwJLJDkah03xzzqpUtWzhLMqii1ztVbqFlUaZuqDUpR3HgghFntVpI
-8r1mJTcgDbXnD8IjLBCLYxmbKWntl2ZEawoYQ89XL2Csb+yAGoJH5L39ApPMOPbHSHG0LyRHqxha
-dCR0wjB+NHynmjyG5Zg1Hvhg0rNesBtlWGUWEMhtqTlQKfmWdtoGB7fUQsGeDjO4EcGKC3Zfzud5
-VgJpEamJr/S3q9o3e1YwyQ2/2W/8nXILqgaL3hVICX7xMrDy2moGUoBh+KzWusxfzNyZoOdqxC7R
-mj3Bf1L8p7TzhFrjyLnhas0V8Z96U4aN9/RgdqiwfG6fdHdBw4W0ggFaQ45Bcg/PKajTMXuHHxtW
-yQrZei7yZLLn/GPTPoXXKnpJFh5Sas2RWjmBNkEAm9e6AawSoDpE5J6F+mcoSM9NUxLvKAYD5y3S
-kj6zs5jia4dVomSlT7lVR3RAKXMxlSk+dTqBsP+PRUZRLHAhusfHp1ENmipn2TaWtwBb7zWLb5Br
-ZY5jwib6/9+7wN3j/SORshuRXZ3DwwYCcbO7aG62SafPS5C/1ng1GNF+BqcqvBSrV3auicX3yG2u
-4KPE9XyuiTZ5Z8uKQVm0wrZw35Ix0rYD13OhopliXEdLKxqFRSBpOG6Lda8EbPJZ3HOvPC1IVrNu
-R0g7YSVENbPvMgVrLr0oJp1LqOeKd2uq43KI3tI0XvGBmkmK7XfCJVas6pOjzIIntew0eO/NnC/M
-vTdzuvcGvSbo4hsAAysSUuhlnZxOY0svO7OTO9WqzbxsITOP8QjDJRdRmYpMLe1GlO7F9amY1XkQ
-EaIcAtYBvNUUi6ma/ygTqpk0EQFCA0hE15SWF1kNBE9ziSEPw5U3xlXTGGFyQDwOmZuKhbmI8F0I
-yF+0SjhkmLLZSL7glRDFKoqmd/YP9ke7thTy0p28Y4iGPH1TNvGiegW2Vnrx3GbH/0FOtrclxrH/
-8hBP7GrjWClSGHKlVIDL9SRf3ZYwiaMO2bIZ4JWoBfirK/9vtX62zr4fc3VJUszvk9kyFReEMZWd
-Czs/aJ8Yk30CkwjjviTw59zxdYtrPm6hVLTrCenMBr5a8UFaRXtOY6XvNuPek7pRZG5kCYzW1Rn2
-Y8Xp6fEpG7zZPoo4E5QAsLcYbCCogMrH4c/u5GTsdfS/0U3uCwXrlya37q90u5h44GVH6zCF7qgi
-mEbEGwJl5Dbsqv1ovCc+whs8hccb+fwt/QWf0MVhS+NUPBPXml3zJXoVF/xaAMo16lI+YmquYTES
-/shTwr0fVdUp4N4pmVc+DqfqEouN4o1ynmvyHeHVPGUnpMPi3pBH7nk9okLo/cBd578I6qVEpCjd
-MefWbHS6YMW/mS0VF9o1Zy52BQxK2ecIEtut8/wEAUMKH/iTMHCbbNHJZjzOV4FBtzDYq04gOkeE
-5Y5KSgr6uYFDQtWFWKgsL2Lg6nuaBTPVaupZo0fPHLpcU1u8LPjqIThSBG4CzlC4J+X3ShIx3tBp
-F08DEp7NYgbzCBq8oDGKnpx/KVpbSErCgUbfeypuRKU/X+IXLUVX1YGHdPGrez6bveAoI5dOwqTU
-VI3oTfX0kGZV2Qc2LZ0t6sYYuVYDp1G6/cB4aMTmDjixsE7i/sTbB0vP/xSpyWErzL70VY6X1oEk
-VlaGNTlq14PCsmG5szOWLLdCsz3rIeYz0kM22M78rTpmO3uI9t8dsxMM40zG/nCpkUHNxr+HsGpC
-qKag6KA5dPvJoF4Tk+3SVDAL5lDEkc59KDvwB+DUVy9rbewHNwsuG++tcNJXyiCpgtSejXu0H3Yd
-Gg08CUVVp3h6KPaPJHhxlVA9t4IgVGPbsTQJXdRoxNYG0PYcraycIYqna/Rhd8K80/o5NuiMZe7t
-7zDacziMIYhOqUP7VPoqSXxMpoO2t8ttoF0gYxcnJ6fYUuZm+z45+dvZt4rx7GR+tJRFklCiFckz
-yP1ulV/P4jQPH//7fdV5zECC7GfiZj+kepnv+A+SsdXAPZXYBQzZv4nhnCZWFjR9tiUATXSuYRC9
-Kfes9hCUiDbUDJlqENbdAIbOJamBW6dXcbiWnmXY1UWPGHYbQdhghWMeJE1Qc6MvPbMwsKNSa0S+
-jeTGrtZTuERcn5PLi2tSed+N7zbyLb8ZaMtYL/ND/up+wC42Rc5A8E4eQ1Pye1z8XnPon9QrUGyF
-YuAUIMTAh1Om2HCI8WbaeiLSRVHavim3rscRfGS5zlfx7AnKrREGIjd+fjtBn+uZirEfSKm8JyR1
-6sDJsT1iU51/piHRACulxF2qpMazCM0uJm1rxiZSqi4xNF75Dw7UtCaY7GnHrNH3juHWB9z2w6zp
-fmF7NG/TFKykF3YSi7CTHQBK4aiNkEGlBHV0xNt4WTgIiRYIITcT3eNLQFIUX5UZwobxwOa26B37
-nd/razN7NdjTUfPqhlaZJ7V13yKFGI5jmqNnofVF4KdGjZ0oxLAOKuywzSH8HrW4rE9P/dZOp+Sm
-S2PxPiTlCWgSeHN56yuUrl1IK1MD6Fd9UdYpo66kVd+0e1ZjfQVSskt0/AIkeWjJigVrzfPoXlW1
-iupXKtZwntsZkKF90YUkMQ29kMOm471AJdGVUBcG4Jw7W1UKVfwM/ojTKkRYeH/RmsEfEGPl/mGC
-ayqDzor4d1iOyF1RtKl8BHHt5e/TczFkuecNQxZJCa0xQ9HXtwuZ9/IO6lKY7AMmKwJ5AXo/83N2
-x79ht/wv7Ib/lX3i/8U2/L/ZrzxotQJ2zYPhV09O/xWffv7w/v2n/1Ocvn+/KeC/0fCr9+9v3Vdf
-B2zJ3+RjoDZh8O8AddZfAap6xR//e9g5HQ3eZ52vHrOnpkg46IVULHr/3gwO3sKj/LB9/34Yvg/g
-3fDf7/G/4P371fv3i9EWH7rR1++D7SP99ZH38RE0PKImzj4N37/P4tPiyemLUQdeZV9DiQH87WDt
-/HIkhgjP0QBrAW6WQ8A5fMQ5PApGj1kybpAQEh58+BB0YvZTd7Vc6oQaCfsdyEFoeFXMC5B5KuwY
-KIRmYd4vHo9Z8NUJnH7LTdR8rnAFUUe+i+yrxNgq/7gpV/kw6D5Ol0WR56dVuiqv14FQlfpypohX
-2pMTx1Y68SMgB2yD7DoMiorumNPP1/F6EqCVU7/pPp7ln1DVgZ663Vf4G511u28uf7t88+7yObDL
-VlnAIBUW7oofQML0xxt0gJNPlBJ9QazooP5qiLHnuCCwEg2mg37KsxAzSMTZC2T17xYp7FqwWRd/
-gx7uC3hHWQyTnbUdHxQTk0I7u57qdJWPkcdfXarOT072fgr1sFgD1ctQdkNW/d3lm99evv6ZB+fd
-b7rAJ8V6qXgKD5N8BrtQ2YsmX1E+J5VpwYI4i/b5ahkMCpa1u/N8Nc7769WdGtFYbEJYdNfLab4o
-P+N17Yaby8L7HbQc7chtEO8TSLtq7dBOBQ1WVTzOefByQXd2q4/C+qS/q4SHOWCmWHRVedum8L4Z
-CL7G4gvgMPeUlo5cMV4mTW7DwaBhRnS3QE99iKnR1WaxB27U3s6Bd2NmRhyOCt6AjYaJm+H5iGL6
-xKcBAdoMz4UANP0FWOFuAI3Ml9lmlj9D923cF/uZ9ggjedcTa8NFATgjH3D2P9HTL1gknHSzcoVt
-292YW1LwiNBXM3KKFVVgud02HK/UgH4mbJRW7Z71NbY/4DJinse9pruxuv3OGO7YGnCqgs8E5y55
-NcSWsINzzE56n/Oy+xvhObqWQt7MU8WLLFnKFCLuOyc6p5vCbqxzdUFAZLNG0ZzrSiKH55zXKrCV
-VYjytiLNX4ls2TLd4orZhsIFX2ECV8ziyhe73bw7ni0TWJk5kQ34892r10+fvOJzcaXJnIvv/Tmw
-VhrAzH5utyKBJsPvcru52Xi7Fq3fHC/DoxaBb55L6KKfcrMxDqUGW0yV5B+5yKWWyBf2GLCYrMob
-71cC8JgtY4Sbj5ikbcc+mjNjj5RViuiM87VFavBGiCpUA6X1XvIz4FA0F7a8uO4vgQOb8Wq4HLEZ
-wjOdFwxPXQ9nIzU3+AmYRp6lj/JvWj9D6iintxkaH9aYaWg5u2nU2EF1+fWFnAjOFAj17grA14BH
-4oBH4oFHguBxJcDjirLvoa6g4LhsV/r0mn0clIihXi5QflJwWUQ9+Va/YXMYiLwdA7rsEhnm9/Cn
-57MGLFFhngL9Ci3c9bLqdEaY+zIYsRiGqZz47u4o9xga2NSLWbnIF0t49c1I00zgTPP1y8X1Zu1I
-eVY/bgYP7BCvIthcA0oBfO1V1XwtsrBj6NMmgUQHgEXayyElQGKQs2jkjfJP18uVvAi0xiE9I+Qo
-UA6DJRa/qr793h6Ky4tFzC6nT4v86350EWYKU2LLa8qCZuL0oEjoVNJ8iV0c5u52W6NoHqZliQI8
-tSPqLpLm3ohsYs4qSWVvQZJa3ra55Sp9cqJeqp6clhAv7KGymFJY1O0+gc83+R+vpWXwj59efb9e
-X7+B1curdRQGP5Xpalkti3UXP719+0uA9AmQB3Bb312+Be6JrhgJ0N9xVcJJL+f5W7zOCSP+MXrS
-/xAGCNuPgffGdBvY1gIZxTvMopenE/In9QAkE0mdqBjpjeGk/pVOfIjqVKy5qdCmcbbdYrjUN2dn
-kb87VL+6hr3L3+LlC0R/WrWbuZ4tN7OMfENx+YCLEjpaHRSYwJaYPKzdKkeXQaSIOwty96TFkTc9
-ZsuU5GnExJcz0oFXT+/exmO6nSfQYB03NoPBuiKeLuaYgkE7FcQXST8mg28B4hHLtQGQllucGdm2
-Dra1VFJ4o6mbhAfjfWsbkWE+HkBapIYziXlJa255vtT7pO3KutVKx7LVgFV8Bjjt1zYPtdqLfPX9
-259eGbEPtyIyUbk4lB2TYI0GuBtY2VdkIMhXA/9FGDx//ROhcngHncN5snYQr/Hpxes18IhUKwyW
-CxyiXSbykKEax36pEbNjyeMszrB93cbJiXjXjefZQPwMa6jZWbRd1CO52MGTbgExtP8BpcneUg==
-"""
+def coffee(source):
+    return coffee_context().call("CoffeeScript.compile", source)
+
+def coffee_async(source):
+    """ Returns a coroutine compiling source, concurrency is bounded by pejis' _aio.MAX_CONCURRENCY """
+    from ._aio import call
+    return call(coffee_context(), "CoffeeScript.compile", source)
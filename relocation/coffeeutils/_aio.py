@@ -0,0 +1,61 @@
+"""
+asyncio support for pejis (python 3.7+ only, imported lazily by the *_async methods).
+"""
+import sys
+if sys.version_info < (3, 7):
+    raise ImportError('pejis async support needs python 3.7+ (asyncio.get_running_loop)')
+
+import asyncio
+import functools
+import weakref
+
+from .pejis import RuntimeUnavailable
+
+# Maximal number of JS runtime subprocesses running concurrently per event loop
+MAX_CONCURRENCY = 8
+_semaphores = weakref.WeakKeyDictionary()
+
+def set_concurrency(limit):
+    global MAX_CONCURRENCY
+    MAX_CONCURRENCY = limit
+    _semaphores.clear()
+
+def _limit():
+    loop = asyncio.get_running_loop()
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENCY)
+    return _semaphores[loop]
+
+async def compile(runtime, source):
+    if not runtime.is_available():
+        raise RuntimeUnavailable()
+    return runtime.Context(runtime, source)
+
+async def exec_(context, source):
+    runtime = context._runtime
+    if not runtime.is_available():
+        raise RuntimeUnavailable()
+    program = context._program(source)
+    async with _limit():
+        if runtime.use_stdin:
+            output = await _exec(runtime, runtime._binary() + runtime._stdin_args, program.encode(runtime._encoding))
+        else:
+            output = await in_executor(context._execfile, program)
+    return context._parse_output(output)
+
+async def _exec(runtime, cmd, input):
+    p = await asyncio.create_subprocess_exec(
+        *cmd, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT)
+    stdoutdata, _ = await p.communicate(input)
+    return runtime._check_output(await p.wait(), stdoutdata)
+
+def in_executor(func, *args):
+    """ Runs a blocking call (e.g an in-process runtime) on the default executor """
+    return asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+async def call(context, identifier, *args):
+    """ call_async for any context, falls back to the executor when the runtime has no async support """
+    if hasattr(context, 'call_async'):
+        return await context.call_async(identifier, *args)
+    async with _limit():
+        return await in_executor(context.call, identifier, *args)
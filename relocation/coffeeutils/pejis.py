@@ -1,16 +1,21 @@
-import sys
 import os
 import os.path
 import io
 import tempfile
 from subprocess import Popen, PIPE, STDOUT
 import json
+import threading
 from collections import OrderedDict
 
 class Error(Exception): pass
 class RuntimeError(Error): pass
 class ProgramError(Error): pass
 class RuntimeUnavailable(RuntimeError): pass
+# The runtime itself failed (exited non-zero, was killed, ran out of memory or time), not the program
+class RuntimeFailure(RuntimeError): pass
+
+# Resolved runtime binaries are kept in the environment so forked/spawned workers don't look them up again
+BINARY_CACHE_ENV = 'PEJIS_BINARY_CACHE'
 
 def get(name=None):
     """
@@ -35,8 +40,11 @@ def runtimes():
     return dict(_runtimes)
 
 def _auto_detect():
+    if _auto_detected:
+        return _auto_detected[0]
     for runtime in _runtimes.values():
         if runtime.is_available():
+            _auto_detected.append(runtime)
             return runtime
 
     raise RuntimeUnavailable("Could not find a JavaScript runtime. " +
@@ -52,11 +60,20 @@ def compile(source):
     return get().compile(source)
 
 class ExternalRuntime:
-    def __init__(self, name, command, runner_source, encoding='utf8'):
+    """
+    command is either a single command (a string or an argument list) or a tuple of
+    alternative commands, the first one found on PATH is used.
+    stdin_args are the arguments that make the runtime read the program from stdin. When
+    given (and use_stdin is left on) programs are piped instead of written to a temp file.
+    """
+    def __init__(self, name, command, runner_source, encoding='utf8', stdin_args=None):
         self._name = name
         self._command = command
+        self._commands = command if isinstance(command, tuple) else (command,)
         self._runner_source = runner_source
         self._encoding = encoding
+        self._stdin_args = stdin_args
+        self.use_stdin = stdin_args is not None
 
     def __str__(self):
         return "{class_name}({runtime_name})".format(
@@ -83,26 +100,62 @@ class ExternalRuntime:
             raise RuntimeUnavailable()
         return self.Context(self, source)
 
+    def exec_async(self, source):
+        return self.Context(self).exec_async(source)
+
+    def eval_async(self, source):
+        return self.Context(self).eval_async(source)
+
+    def compile_async(self, source):
+        from . import _aio
+        return _aio.compile(self, source)
+
     def is_available(self):
         return self._binary() is not None
 
     def _binary(self):
         """protected"""
         if not hasattr(self, "_binary_cache"):
-            self._binary_cache = self._which(self._command)
+            self._binary_cache = self._cached_which()
         return self._binary_cache
 
+    def _cached_which(self):
+        """protected"""
+        key = repr(self._commands)
+        cache = json.loads(os.environ.get(BINARY_CACHE_ENV) or '{}')
+        binary = cache.get(key)
+        if binary is not None and os.access(binary[0], os.X_OK):
+            return binary
+        for command in self._commands:
+            binary = self._which(command)
+            if binary is not None:
+                break
+        cache[key] = binary
+        os.environ[BINARY_CACHE_ENV] = json.dumps(cache)
+        return binary
+
     def _execfile(self, filename):
         """protected"""
-        cmd = self._binary() + [filename]
-        p = Popen(cmd, stdout=PIPE, stderr=STDOUT)
-        stdoutdata, stderrdata = p.communicate()
+        return self._exec(self._binary() + [filename])
+
+    def _execstdin(self, program):
+        """protected"""
+        return self._exec(self._binary() + self._stdin_args, program.encode(self._encoding))
+
+    def _exec(self, cmd, input=None):
+        """protected"""
+        p = Popen(cmd, stdin=PIPE if input is not None else None, stdout=PIPE, stderr=STDOUT)
+        stdoutdata, stderrdata = p.communicate(input)
         ret = p.wait()
         del p
-        if ret == 0:
+        return self._check_output(ret, stdoutdata)
+
+    def _check_output(self, returncode, stdoutdata):
+        """protected"""
+        if returncode == 0:
             return stdoutdata
         else:
-            raise RuntimeError(stdoutdata)
+            raise RuntimeFailure('exit status %s: %s' % (returncode, stdoutdata))
 
     def _which(self, command):
         """protected"""
@@ -112,13 +165,16 @@ class ExternalRuntime:
         name = command[0]
         args = command[1:]
 
-        p = Popen("command -v %s" % (name,), stdout=PIPE, stderr=PIPE, shell=True)
-        stdoutdata, _ = p.communicate()
-        stdoutdata = stdoutdata.decode(sys.getfilesystemencoding())
-        path = stdoutdata.strip().split('\n')[0]
-        if not path:
-            return None
-        return [path] + args
+        # Searching PATH ourselves instead of forking a shell for "command -v"
+        if os.path.dirname(name):
+            candidates = [name]
+        else:
+            candidates = [os.path.join(directory, name)
+                          for directory in os.environ.get('PATH', os.defpath).split(os.pathsep) if directory]
+        for path in candidates:
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return [os.path.abspath(path)] + args
+        return None
 
 
     class Context:
@@ -127,35 +183,65 @@ class ExternalRuntime:
             self._source = source
 
         def eval(self, source, options={}):
+            return self.exec_(self._eval_code(source), options=options)
+
+        def exec_(self, source, options = {}):
+            program = self._program(source)
+            if self._runtime.use_stdin:
+                output = self._runtime._execstdin(program)
+            else:
+                output = self._execfile(program)
+            return self._parse_output(output)
+
+        def call(self, identifier, *args):
+            return self.eval(self._call_code(identifier, args))
+
+        def exec_async(self, source):
+            """ Returns a coroutine running the program on an asyncio subprocess """
+            from . import _aio
+            return _aio.exec_(self, source)
+
+        def eval_async(self, source):
+            return self.exec_async(self._eval_code(source))
+
+        def call_async(self, identifier, *args):
+            return self.eval_async(self._call_code(identifier, args))
+
+        def _eval_code(self, source):
+            """protected"""
             if not source.strip():
                 data = "''"
             else:
                 data = "'('+" + json.dumps(source, ensure_ascii=True) + "+')'"
+            return 'return eval({data})'.format(data=data)
 
-            code = 'return eval({data})'.format(data=data)
-            return self.exec_(code, options=options)
+        def _call_code(self, identifier, args):
+            """protected"""
+            return "{identifier}.apply(this, {args})".format(identifier=identifier, args=json.dumps(args))
 
-        def exec_(self, source, options = {}):
+        def _program(self, source):
+            """protected"""
             if self._source:
                 source = self._source + '\n' + source
+            return self._compile(source)
 
+        def _parse_output(self, output):
+            """protected"""
+            output = output.decode(self._runtime._encoding)
+            output = output.replace("\r\n", "\n").replace("\r", "\n")
+            return self._extract_result(output.split("\n")[-2])
+
+        def _execfile(self, program):
+            """protected"""
             (fd, filename) = tempfile.mkstemp(prefix='execjs', suffix='.js')
             os.close(fd)
             try:
                 with io.open(filename, "w+", encoding=self._runtime._encoding) as fp:
-                    fp.write(self._compile(source))
-                output = self._runtime._execfile(filename)
+                    fp.write(program)
+                return self._runtime._execfile(filename)
             finally:
                 os.remove(filename)
 
-            output = output.decode(self._runtime._encoding)
-            output = output.replace("\r\n", "\n").replace("\r", "\n")
-            return self._extract_result(output.split("\n")[-2])
-
-        def call(self, identifier, *args):
-            args = json.dumps(args)
-            return self.eval("{identifier}.apply(this, {args})".format(identifier=identifier, args=args))
-
         def _compile(self, source):
             """protected"""
             runner_source = self._runtime._runner_source
@@ -200,14 +286,91 @@ def encode_unicode_codepoints(str):
             return codepoint_format(ord=o)
     return ''.join(map(codepoint, str))
 
+class MiniRacerRuntime:
+    """
+    In-process V8 through py_mini_racer. A compiled context keeps a warm MiniRacer per
+    thread with its source already evaluated, so calls don't pay for loading it again.
+    """
+    @property
+    def name(self):
+        return "MiniRacer (V8)"
+
+    def exec_(self, source):
+        return self.Context(self).exec_(source)
+
+    def eval(self, source):
+        return self.Context(self).eval(source)
+
+    def compile(self, source):
+        if not self.is_available():
+            raise RuntimeUnavailable()
+        return self.Context(self, source)
+
+    def compile_async(self, source):
+        from . import _aio
+        return _aio.compile(self, source)
+
+    def is_available(self):
+        if not hasattr(self, "_is_available"):
+            try:
+                import py_mini_racer ; py_mini_racer # appease pyflakes
+            except ImportError:
+                self._is_available = False
+            else:
+                self._is_available = True
+        return self._is_available
+
+
+    class Context:
+        def __init__(self, runtime, source=""):
+            self._source = source
+            self._local = threading.local()
+
+        def exec_(self, source):
+            return self._run(u'(function() {{ {0}; }})()'.format(source))
+
+        def eval(self, source):
+            if not source.strip():
+                return self._run(u"''")
+            return self._run(u'(' + source + u')')
+
+        def call(self, identifier, *args):
+            args = json.dumps(args)
+            return self.eval("{identifier}.apply(this, {args})".format(identifier=identifier, args=args))
+
+        def _racer(self):
+            """protected"""
+            racer = getattr(self._local, 'racer', None)
+            if racer is None:
+                from py_mini_racer import py_mini_racer
+                racer = py_mini_racer.MiniRacer()
+                if self._source:
+                    self._eval(racer, self._source)
+                self._local.racer = racer
+            return racer
+
+        def _run(self, source):
+            """protected"""
+            return self._eval(self._racer(), source)
+
+        @staticmethod
+        def _eval(racer, source):
+            """protected"""
+            from py_mini_racer import py_mini_racer
+            try:
+                return racer.eval(source)
+            except py_mini_racer.JSParseException as e:
+                raise RuntimeError(e)
+            except (py_mini_racer.JSOOMException, py_mini_racer.JSTimeoutException) as e:
+                raise RuntimeFailure(e)
+            except py_mini_racer.JSEvalException as e:
+                # "Uncaught SyntaxError: ... at undefined:1:0\n<stack>" -> "SyntaxError: ..."
+                value = str(e).split('\n', 1)[0].replace('Uncaught ', '', 1).rsplit(' at undefined:', 1)[0]
+                if value.startswith('SyntaxError:'):
+                    raise RuntimeError(value)
+                raise ProgramError(value)
+
 class PyV8Runtime:
-    def __init__(self):
-        try:
-            import PyV8 ; PyV8 # appease pyflakes
-        except ImportError:
-            self._is_available = False
-        else:
-            self._is_available = True
 
     @property
     def name(self):
@@ -223,6 +386,13 @@ class PyV8Runtime:
         return self.Context(self, source)
 
     def is_available(self):
+        if not hasattr(self, "_is_available"):
+            try:
+                import PyV8 ; PyV8 # appease pyflakes
+            except ImportError:
+                self._is_available = False
+            else:
+                self._is_available = True
         return self._is_available
 
 
@@ -283,13 +453,13 @@ class PyV8Runtime:
 
 
 _runtimes = OrderedDict()
+_auto_detected = []
+_runtimes['MiniRacer'] = MiniRacerRuntime()
 _runtimes['PyV8'] = PyV8Runtime()
-
-for command in ["nodejs", "node"]:
-    _runtimes["Node"] = runtime = ExternalRuntime(
-        name = "Node.js (V8)",
-        command = [command],
-        runner_source = u"""(function(program, execJS) { execJS(program) })(function(module, exports, require) { #{source}
+_runtimes["Node"] = ExternalRuntime(
+    name = "Node.js (V8)",
+    command = (["nodejs"], ["node"]),
+    runner_source = u"""(function(program, execJS) { execJS(program) })(function(module, exports, require) { #{source}
 }, function(program) {
   var output;
   var print = function(string) {
@@ -312,10 +482,6 @@ for command in ["nodejs", "node"]:
   }
 });
 """,
-        encoding='UTF-8',
-    )
-    if runtime.is_available():
-        break
-
-del command
-del runtime
+    encoding='UTF-8',
+    stdin_args=['-'],
+)
@@ -0,0 +1,342 @@
+"""
+Persistent cache backends, so restarted workers don't recompile (or refetch) every section.
+
+DiskCache stores each entry in its own file, named by the sha1 of its key and sharded into
+two directory levels. Files are written to a temporary name and renamed into place, so
+readers (which mmap the file) always see a whole entry, and any number of processes can
+share the directory. The directory is kept under MAX_SIZE bytes by evicting the least
+recently used files (hits touch the file's mtime). Entries don't expire unless the cache
+has a TIMEOUT (or they're set with a timeout), the size bound is what evicts them.
+
+TieredCache reads through a list of cache aliases, nearest first, filling the nearer tiers
+on a hit in a further one (for what's left of the entry's timeout):
+
+    CACHES = {
+        'default': {...memcached...},
+        'relocation_disk': {
+            'BACKEND': 'relocation.diskcache.DiskCache',
+            'LOCATION': '/var/cache/relocation',
+            'OPTIONS': {'MAX_SIZE': 256 * 1024 * 1024},
+        },
+        'relocation': {
+            'BACKEND': 'relocation.diskcache.TieredCache',
+            'OPTIONS': {'TIERS': ['relocation_disk', 'default']},
+        },
+    }
+    RELOCATION_CACHE = 'relocation'
+"""
+import os
+import mmap
+import time
+import errno
+import shutil
+import struct
+import hashlib
+import tempfile
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from django.core.cache.backends.base import BaseCache
+
+from .cache import NotFound, get_cache
+
+EXPIRY = struct.Struct('>d')
+TEMP_PREFIX = '.tmp-'
+LOCK_NAME = '.lock'
+ADD_LOCK_NAME = '.add-lock'
+LOCK_NAMES = (LOCK_NAME, ADD_LOCK_NAME)
+
+# bytes written per directory since it was last culled, shared by this process' instances
+_written = {}
+_written_lock = threading.Lock()
+
+class DiskCache(BaseCache):
+    """
+    TIMEOUT defaults to None: entries are kept until culled.
+    OPTIONS:
+        MAX_SIZE - bytes kept on disk (default 256MB)
+        CULL_TARGET - fraction of MAX_SIZE left after a cull (default 0.9)
+        TOUCH_INTERVAL - seconds between mtime updates of a file being read (default 60)
+    """
+    def __init__(self, dir, params):
+        BaseCache.__init__(self, params)
+        if 'timeout' not in params and 'TIMEOUT' not in params:
+            # Not django's 300 seconds, compiled sections are worth keeping
+            self.default_timeout = None
+        options = params.get('OPTIONS', {})
+        self._dir = os.path.abspath(dir)
+        self._max_size = int(options.get('MAX_SIZE', 256 * 1024 * 1024))
+        self._cull_target = float(options.get('CULL_TARGET', 0.9))
+        self._touch_interval = float(options.get('TOUCH_INTERVAL', 60))
+        if not os.path.isdir(self._dir):
+            try:
+                os.makedirs(self._dir)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+
+    def _key_to_file(self, key):
+        digest = hashlib.sha1(key.encode('utf8') if not isinstance(key, bytes) else key).hexdigest()
+        return os.path.join(self._dir, digest[:2], digest[2:4], digest[4:])
+
+    def _read(self, fname):
+        """ returns (expiry, value) or None """
+        try:
+            with open(fname, 'rb') as f:
+                st = os.fstat(f.fileno())
+                if st.st_size <= EXPIRY.size:
+                    return None
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            return None
+        try:
+            expiry, = EXPIRY.unpack_from(data)
+            if expiry < time.time():
+                return expiry, None
+            value = pickle.loads(data[EXPIRY.size:])
+        except Exception:
+            return None
+        finally:
+            data.close()
+        if st.st_mtime < time.time() - self._touch_interval:
+            try:
+                os.utime(fname, None)
+            except OSError:
+                pass
+        return expiry, value
+
+    def _write(self, fname, value, timeout):
+        """ returns the name of a temporary file holding the entry, next to fname """
+        # like django 1.4's backends, 0 is the default timeout too
+        if not timeout:
+            timeout = self.default_timeout
+        dirname = os.path.dirname(fname)
+        if not os.path.isdir(dirname):
+            try:
+                os.makedirs(dirname)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+        fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=dirname)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(EXPIRY.pack(float('inf') if timeout is None else time.time() + timeout))
+                pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+                size = f.tell()
+        except:
+            self._remove(tmp)
+            raise
+        self._wrote(size)
+        return tmp
+
+    def _remove(self, fname):
+        try:
+            os.remove(fname)
+        except OSError:
+            pass
+
+    def get(self, key, default=None, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        entry = self._read(self._key_to_file(key))
+        if entry is None or entry[1] is None:
+            return default
+        return entry[1]
+
+    def set(self, key, value, timeout=None, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        fname = self._key_to_file(key)
+        try:
+            os.rename(self._write(fname, value, timeout), fname)
+        except (IOError, OSError):
+            pass
+
+    def add(self, key, value, timeout=None, version=None):
+        """
+        atomic across processes: the entry is hard linked into place, which fails if it exists.
+        An expired entry is replaced under the directory's add lock, so only one process does.
+        """
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        fname = self._key_to_file(key)
+        try:
+            tmp = self._write(fname, value, timeout)
+        except (IOError, OSError):
+            return False
+        try:
+            if self._link(tmp, fname):
+                return True
+            with self._locked(ADD_LOCK_NAME):
+                entry = self._read(fname)
+                if entry is not None and entry[1] is not None:
+                    return False
+                # expired (or just removed), it's fine to replace it
+                self._remove(fname)
+                return self._link(tmp, fname)
+        except (IOError, OSError):
+            return False
+        finally:
+            self._remove(tmp)
+
+    def _link(self, tmp, fname):
+        try:
+            os.link(tmp, fname)
+            return True
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+            return False
+
+    @contextmanager
+    def _locked(self, name, blocking=True):
+        """ Holds an exclusive flock of the directory's lock file name, yields False when not blocking and it's taken """
+        lock = open(os.path.join(self._dir, name), 'a')
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+                except IOError:
+                    yield False
+                    return
+            yield True
+        finally:
+            lock.close()
+
+    def ttl(self, key, version=None):
+        """ Seconds left before the entry expires, None when it doesn't, NotFound when there's none """
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        entry = self._read(self._key_to_file(key))
+        if entry is None or entry[1] is None:
+            return NotFound
+        return None if entry[0] == float('inf') else entry[0] - time.time()
+
+    def delete(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        self._remove(self._key_to_file(key))
+
+    def has_key(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        entry = self._read(self._key_to_file(key))
+        return entry is not None and entry[1] is not None
+
+    def clear(self):
+        for name in os.listdir(self._dir):
+            if name not in LOCK_NAMES:
+                shutil.rmtree(os.path.join(self._dir, name), ignore_errors=True)
+        with _written_lock:
+            _written.pop(self._dir, None)
+
+    def _wrote(self, size):
+        with _written_lock:
+            written = _written[self._dir] = _written.get(self._dir, 0) + size
+            if written < self._max_size * (1 - self._cull_target):
+                return
+            _written[self._dir] = 0
+        self.cull()
+
+    def files(self):
+        """ (mtime, size, path) of the entries """
+        for dirpath, dirnames, filenames in os.walk(self._dir):
+            for name in filenames:
+                if name in LOCK_NAMES:
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield st.st_mtime, st.st_size, path
+
+    def cull(self):
+        """
+        Evicts the least recently used entries down to CULL_TARGET of MAX_SIZE.
+        Only one process culls at a time, the others skip it.
+        """
+        with self._locked(LOCK_NAME, blocking=False) as locked:
+            if not locked:
+                return
+            entries = list(self.files())
+            total = sum(size for mtime, size, path in entries)
+            if total <= self._max_size:
+                return
+            target = self._max_size * self._cull_target
+            now = time.time()
+            for mtime, size, path in sorted(entries):
+                if total <= target:
+                    break
+                # temporary files younger than a minute may be still being written
+                if os.path.basename(path).startswith(TEMP_PREFIX) and mtime > now - 60:
+                    continue
+                self._remove(path)
+                total -= size
+
+# What TieredCache stores: the value and when it expires (None for the tiers' default timeout, given as None or 0),
+# so the nearer tiers are filled for what's left of it
+TieredEntry = namedtuple('TieredEntry', 'expiry value')
+
+class TieredCache(BaseCache):
+    """
+    OPTIONS:
+        TIERS - cache aliases, nearest (e.g a DiskCache) first and the shared one last
+    add() is decided by the last tier, so it stays a lock shared by all the workers.
+    Values are stored as TieredEntry, values the tiers got otherwise are read as they are.
+    """
+    def __init__(self, location, params):
+        BaseCache.__init__(self, params)
+        self._tiers = [get_cache(alias) for alias in params.get('OPTIONS', {})['TIERS']]
+
+    def get(self, key, default=None, version=None):
+        for i, tier in enumerate(self._tiers):
+            entry = tier.get(key, NotFound, version=version)
+            if entry is NotFound:
+                continue
+            value, timeout = entry, None
+            if isinstance(entry, TieredEntry):
+                value = entry.value
+                if entry.expiry is not None:
+                    remaining = entry.expiry - time.time()
+                    if remaining <= 0:
+                        continue
+                    # a nearer tier given 0 would keep it for its default timeout
+                    timeout = max(1, int(remaining))
+            for nearer in self._tiers[:i]:
+                nearer.set(key, entry, timeout, version=version)
+            return value
+        return default
+
+    def _entry(self, value, timeout):
+        return TieredEntry(None if not timeout else time.time() + timeout, value)
+
+    def set(self, key, value, timeout=None, version=None):
+        entry = self._entry(value, timeout)
+        for tier in self._tiers:
+            tier.set(key, entry, timeout, version=version)
+
+    def add(self, key, value, timeout=None, version=None):
+        entry = self._entry(value, timeout)
+        if not self._tiers[-1].add(key, entry, timeout, version=version):
+            return False
+        for tier in self._tiers[:-1]:
+            tier.set(key, entry, timeout, version=version)
+        return True
+
+    def delete(self, key, version=None):
+        for tier in self._tiers:
+            tier.delete(key, version=version)
+
+    def clear(self):
+        for tier in self._tiers:
+            tier.clear()
@@ -1,10 +1,16 @@
+import json
+
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseNotModified
 from django.template.base import add_to_builtins, RequestContext
 
-from ..processors import EXTERNIFY_SECTION_RULES
-from ..utils import buf_to_unicode, load_function
+from ..bundling import base_section_name
+from ..cache import get_cache
+from ..processors import CACHE_NAME, EXTERNIFY_SECTION_RULES, section_key, section_reference
+from ..utils import buf_to_bytes, buf_to_unicode, load_function
+from .sections_only import sections_only_template
+from .templatetags import install_section_collector
 from relocation import perform_relocation
 
 def load_settings_function(settings_name, default_function=None):
@@ -24,16 +30,123 @@ def default_get_context(request, template_name):
 get_context = load_settings_function('RELOCATION_GET_CONTEXT', default_get_context)
 load_template = load_settings_function('RELOCATION_LOAD_TEMPLATE', default_load_template)
 externified_response = load_settings_function('RELOCATION_EXTERNIFIED_RESPONSE',
-    lambda template_name, section, data: HttpResponse(data, mimetype=EXTERNIFY_SECTION_RULES[section].mimetype))
+    lambda template_name, section, data: HttpResponse(data, content_type=EXTERNIFY_SECTION_RULES[base_section_name(section)].mimetype))
+# Render only the relocate blocks (and the tags around them) to serve externified sections, a section
+# which doesn't match its url's hash is rendered again in full (tags may behave differently when pruned)
+EXTERNIFY_SECTIONS_ONLY = getattr(settings, 'RELOCATION_EXTERNIFY_SECTIONS_ONLY', False)
+# Hashed externified urls never change their content
+EXTERNIFY_MAX_AGE = getattr(settings, 'RELOCATION_EXTERNIFY_MAX_AGE', 365*24*60*60)
+# Seconds the data of an externified url is kept in the RELOCATION_CACHE, so it's served
+# without rendering (its key is the data's hash or source key, see processors.record_source_keys)
+EXTERNIFY_CACHE_TIMEOUT = getattr(settings, 'RELOCATION_EXTERNIFY_CACHE_TIMEOUT', 30*24*60*60)
+# Relocate the rendered pages as UTF-8 bytes, see relocation.engine.BytesRelocationSerializer
+RELOCATE_BYTES = getattr(settings, 'RELOCATION_BYTES', False)
+
+def relocatable(rendered):
+    return rendered.encode('utf8') if RELOCATE_BYTES else rendered
+
+def render_and_relocate(template_name, context):
+    """ returns (main, sections). relocate tags collect straight into the sections with RELOCATION_DIRECT_SECTIONS """
+    sections = install_section_collector(context)
+    return perform_relocation(template_name, relocatable(load_template(template_name).render(context)), sections)
+
+def render_sections(template_name, context):
+    """
+    Like render_and_relocate, but the main document's text and variables aren't rendered
+    (see sections_only), for when only the sections are needed
+    """
+    sections = install_section_collector(context)
+    template = sections_only_template(load_template(template_name))
+    return perform_relocation(template_name, relocatable(template.render(context)), sections)
 
 def render_to_string(template_name, context):
-    main, sections = perform_relocation(template_name, load_template(template_name).render(context))
+    main, sections = render_and_relocate(template_name, context)
     return buf_to_unicode(main)
 
+def render_to_response(template_name, context, **response_kwargs):
+    """ HttpResponse of the relocated page, encoded straight from the buffers (no joined text in between) """
+    main, sections = render_and_relocate(template_name, context)
+    return HttpResponse(buf_to_bytes(main), **response_kwargs)
+
+def render_fragment(template_name, context, known_hashes=(), section_names=None):
+    """
+    Renders a component fragment (e.g for an AJAX response), returns:
+        dict(html=<main>, sections={name: dict(hash=.., reference=.., data=..)})
+    data is None for sections whose hash is in known_hashes, so clients can skip assets they
+    already have. reference is the externify reference when there's a rule for the section.
+    By default only the sections with externify rules are returned.
+    """
+    main, sections = render_and_relocate(template_name, context)
+    if section_names is None:
+        section_names = EXTERNIFY_SECTION_RULES.keys()
+    fragment_sections = dict()
+    for name in section_names:
+        if name not in sections:
+            continue
+        data_hash = section_key(sections, name)
+        rule = EXTERNIFY_SECTION_RULES.get(name)
+        fragment_sections[name] = dict(
+            hash=data_hash,
+            reference=section_reference(rule, template_name, name, sections) if rule else None,
+            data=None if data_hash in known_hashes else buf_to_unicode(sections[name]),
+        )
+    return dict(html=buf_to_unicode(main), sections=fragment_sections)
+
+def fragment_response(request, template_name, context=None):
+    """
+    JSON response of render_fragment. The hashes the client already has are taken from
+    the "known" query parameter (may repeat) or a comma separated X-Relocation-Known header.
+    """
+    known_hashes = set(request.GET.getlist('known'))
+    known_hashes.update(filter(None, request.META.get('HTTP_X_RELOCATION_KNOWN', '').split(',')))
+    if context is None:
+        context = get_context(request, template_name)
+    fragment = render_fragment(template_name, context, known_hashes)
+    return HttpResponse(json.dumps(fragment), content_type='application/json')
+
+def etag_matches(request, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    return if_none_match.strip() == '*' or etag in (tag.strip() for tag in if_none_match.split(','))
+
+def immutable(response, data_hash):
+    response['ETag'] = '"%s"' % data_hash
+    response['Cache-Control'] = 'public, max-age=%d, immutable' % EXTERNIFY_MAX_AGE
+    return response
+
+def externified_cache_key(section, data_hash):
+    return 'externified_%s_%s' % (section, data_hash)
+
 def externified_view(request, template_name, section, data_hash=""):
-    ## TODO: verify result with data_hash - less important since cache key is already effected by url
-    main, sections = perform_relocation(template_name, load_template(template_name).render(get_context(request, template_name)))
-    return externified_response(template_name, section, buf_to_unicode(sections[section]))
+    """
+    The url's data_hash is the section's content hash or source key, so a browser revalidating it
+    (If-None-Match) is answered before rendering. There's no Last-Modified, the hash is all there is
+    to compare. The data of a hash is cached for EXTERNIFY_CACHE_TIMEOUT, otherwise the template is
+    rendered (compiling its sections).
+    """
+    if data_hash and etag_matches(request, '"%s"' % data_hash):
+        return immutable(HttpResponseNotModified(), data_hash)
+    if data_hash and EXTERNIFY_CACHE_TIMEOUT:
+        data = get_cache(CACHE_NAME).get(externified_cache_key(section, data_hash))
+        if data is not None:
+            return immutable(externified_response(template_name, section, data), data_hash)
+    render = render_sections if EXTERNIFY_SECTIONS_ONLY else render_and_relocate
+    main, sections = render(template_name, get_context(request, template_name))
+    actual_hash = data_hash and section_key(sections, section)
+    if actual_hash != data_hash and render is render_sections:
+        main, sections = render_and_relocate(template_name, get_context(request, template_name))
+        actual_hash = section_key(sections, section)
+    data = buf_to_unicode(sections[section])
+    response = externified_response(template_name, section, data)
+    if not data_hash:
+        return response
+    if actual_hash == data_hash:
+        if EXTERNIFY_CACHE_TIMEOUT:
+            get_cache(CACHE_NAME).set(externified_cache_key(section, data_hash), data, EXTERNIFY_CACHE_TIMEOUT)
+        return immutable(response, data_hash)
+    # An outdated url (the template changed since it was referenced), its content isn't final
+    response['ETag'] = '"%s"' % actual_hash
+    response['Cache-Control'] = 'no-cache'
+    return response
 
 def relocation_add_to_builtins():
     add_to_builtins('relocation.djangoutils.templatetags')
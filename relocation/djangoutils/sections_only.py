@@ -0,0 +1,103 @@
+"""
+Section-only rendering: a copy of a template whose main document text and variables are
+pruned, keeping the relocate blocks and the tags around them (loops, conditions, blocks,
+extends and includes, which are pruned in turn). Used to serve externified sections
+without rendering the whole page.
+
+Tags unknown here are kept as they are (e.g a {% cache %} fragment must not store a pruned
+rendering), so only the nodes of CONTAINERS are pruned. {% ifchanged %} compares its rendered
+content, it's kept whole too. Tags may still behave differently around pruned content, see
+relocation.djangoutils.externified_view.
+"""
+import copy
+
+from django.conf import settings
+from django.template.base import NodeList, TextNode, VariableNode
+from django.template.defaulttags import (AutoEscapeControlNode, FilterNode, ForNode, IfEqualNode, IfNode,
+                                         SpacelessNode, WithNode)
+from django.template.loader import get_template
+from django.template.loader_tags import BlockNode, ConstantIncludeNode, ExtendsNode, IncludeNode
+
+from .templatetags import RelocateNode
+
+CONTAINERS = (AutoEscapeControlNode, BlockNode, FilterNode, ForNode, IfEqualNode, IfNode, SpacelessNode,
+              WithNode)
+PRUNED = (TextNode, VariableNode)
+
+class SectionsOnlyExtendsNode(ExtendsNode):
+    def get_parent(self, context):
+        return sections_only_template(ExtendsNode.get_parent(self, context))
+
+class SectionsOnlyIncludeNode(IncludeNode):
+    def render(self, context):
+        try:
+            template = get_template(self.template_name.resolve(context))
+            return self.render_template(sections_only_template(template), context)
+        except:
+            if settings.TEMPLATE_DEBUG:
+                raise
+            return ''
+
+def recast(node, cls):
+    ret = cls.__new__(cls)
+    ret.__dict__.update(node.__dict__)
+    return ret
+
+def prune_nodelist(nodelist, memo):
+    ret = NodeList()
+    for node in nodelist:
+        pruned = prune_node(node, memo)
+        if pruned is not None:
+            ret.append(pruned)
+    ret.contains_nontext = any(not isinstance(node, TextNode) for node in ret)
+    return ret
+
+def is_block_super(node):
+    return isinstance(node, VariableNode) and node.filter_expression.token.startswith('block.super')
+
+def prune_node(node, memo):
+    """ returns the section-only copy of node, or None when nothing in it can add to the sections """
+    if isinstance(node, PRUNED):
+        # {{ block.super }} renders the parent's block, relocate blocks included
+        return node if is_block_super(node) else None
+    if isinstance(node, RelocateNode) or not isinstance(node, CONTAINERS + (ExtendsNode, ConstantIncludeNode,
+                                                                              IncludeNode)):
+        return node
+
+    if isinstance(node, ExtendsNode):
+        ret = recast(node, SectionsOnlyExtendsNode)
+        ret.nodelist = prune_nodelist(node.nodelist, memo)
+        ret.blocks = dict((name, memo.get(id(block), block)) for name, block in node.blocks.items())
+    elif isinstance(node, ConstantIncludeNode):
+        ret = copy.copy(node)
+        ret.template = node.template and sections_only_template(node.template)
+    elif isinstance(node, IncludeNode):
+        ret = recast(node, SectionsOnlyIncludeNode)
+    elif isinstance(node, IfNode):
+        ret = copy.copy(node)
+        ret.conditions_nodelists = [(condition, prune_nodelist(nodelist, memo))
+                                    for condition, nodelist in node.conditions_nodelists]
+        if not any(nodelist for condition, nodelist in ret.conditions_nodelists):
+            return None
+    else:
+        ret = copy.copy(node)
+        for attr in node.child_nodelists:
+            if getattr(node, attr, None) is not None:
+                setattr(ret, attr, prune_nodelist(getattr(node, attr), memo))
+        # An empty block still overrides its parent's block
+        if not isinstance(node, BlockNode) and not any(getattr(ret, attr, None) for attr in node.child_nodelists):
+            return None
+    memo[id(node)] = ret
+    return ret
+
+def sections_only_template(template):
+    """ A copy of a django template rendering only what its sections need (made once per template) """
+    if not hasattr(template, 'nodelist'):
+        return template
+    pruned = template.__dict__.get('_relocation_sections_only')
+    if pruned is None:
+        pruned = copy.copy(template)
+        pruned.nodelist = prune_nodelist(template.nodelist, dict())
+        pruned._relocation_sections_only = pruned
+        template._relocation_sections_only = pruned
+    return pruned
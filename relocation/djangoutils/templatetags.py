@@ -1,26 +1,127 @@
-from django.template.base import Library, Node, TemplateSyntaxError, TextNode
+"""
+With RELOCATION_DIRECT_SECTIONS relocate tags hand their content to the render's SectionCollector
+(see SectionCollector.collect) instead of rendering it between markers, when the render went
+through install_section_collector (relocation.djangoutils.render_to_string and friends).
 
+A fragment cache must store the content itself: relocate tags inside the tags of
+RELOCATION_MARKER_TAGS (default: cache) always render markers, and so do the templates included
+from inside them. Other templates rendered inside them (e.g blocks of an extending template)
+aren't seen, wrap them in {% relocation_markers %}...{% endrelocation_markers %}: their cached
+collected markers are dropped from later renders (with a warning, see SectionCollector.collected).
+"""
+from django.conf import settings
+from django.template.base import Library, Node, NodeList, TemplateSyntaxError, TextNode, TOKEN_BLOCK
+
+from relocation import section_collector
 from relocation.engine import RelocationSerializer
 register = Library()
 
-class NodeBasedNodeList(Node):
-    def __init__(self, nodelist):
+SECTIONS_KEY = 'relocation_sections'
+MARKERS_KEY = 'relocation_markers'
+DIRECT_SECTIONS = getattr(settings, 'RELOCATION_DIRECT_SECTIONS', False)
+MARKER_TAGS = getattr(settings, 'RELOCATION_MARKER_TAGS', ('cache',))
+
+def get_section_collector(context):
+    # The bottom of the render context lives as long as the context (and is shared with its copies)
+    return context.render_context.dicts[0].get(SECTIONS_KEY)
+
+def install_section_collector(context):
+    """ The SectionCollector of a render with context, relocate tags collect into it with DIRECT_SECTIONS """
+    sections = section_collector()
+    if DIRECT_SECTIONS and hasattr(context, 'render_context'):
+        context.render_context.dicts[0][SECTIONS_KEY] = sections
+    return sections
+
+def inside_marker_tags(parser, token):
+    """
+    Whether the relocate (or include) token being compiled is inside one of MARKER_TAGS: some end tag is
+    unmatched in the tokens left. Computed once per parser for all such tokens left, in a backward pass.
+    """
+    inside = parser.__dict__.get('_relocation_inside_marker_tags')
+    if inside is None:
+        inside = parser._relocation_inside_marker_tags = dict()
+        unmatched = dict.fromkeys(MARKER_TAGS, 0)
+        for remaining in reversed(parser.tokens):
+            if remaining.token_type != TOKEN_BLOCK or not remaining.contents:
+                continue
+            command = remaining.contents.split()[0]
+            if command in ('relocate', 'include'):
+                inside[id(remaining)] = any(unmatched.values())
+            elif command in unmatched:
+                unmatched[command] = max(0, unmatched[command] - 1)
+            elif command.startswith('end') and command[3:] in unmatched:
+                unmatched[command[3:]] += 1
+        inside[id(token)] = any(unmatched.values())
+    return inside.get(id(token), False)
+
+class RelocateNode(Node):
+    child_nodelists = ('nodelist',)
+
+    def __init__(self, destination, nodelist, priority=None, markers=False):
+        self.destination = destination
         self.nodelist = nodelist
+        self.priority = priority
+        self.markers = markers
+
     def render(self, context):
-        return self.nodelist.render(context)
+        render_context = context.render_context.dicts[0]
+        sections = None if self.markers or render_context.get(MARKERS_KEY) else render_context.get(SECTIONS_KEY)
+        if sections is None:
+            return u''.join((RelocationSerializer.relocate_start(self.destination, self.priority),
+                             self.nodelist.render(context),
+                             RelocationSerializer.relocate_end()))
+        return sections.collect(self.destination, self.priority or 0, self.nodelist.render(context))
 
 @register.tag
 def relocate(parser, token):
+    """ {% relocate <section> [<priority>] %}, the priority orders sections having a sort policy """
     bits = token.split_contents()
     if len(bits) < 2:
         raise TemplateSyntaxError("'relocate' tag require a section name argument")
     dest = bits[1]
+    priority = None
+    if len(bits) > 2:
+        try:
+            priority = int(bits[2])
+        except ValueError:
+            raise TemplateSyntaxError("'relocate' tag priority must be an integer")
 
+    markers = DIRECT_SECTIONS and inside_marker_tags(parser, token)
     nodelist = parser.parse(('endrelocate',))
     parser.delete_first_token()
-    nodelist.insert(0, TextNode(RelocationSerializer.relocate_start(dest)))
-    nodelist.append(TextNode(RelocationSerializer.relocate_end()))
-    return NodeBasedNodeList(nodelist)
+    return RelocateNode(dest, nodelist, priority, markers)
+
+class MarkersNode(Node):
+    child_nodelists = ('nodelist',)
+
+    def __init__(self, nodelist):
+        self.nodelist = nodelist
+
+    def render(self, context):
+        render_context = context.render_context.dicts[0]
+        render_context[MARKERS_KEY] = render_context.get(MARKERS_KEY, 0) + 1
+        try:
+            return self.nodelist.render(context)
+        finally:
+            render_context[MARKERS_KEY] -= 1
+
+@register.tag
+def relocation_markers(parser, token):
+    """ {% relocation_markers %}, relocate tags rendered inside (included templates too) render markers """
+    nodelist = parser.parse(('endrelocation_markers',))
+    parser.delete_first_token()
+    return MarkersNode(nodelist)
+
+def include(parser, token):
+    """ django's include, rendering markers inside MARKER_TAGS """
+    from django.template.loader_tags import do_include
+    node = do_include(parser, token)
+    if inside_marker_tags(parser, token):
+        return MarkersNode(NodeList([node]))
+    return node
+
+if DIRECT_SECTIONS:
+    register.tag(include)
 
 @register.tag
 def destination(parser, token):
@@ -29,4 +130,3 @@ def destination(parser, token):
         raise TemplateSyntaxError("'relocate' tag require a section name argument")
     dest = bits[1]
     return TextNode(RelocationSerializer.destination(dest))
-
@@ -1,8 +1,11 @@
 import time
+import hashlib
 from copy import copy
 from collections import deque
 from itertools import chain
 
+from .utils import buf_md5
+
 class mudeque(object):
     def __init__(self, original=None, cls=deque):
         self.deques = [original or cls()]
@@ -21,6 +24,26 @@ class mudeque(object):
         self.deques.append(new_deque)
         return orig_tail
 
+    def graft(self, inner):
+        """
+        Places inner (a deque or a mudeque, which isn't copied) at the end and continues
+        appending after it. Unlike branch it doesn't copy the deques list, so it's O(1)
+        """
+        self.deques.append(inner)
+        self.deques.append(self.cls())
+
+    def leaves(self):
+        """ The plain deques in order, nested mudeques are walked without recursion """
+        stack = [iter(self.deques)]
+        while stack:
+            for dq in stack[-1]:
+                if isinstance(dq, mudeque):
+                    stack.append(iter(dq.deques))
+                    break
+                yield dq
+            else:
+                stack.pop()
+
     ## proxy methods
     def get_proxy_func(name, dest):
         def first(self, *args, **kwargs):
@@ -29,7 +52,7 @@ class mudeque(object):
             return getattr(self.deques[-1], name)(*args, **kwargs)
         def all(self, *args, **kwargs):
             list(getattr(dq, name)(*args, **kwargs) for dq in self.deques)
-        def sum(self, *args, **kwargs):
+        def total(self, *args, **kwargs):
             return sum(getattr(dq, name)(*args, **kwargs) for dq in self.deques)
         def unimplemented(self, *args, **kwargs):
             raise NotImplementedError()
@@ -41,8 +64,8 @@ class mudeque(object):
     for name, dest in dict(
                 append='last', extend='last', pop='last',
                 appendleft='first', extendleft='first', popleft='first',
-                __len__='sum', remove='unimplemented', rotate='unimplemented',
-            ).iteritems():
+                __len__='total', remove='unimplemented', rotate='unimplemented',
+            ).items():
         locals()[name] = get_proxy_func(name, dest)
     del name, dest
 
@@ -50,11 +73,77 @@ class mudeque(object):
         self.__init__(cls=self.cls)
 
     def __iter__(self):
-        return chain(*self.deques)
+        # Items go through a single chain however deep the nesting is
+        return chain.from_iterable(self.leaves())
 
     def __repr__(self):
         return 'mudeque(%s)'%(', '.join('[%s]'%(', '.join(repr(item) for item in dq)) for dq in self.deques))
 
+class LazySection(mudeque):
+    """
+    A mudeque whose items go through deferred steps (functions of the items returning the new
+    items) only once they're read. The fingerprint identifies the result from the items the
+    section had when the first step was deferred and the steps' identities, without running them.
+
+    Sections are made lazy in place by LazySection.of (they may already be placed in destinations).
+    Their content must change through defer only, the fingerprint doesn't follow other changes.
+    A step deferred without identity must return the items unchanged (e.g it only records them).
+    """
+    def __init__(self, original=None, cls=deque):
+        self.steps = []
+        self.fingerprint = None
+        mudeque.__init__(self, original, cls)
+
+    @property
+    def deques(self):
+        if self.steps:
+            self.evaluate()
+        return self._deques
+
+    @deques.setter
+    def deques(self, deques):
+        self._deques = deques
+
+    def defer(self, identity, step):
+        if identity is not None:
+            if self.fingerprint is None:
+                self.fingerprint = buf_md5(self).hexdigest()
+            self.fingerprint = hashlib.md5((self.fingerprint + identity).encode('utf8')).hexdigest()
+        self.steps.append(step)
+
+    @property
+    def pending(self):
+        """ Whether reading the items runs deferred steps """
+        return bool(self.steps)
+
+    def evaluate(self):
+        steps, self.steps = self.steps, []
+        try:
+            items = list(mudeque.__iter__(self))
+            for step in steps:
+                items = step(items)
+        except:
+            self.steps = steps
+            raise
+        self._deques = [self.cls(items)]
+
+    @classmethod
+    def of(cls, section):
+        """ The LazySection holding the items of section (a mudeque), made once """
+        lazy = cls.find(section)
+        if lazy is None:
+            lazy = cls(cls=section.cls)
+            lazy.deques = section.deques
+            section.deques = [lazy]
+        return lazy
+
+    @classmethod
+    def find(cls, section):
+        deques = section.deques
+        if len(deques) == 1 and isinstance(deques[0], cls):
+            return deques[0]
+        return None
+
 class Elapsed(object):
     __slots__ = ["start"]
     def source(self):
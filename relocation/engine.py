@@ -1,32 +1,152 @@
+import uuid
+import logging
+import hashlib
 from bunch import Bunch
 from collections import deque
 
-from .utils import SearchableStringStream
+from .utils import MemoryViewStream, SearchableStringStream, buf_md5, buf_to_bytes, to_bytes
 from .dtypes import mudeque
 
 class RelocationError(Exception):
     pass
 
+class SectionPolicy(object):
+    """
+    dedupe: a fragment identical to one already in the section is dropped once it's complete
+    sort: fragments are ordered by their priority (lower first, then document order)
+    single_destination: only the first destination of the section gets it, the others stay empty
+    """
+    def __init__(self, dedupe=False, sort=False, single_destination=False):
+        self.dedupe = dedupe
+        self.sort = sort
+        self.single_destination = single_destination
+
+    @property
+    def per_fragment(self):
+        return self.dedupe or self.sort
+
+NO_POLICY = SectionPolicy()
+
+class SectionCollector(dict):
+    """
+    Collects relocated fragments while rendering, so they never pass through the main
+    output (only a short marker standing for them does, see collect). Passed to deserialize.
+    policies: {section name: SectionPolicy or its keyword arguments}
+    """
+    def __init__(self, sections=(), policies=None):
+        dict.__init__(self, sections)
+        self.policies = dict((name, policy if isinstance(policy, SectionPolicy) else SectionPolicy(**policy))
+                             for name, policy in (policies or {}).items())
+        self._digests = dict()
+        self._sorted = dict()
+        self._placed = set()
+        # Collected fragments by key: a token of this collector and the fragment's hash
+        self._collected = dict()
+        self._collected_key = uuid.uuid4().hex + '.%s'
+        self._collected_marker = RelocationSerializer.collected('%s')
+
+    def policy(self, name):
+        return self.policies.get(name, NO_POLICY)
+
+    def collect(self, name, priority, fragment):
+        """
+        Keeps a rendered relocate block, returns the marker to render in its place. deserialize puts
+        the fragment in the section where it finds the marker: in document order with the fragments
+        relocated through markers, only when the marker made it to the output (e.g not for the first
+        rendering of an ifchanged), and with the markers inside the fragment resolved.
+        Identical blocks get the same marker, so tags comparing renderings (ifchanged) still can.
+        """
+        key = self._collected_key % hashlib.md5(to_bytes(u'%s\0%s\0%s' % (name, priority, fragment))).hexdigest()
+        self._collected[key] = (name, priority, fragment)
+        return self._collected_marker % key
+
+    def collected(self, key):
+        """ (name, priority, fragment) of a marker returned by collect, None for a marker of another render """
+        try:
+            return self._collected[key]
+        except KeyError:
+            # e.g a {% cache %} fragment stored by another render, see relocation.djangoutils.templatetags.
+            # Its fragment is gone, the page is relocated without it
+            logging.getLogger('relocation.engine').warning('Dropped a collected fragment of another render: %s', key)
+            return None
+
+    def reserve(self, name, priority=0, slot=None):
+        """
+        Returns a deque (or the given slot) holding a fragment's place in the section, so fragments
+        of nested relocations are kept in document order even though the inner ones finish rendering
+        first. Sorted sections get their fragments in place on finish.
+        """
+        if slot is None:
+            slot = deque()
+        section = self.setdefault(name, mudeque())
+        if self.policy(name).sort:
+            fragments = self._sorted.setdefault(name, [])
+            fragments.append((priority, len(fragments), slot))
+        else:
+            section.graft(slot)
+        return slot
+
+    def done(self, name, slot):
+        """ The fragment in slot is complete. Fragments holding destinations are never deduped """
+        if not self.policy(name).dedupe or (isinstance(slot, mudeque) and
+                                            any(isinstance(dq, mudeque) for dq in slot.deques)):
+            return
+        digest = buf_md5(slot).digest()
+        digests = self._digests.setdefault(name, set())
+        if digest in digests:
+            slot.clear()
+        else:
+            digests.add(digest)
+
+    def place(self, name):
+        """ The section to place at a destination of name, None when it has a single destination already filled """
+        if self.policy(name).single_destination:
+            if name in self._placed:
+                return None
+            self._placed.add(name)
+        return self.setdefault(name, mudeque())
+
+    def finish(self):
+        for name, fragments in self._sorted.items():
+            section = self[name]
+            for priority, order, slot in sorted(fragments, key=lambda fragment: fragment[:2]):
+                section.graft(slot)
+        self._sorted.clear()
+
 class RelocationSerializer(object):
     MAGICS = Bunch(
         RELOCATION_MAGIC = 'e50c9dec8d54890ad1b1405eb2229bd24d7f3f3f',
         TYPE_RELOCATE_START = 'RS',
+        TYPE_RELOCATE_START_PRIORITY = 'RP',
         TYPE_RELOCATE_END = 'RE',
         TYPE_DESTINATION_MARKER = 'DM',
+        TYPE_COLLECTED = 'RC',
         NAME_START = '<',
         NAME_END = '>',
     )
     MAGIC_TYPE_LEN = 2
     MAX_NAME_LEN = 128
+    stream = SearchableStringStream
 
     @classmethod
-    def relocate_start(cls, destination):
+    def relocate_start(cls, destination, priority=None):
+        if priority is None:
+            return ''.join((
+                cls.MAGICS.RELOCATION_MAGIC,
+                cls.MAGICS.TYPE_RELOCATE_START,
+                cls.MAGICS.NAME_START,
+                destination,
+                cls.MAGICS.NAME_END,
+            ))
         return ''.join((
             cls.MAGICS.RELOCATION_MAGIC,
-            cls.MAGICS.TYPE_RELOCATE_START,
+            cls.MAGICS.TYPE_RELOCATE_START_PRIORITY,
             cls.MAGICS.NAME_START,
             destination,
             cls.MAGICS.NAME_END,
+            cls.MAGICS.NAME_START,
+            '%d' % priority,
+            cls.MAGICS.NAME_END,
         ))
 
     @classmethod
@@ -47,10 +167,22 @@ class RelocationSerializer(object):
         ))
 
     @classmethod
-    def deserialize(cls, s):
+    def collected(cls, key):
+        return ''.join((
+            cls.MAGICS.RELOCATION_MAGIC,
+            cls.MAGICS.TYPE_COLLECTED,
+            cls.MAGICS.NAME_START,
+            key,
+            cls.MAGICS.NAME_END,
+        ))
+
+    @classmethod
+    def deserialize(cls, s, relocations=None, policies=None):
         """
         Takes a string with relocations markers and split it to into buffers
         returns: (main_buf, dict(section1=buf1, section2=buf2))
+        relocations may be the SectionCollector of the render, holding the fragments of its collected
+        markers (see SectionCollector.collect), policies apply unless it's a SectionCollector.
 
         All buffers are mudeques.
         The main_buf is contructed from the main part with the relocated buffers already injected in the right placeholders:
@@ -64,39 +196,146 @@ class RelocationSerializer(object):
 
         buf_stack = deque((mudeque(),))
         current_buf = lambda: buf_stack[-1]
-        relocations = dict()
-        sss = SearchableStringStream(s)
-
-        def getname():
-            sss.expect(cls.MAGICS.NAME_START)
-            name = sss.readuntil(cls.MAGICS.NAME_END)
-            assert len(name) <= cls.MAX_NAME_LEN, "Got a too long name: %s"%(name)
-            return name
-
-        while True:
-            try:
-                current_buf().append(sss.readuntil(cls.MAGICS.RELOCATION_MAGIC))
-            except EOFError:
-                current_buf().append(sss.read())
-                break
-
-            magic_type = sss.read(cls.MAGIC_TYPE_LEN)
-            if magic_type == cls.MAGICS.TYPE_RELOCATE_START:
-                destination = getname()
-                buf_stack.append(relocations.setdefault(destination, mudeque()))
-            elif magic_type == cls.MAGICS.TYPE_RELOCATE_END:
-                buf_stack.pop()
-                assert len(buf_stack) > 0, "Encountered endrelocate without relocate"
-            elif magic_type == cls.MAGICS.TYPE_DESTINATION_MARKER:
-                destination = getname()
-                current_buf().branch(relocations.setdefault(destination, mudeque()))
-                current_buf().branch()
+        # The section names of buf_stack (None for main), whether their buffer is a reserved
+        # fragment and which sections hold destinations of which
+        name_stack = [(None, False)]
+        placements = dict()
+        if not isinstance(relocations, SectionCollector):
+            relocations = SectionCollector(relocations or (), policies)
+
+        def start(destination, priority):
+            reserved = relocations.policy(destination).per_fragment
+            if reserved:
+                buf_stack.append(relocations.reserve(destination, priority, mudeque()))
             else:
-                raise RelocationError('Bad magic type: ' + magic_type)
+                buf_stack.append(relocations.setdefault(destination, mudeque()))
+            name_stack.append((destination, reserved))
+
+        def end():
+            assert len(buf_stack) > 1, "Encountered endrelocate without relocate"
+            fragment = buf_stack.pop()
+            name, reserved = name_stack.pop()
+            if reserved:
+                relocations.done(name, fragment)
+
+        def consume(serializer, sss):
+            """ serializer reads the markers of sss: the document's, or the text of collected fragments """
+            # Bunch lookups are slow, the markers are read once
+            MAGICS = serializer.MAGICS
+            magic, name_start, name_end = MAGICS.RELOCATION_MAGIC, MAGICS.NAME_START, MAGICS.NAME_END
+            type_collected, type_start, type_start_priority, type_end, type_destination = (MAGICS.TYPE_COLLECTED,
+                MAGICS.TYPE_RELOCATE_START, MAGICS.TYPE_RELOCATE_START_PRIORITY, MAGICS.TYPE_RELOCATE_END,
+                MAGICS.TYPE_DESTINATION_MARKER)
+            magic_type_len, max_name_len = serializer.MAGIC_TYPE_LEN, serializer.MAX_NAME_LEN
+            def getname():
+                sss.expect(name_start)
+                name = sss.readtextuntil(name_end)
+                assert len(name) <= max_name_len, "Got a too long name: %s"%(name)
+                return name
+
+            while True:
+                try:
+                    current_buf().append(sss.readuntil(magic))
+                except EOFError:
+                    current_buf().append(sss.read())
+                    break
+
+                magic_type = sss.readcopy(magic_type_len)
+                if magic_type == type_collected:
+                    collected = relocations.collected(getname())
+                    if collected is None:
+                        continue
+                    destination, priority, fragment = collected
+                    start(destination, priority)
+                    fragment_serializer = RelocationSerializer.for_document(fragment)
+                    if fragment_serializer.MAGICS.RELOCATION_MAGIC in fragment:
+                        consume(fragment_serializer, fragment_serializer.stream(fragment))
+                    else:
+                        current_buf().append(fragment)
+                    end()
+                elif magic_type == type_start:
+                    start(getname(), 0)
+                elif magic_type == type_start_priority:
+                    destination, priority = getname(), getname()
+                    try:
+                        start(destination, int(priority))
+                    except ValueError:
+                        raise RelocationError('Bad priority of %s: %s' % (destination, priority))
+                elif magic_type == type_end:
+                    end()
+                elif magic_type == type_destination:
+                    destination = getname()
+                    section = relocations.place(destination)
+                    if section is None:
+                        continue
+                    current_buf().graft(section)
+                    if name_stack[-1][0] is not None:
+                        placements.setdefault(name_stack[-1][0], set()).add(destination)
+                else:
+                    raise RelocationError('Bad magic type: %r' % (magic_type,))
 
+        consume(cls, cls.stream(s))
+        relocations.finish()
+        if placements:
+            cls.check_cycles(placements)
         return buf_stack[0], relocations
 
+    @classmethod
+    def check_cycles(cls, placements):
+        """ placements: {section: sections it has destinations of}, raises on a section placed inside itself """
+        done = set()
+        for root in placements:
+            if root in done:
+                continue
+            path = [root]
+            on_path = set(path)
+            stack = [iter(placements.get(root, ()))]
+            while stack:
+                for name in stack[-1]:
+                    if name in on_path:
+                        cycle = path[path.index(name):] + [name]
+                        raise RelocationError('Section placed inside itself: ' + ' -> '.join(cycle))
+                    if name not in done:
+                        path.append(name)
+                        on_path.add(name)
+                        stack.append(iter(placements.get(name, ())))
+                        break
+                else:
+                    stack.pop()
+                    name = path.pop()
+                    on_path.discard(name)
+                    done.add(name)
+
     @classmethod
     def do_relocation(cls, s):
         main, relocations = cls.deserialize(s)
         return u''.join(main)
+
+    @classmethod
+    def for_document(cls, s):
+        """ The serializer of a rendered document: BytesRelocationSerializer for UTF-8 bytes """
+        return cls if isinstance(s, type(u'')) else BytesRelocationSerializer
+
+class BytesRelocationSerializer(RelocationSerializer):
+    """
+    Deserializes UTF-8 bytes: the buffers hold memoryview slices of the document (no copies,
+    no decoding) next to the text items processors and direct sections add. buf_to_bytes
+    writes them out as they are, buf_to_unicode decodes them when text is needed.
+    Writing markers stays with RelocationSerializer (templates render text).
+    """
+    MAGICS = Bunch(RelocationSerializer.MAGICS,
+        RELOCATION_MAGIC = RelocationSerializer.MAGICS.RELOCATION_MAGIC.encode('ascii'),
+        TYPE_RELOCATE_START = b'RS',
+        TYPE_RELOCATE_START_PRIORITY = b'RP',
+        TYPE_RELOCATE_END = b'RE',
+        TYPE_DESTINATION_MARKER = b'DM',
+        TYPE_COLLECTED = b'RC',
+        NAME_START = b'<',
+        NAME_END = b'>',
+    )
+    stream = MemoryViewStream
+
+    @classmethod
+    def do_relocation(cls, s):
+        main, relocations = cls.deserialize(s)
+        return buf_to_bytes(main)
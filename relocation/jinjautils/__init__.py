@@ -1,5 +1,3 @@
-from django.template.base import RequestContext
-
 def context_to_dict(context):
     ret = dict()
     for ctx in context:
@@ -7,5 +5,5 @@ def context_to_dict(context):
     return ret
 
 def jinja_get_context(request, template_name):
+    from django.template.base import RequestContext
     return context_to_dict(RequestContext(request))
-
@@ -0,0 +1,134 @@
+"""
+Jinja2 native rendering with relocation, no django needed:
+
+    env = RelocatingEnvironment(loader=..., relocation_processors=('relocation.processors.minify_js',))
+    html = env.get_template('page.tmpl').render(context)
+
+Templates loaded through the environment's bytecode_cache are instantiated as
+RelocatingTemplate as well, so relocating templates keep using it.
+
+With relocation_direct_sections relocate blocks hand their body straight to the render's
+SectionCollector instead of rendering it between markers. Compiled code depends on it, don't
+share a bytecode cache between environments with and without it.
+
+render_sections renders only what the sections need, through an overlay environment whose
+templates are compiled without the main document's output (see prune_output).
+"""
+from jinja2 import Environment, Template, nodes
+
+from .. import load_processors, run_processors
+from ..engine import SectionCollector
+from ..utils import buf_to_unicode
+from .extensions import RelocationExtension, SECTIONS_VAR
+
+# Statements whose bodies render to the main document
+PRUNED_BODIES = tuple(getattr(nodes, name) for name in ('Template', 'For', 'If', 'With', 'Scope', 'Block',
+                                                        'FilterBlock', 'ScopedEvalContextModifier')
+                      if hasattr(nodes, name))
+
+def may_relocate(node):
+    """ Calls may render relocate blocks: macros, super(), self.<block>() """
+    return isinstance(node, nodes.Call) or any(True for call in node.find_all(nodes.Call))
+
+def prune_output(node):
+    """
+    Drops the main document's text and expressions from the template's AST. Output calling
+    something is kept (its call only), relocate, macro and call block bodies are left as they are.
+    """
+    for field in ('body', 'elif_', 'else_'):
+        children = getattr(node, field, None)
+        if children is None:
+            continue
+        kept = []
+        for child in children:
+            if isinstance(child, nodes.Output):
+                child.nodes = [expr for expr in child.nodes if may_relocate(expr)]
+                if not child.nodes:
+                    continue
+            elif isinstance(child, PRUNED_BODIES) and not getattr(child, 'relocation_block', False):
+                prune_output(child)
+            kept.append(child)
+        setattr(node, field, kept)
+
+class RelocatingTemplate(Template):
+    def relocate(self, rendered, sections=None):
+        """ returns (main, sections) for an already rendered document """
+        return self.environment.relocate(self.name, rendered, sections)
+
+    def render(self, *args, **kwargs):
+        sections, args, kwargs = self._with_collector(args, kwargs)
+        main, sections = self.relocate(Template.render(self, *args, **kwargs), sections)
+        return buf_to_unicode(main)
+
+    def generate(self, *args, **kwargs):
+        """
+        Relocated sections may target destinations anywhere in the document, so the whole
+        document is rendered and processed first, then the main buffer is streamed.
+        """
+        sections, args, kwargs = self._with_collector(args, kwargs)
+        main, sections = self.relocate(u''.join(Template.generate(self, *args, **kwargs)), sections)
+        return iter(main)
+
+    def _with_collector(self, args, kwargs):
+        if not getattr(self.environment, 'relocation_direct_sections', False):
+            return None, args, kwargs
+        sections = SectionCollector(policies=self.environment.relocation_section_policies)
+        context = dict(*args, **kwargs)
+        context[SECTIONS_VAR] = sections
+        return sections, (context,), {}
+
+class RelocatingEnvironment(Environment):
+    template_class = RelocatingTemplate
+    relocation_sections_only = False
+
+    def __init__(self, *args, **kwargs):
+        self._relocation_processors = kwargs.pop('relocation_processors', ())
+        # {section name: SectionPolicy or its keyword arguments}, see relocation.engine.SectionPolicy
+        self.relocation_section_policies = kwargs.pop('relocation_section_policies', None)
+        direct_sections = kwargs.pop('relocation_direct_sections', False)
+        Environment.__init__(self, *args, **kwargs)
+        self.add_extension(RelocationExtension)
+        self.relocation_direct_sections = direct_sections
+
+    @property
+    def relocation_processors(self):
+        return self._relocation_processors
+
+    @relocation_processors.setter
+    def relocation_processors(self, processors):
+        self._relocation_processors = processors
+        self.__dict__.pop('_relocation_pipeline', None)
+
+    @property
+    def relocation_pipeline(self):
+        """ The loaded processors, imported once per environment """
+        if '_relocation_pipeline' not in self.__dict__:
+            self._relocation_pipeline = load_processors(self._relocation_processors)
+        return self._relocation_pipeline
+
+    def _parse(self, source, name, filename):
+        template = Environment._parse(self, source, name, filename)
+        if self.relocation_sections_only:
+            prune_output(template)
+        return template
+
+    @property
+    def sections_only_environment(self):
+        """ The overlay compiling section-only templates, with its own template cache and no bytecode cache """
+        if '_sections_only_environment' not in self.__dict__:
+            cache_size = getattr(self.cache, 'capacity', 0 if self.cache is None else -1)
+            env = self.overlay(cache_size=cache_size, bytecode_cache=None)
+            env.relocation_sections_only = True
+            self._sections_only_environment = env
+        return self._sections_only_environment
+
+    def render_sections(self, template_name, *args, **kwargs):
+        """ returns (main, sections) of template_name, rendering only what the sections need """
+        template = self.sections_only_environment.get_template(template_name)
+        sections, args, kwargs = template._with_collector(args, kwargs)
+        return template.relocate(Template.render(template, *args, **kwargs), sections)
+
+    def relocate(self, template_name, rendered, sections=None):
+        if sections is None:
+            sections = SectionCollector(policies=self.relocation_section_policies)
+        return run_processors(template_name, rendered, self.relocation_pipeline, sections)
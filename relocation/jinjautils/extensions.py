@@ -3,12 +3,25 @@ from jinja2.ext import Extension
 
 from ..engine import RelocationSerializer
 
+# Name of the template variable holding the SectionCollector of the current render
+SECTIONS_VAR = '_relocation_sections'
+
 def str_to_node(data, lineno=None):
     return nodes.Output([nodes.TemplateData(data, lineno=lineno)], lineno=lineno)
 
 class RelocationExtension(Extension):
+    """
+    With environment.relocation_direct_sections set, relocate blocks are compiled into calls
+    handing their body to the SectionCollector found in the context (as SECTIONS_VAR), only a
+    short marker standing for it is rendered (see SectionCollector.collect). Renders without
+    a collector (e.g macros imported without context) fall back to the relocation markers.
+    """
     tags = set(['relocate', 'destination'])
 
+    def __init__(self, environment):
+        super(RelocationExtension, self).__init__(environment)
+        environment.extend(relocation_direct_sections=False)
+
     def parse(self, parser):
         return getattr(self, next(parser.stream).value)(parser)
 
@@ -16,16 +29,40 @@ class RelocationExtension(Extension):
         destination = next(parser.stream).value
         return destination
 
+    def _get_priority(self, parser):
+        sign = 1
+        if parser.stream.current.test('sub') and parser.stream.look().test('integer'):
+            next(parser.stream)
+            sign = -1
+        if parser.stream.current.test('integer'):
+            return sign * next(parser.stream).value
+        return None
+
     def relocate(self, parser):
+        """ {% relocate <section> [<priority>] %}, the priority orders sections having a sort policy """
         lineno = parser.stream.current.lineno
         destination = self._get_destination(parser)
+        priority = self._get_priority(parser)
         nodelist = parser.parse_statements(('name:endrelocate',), drop_needle=True)
-        nodelist.insert(0, str_to_node(RelocationSerializer.relocate_start(destination), lineno=lineno))
+        if self.environment.relocation_direct_sections:
+            call = self.call_method('_relocate_block', [nodes.ContextReference(), nodes.Const(destination),
+                                                        nodes.Const(priority or 0)])
+            return nodes.CallBlock(call, [], [], nodelist, lineno=lineno)
+        nodelist.insert(0, str_to_node(RelocationSerializer.relocate_start(destination, priority), lineno=lineno))
         nodelist.append(str_to_node(RelocationSerializer.relocate_end(), lineno=lineno))
-        return nodes.Scope(nodelist, lineno=lineno)
+        scope = nodes.Scope(nodelist, lineno=lineno)
+        # Its body is the section's, see environment.prune_output
+        scope.relocation_block = True
+        return scope
 
     def destination(self, parser):
         lineno = parser.stream.current.lineno
         destination = self._get_destination(parser)
         return str_to_node(RelocationSerializer.destination(destination), lineno=lineno)
 
+    def _relocate_block(self, context, destination, priority, caller):
+        sections = context.get(SECTIONS_VAR)
+        if sections is None:
+            return u''.join((RelocationSerializer.relocate_start(destination, priority or None), caller(),
+                             RelocationSerializer.relocate_end()))
+        return sections.collect(destination, priority, caller())
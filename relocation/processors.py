@@ -1,44 +1,203 @@
-import copy, hashlib, logging
+import os, copy, json, hashlib, logging
 from bunch import Bunch
 
 from django.conf import settings
 from django.core.cache import DEFAULT_CACHE_ALIAS
-from django.core.urlresolvers import reverse
+try:
+    from django.urls import reverse
+except ImportError:
+    from django.core.urlresolvers import reverse
 
-from .cache import cached_data
-from .utils import buf_to_unicode
+from .bundling import COMMON_BUNDLE, base_section_name, bundle_name, get_layout, section_bundles
+from .cache import Compression, cached_data, get_cache
+from .dtypes import LazySection
+from . import scssdeps
+from .utils import CompilerPool, buf_md5, buf_to_unicode, thread_map, to_bytes, to_unicode
 
 CACHE_NAME=getattr(settings, 'RELOCATION_CACHE', DEFAULT_CACHE_ALIAS)
-def relocation_cache_get_or_set(key_prefix, data, func):
-    with cached_data('%s_%s' % (key_prefix, hashlib.md5(data).hexdigest()), backend=CACHE_NAME) as ctx:
+# e.g dict(PERIOD=24*60*60, FUZZ=60*60, TIMEOUT=5*60), see cache.cached_data
+RECACHE_STRATEGY = getattr(settings, 'RELOCATION_CACHE_RECACHE_STRATEGY', None)
+RECACHE_STRATEGY = RECACHE_STRATEGY and Bunch(RECACHE_STRATEGY)
+BACKGROUND_REFRESH = getattr(settings, 'RELOCATION_CACHE_BACKGROUND_REFRESH', False)
+# Compiled blobs at least this big (pickled) are compressed, None disables compression
+COMPRESS_THRESHOLD = getattr(settings, 'RELOCATION_CACHE_COMPRESS_THRESHOLD', 32*1024)
+COMPRESSION = COMPRESS_THRESHOLD is not None and Compression(
+    getattr(settings, 'RELOCATION_CACHE_COMPRESSION', 'zlib'), COMPRESS_THRESHOLD) or None
+
+# The compiling processors (scss, coffee, minify_js) only record their work, it's done once the
+# section is read: externified sections are compiled when their url is requested, see LazySection
+LAZY_PROCESSING = getattr(settings, 'RELOCATION_LAZY_PROCESSING', False)
+
+# key prefix (processor) -> seconds a compile error (one of the errors given to
+# relocation_cache_get_or_set) is remembered and raised again without compiling, 0 disables it
+NEGATIVE_CACHE = dict(dict(scss=60, coffee=60, minify=60), **getattr(settings, 'RELOCATION_NEGATIVE_CACHE', {}))
+# Errors of the environment rather than of the compiled source are never remembered
+NEGATIVE_CACHE_IGNORED = (ImportError, EnvironmentError)
+negative_cache_metrics = dict()
+
+def get_negative_cache_metrics():
+    return dict((prefix, dict(counters)) for prefix, counters in negative_cache_metrics.items())
+
+def count_negative(key_prefix, counter):
+    counters = negative_cache_metrics.setdefault(key_prefix, dict(stored=0, hits=0))
+    counters[counter] += 1
+
+def compile_or_raise(key, key_prefix, data, func, errors, ignored=()):
+    """ func(data), remembering the errors it raises for NEGATIVE_CACHE[key_prefix] seconds """
+    timeout = NEGATIVE_CACHE.get(key_prefix)
+    if not timeout or not errors:
+        return func(data)
+    backend = get_cache(CACHE_NAME)
+    error = backend.get(key + ':error')
+    if error is not None:
+        count_negative(key_prefix, 'hits')
+        raise error
+    try:
+        return func(data)
+    except errors as e:
+        if isinstance(e, NEGATIVE_CACHE_IGNORED + ignored):
+            raise
+        try:
+            backend.set(key + ':error', e, timeout)
+        except Exception:
+            logging.getLogger('audish.cache').warning('Could not cache %s error', key, exc_info=True)
+        else:
+            count_negative(key_prefix, 'stored')
+        raise
+
+def relocation_cache_get_or_set(key_prefix, data, func, key_suffix='', background=None,
+                                errors=(), ignored=()):
+    """
+    key_suffix distinguishes results depending on more than data (e.g scss imports).
+    background: serve stale entries while recompiling them in the background
+    (defaults to RELOCATION_CACHE_BACKGROUND_REFRESH, needs a recache strategy).
+    errors: the exceptions of func which mean data doesn't compile (except the ignored ones),
+    see NEGATIVE_CACHE. None by default: any other failure may well be transient.
+    """
+    key = '%s_%s' % (key_prefix, hashlib.md5(to_bytes(data)).hexdigest())
+    if key_suffix:
+        key = '%s_%s' % (key, key_suffix)
+    if background is None:
+        background = BACKGROUND_REFRESH
+    refresh = (lambda: func(data)) if background else None
+    with cached_data(key, backend=CACHE_NAME, recache_strategy=RECACHE_STRATEGY, refresh=refresh,
+                     compression=COMPRESSION) as ctx:
         if not ctx.found:
-            ctx.response = func(data)
+            ctx.response = compile_or_raise(key, key_prefix, data, func, errors, ignored)
     return ctx.response
 
+def section_hash(section_data):
+    """ md5 of the content, or the fingerprint of the input and processing of a lazy section """
+    lazy = LazySection.find(section_data)
+    if lazy is not None and lazy.fingerprint is not None:
+        return lazy.fingerprint
+    return buf_md5(section_data).hexdigest()
+
+def transform(section, identity, step):
+    """ Replaces the items of section with step(items), once the section is read with LAZY_PROCESSING """
+    if LAZY_PROCESSING:
+        LazySection.of(section).defer(identity, step)
+        return
+    items = step(section)
+    section.clear()
+    section.extend(items)
+
+def processor_name(processor):
+    return '%s.%s' % (getattr(processor, '__module__', None), getattr(processor, '__name__', type(processor).__name__))
+
+_compiler_versions = []
+def compiler_versions():
+    """ {compiler: version}, None for the compilers which aren't installed (looked up once per process) """
+    if not _compiler_versions:
+        from .coffeeutils import COFFEE_SCRIPT_PATH
+        versions = dict(coffee=os.path.basename(COFFEE_SCRIPT_PATH))
+        for name in ('scss', 'slimit'):
+            try:
+                module = __import__(name)
+            except ImportError:
+                versions[name] = None
+            else:
+                versions[name] = getattr(module, '__version__', None) or getattr(module, 'VERSION', None)
+        _compiler_versions.append(versions)
+    return _compiler_versions[0]
+
+def step_identity(compiler, *parts):
+    """ The identity of a deferred step (see transform) compiling with compiler, whose version is part of it """
+    return ':'.join(('%s@%s' % (compiler, compiler_versions()[compiler]),) + parts)
+
+_fingerprints = dict()
+def pipeline_fingerprint(pipeline):
+    """ md5 of what processed sections depend on besides their input: processors, compilers and bundle layout """
+    names = tuple(processor_name(processor) for processor in pipeline)
+    if names not in _fingerprints:
+        state = dict(processors=names, compilers=compiler_versions())
+        if 'relocation.bundling.bundle' in names:
+            state['layout'] = get_layout().layout
+        _fingerprints[names] = hashlib.md5(json.dumps(state, sort_keys=True).encode('utf8')).hexdigest()
+    return _fingerprints[names]
+
+def source_key(fingerprint, section_name, inputs, parts=()):
+    """
+    md5 of the pipeline fingerprint, the section name, its inputs ((name, section) pairs) and
+    the parts processors add (e.g the digest of the files scss imports)
+    """
+    digest = hashlib.md5(('%s\0%s' % (fingerprint, section_name)).encode('utf8'))
+    for name, section in inputs:
+        digest.update(('\0%s\0' % name).encode('utf8'))
+        for item in section:
+            digest.update(to_bytes(item))
+    for part in parts:
+        digest.update(('\0%s' % part).encode('utf8'))
+    return digest.hexdigest()
+
+def section_key(sections, section_name):
+    """ The key of an externified section's url: its source key when it has one, else its hash """
+    key = getattr(sections, 'source_keys', {}).get(section_name)
+    return key or section_hash(sections[section_name])
+
 def external_http_reference_with_data_hash(destination_format, reverse_view):
     def reference_builder(template_name, section_name, section_data):
         return destination_format % reverse(reverse_view, kwargs=dict(
             template_name=template_name,
             section=section_name,
-            data_hash=hashlib.md5(buf_to_unicode(section_data)).hexdigest(),
+            data_hash=section_hash(section_data),
         ))
     return reference_builder
 
+def external_http_reference_with_source_key(destination_format, reverse_view):
+    """
+    The url holds the section's source key (see record_source_keys) rather than its processed data's hash,
+    so the reference doesn't wait for the compilers (which don't run at all with LAZY_PROCESSING)
+    """
+    def reference_builder(template_name, section_name, section_data, source_key=None):
+        return destination_format % reverse(reverse_view, kwargs=dict(
+            template_name=template_name,
+            section=section_name,
+            data_hash=source_key or section_hash(section_data),
+        ))
+    reference_builder.source_keyed = True
+    return reference_builder
+
 def external_http_reference(destination_format, reverse_view):
     return lambda template_name, section_name, section_data: (
         destination_format % reverse(reverse_view, kwargs=dict(template_name=template_name, section=section_name)))
 
 EXTERNIFY_VIEW = getattr(settings, 'RELOCATION_EXTERNIFY_VIEW', 'externified_view')
+# 'data_hash' (the processed section's md5) or 'source_key' urls for the default rules
+EXTERNIFY_REFERENCE = dict(
+    data_hash = external_http_reference_with_data_hash,
+    source_key = external_http_reference_with_source_key,
+)[getattr(settings, 'RELOCATION_EXTERNIFY_REFERENCE', 'data_hash')]
 EXTERNIFY_SECTION_RULES = getattr(settings, 'RELOCATION_EXTERNIFY_RULES', None) or Bunch(
     javascript = Bunch(
-        reference = external_http_reference_with_data_hash(
+        reference = EXTERNIFY_REFERENCE(
             destination_format = '<script type="text/javascript" src="%s"></script>',
             reverse_view = EXTERNIFY_VIEW,
         ),
         mimetype = 'application/javascript',
     ),
     css = Bunch(
-        reference = external_http_reference_with_data_hash(
+        reference = EXTERNIFY_REFERENCE(
             destination_format = '<link rel="stylesheet" type="text/css" href="%s"/>',
             reverse_view = EXTERNIFY_VIEW,
         ),
@@ -46,49 +205,130 @@ EXTERNIFY_SECTION_RULES = getattr(settings, 'RELOCATION_EXTERNIFY_RULES', None)
     ),
 )
 
+def section_reference(rule, template_name, section_name, sections):
+    if getattr(rule.reference, 'source_keyed', False):
+        return rule.reference(template_name, section_name, sections[section_name],
+                              getattr(sections, 'source_keys', {}).get(section_name))
+    return rule.reference(template_name, section_name, sections[section_name])
+
 def externify(template_name, main, sections, rules=EXTERNIFY_SECTION_RULES):
     for section_name, ruledata in rules.items():
         if section_name not in sections:
             continue
-        new_section = copy.deepcopy(sections[section_name])
-        sections[section_name].clear()
-        sections[section_name].append(ruledata.reference(template_name, section_name, new_section))
-        sections[section_name] = new_section
+        # The section itself is what's placed in the destinations, it gets a reference per bundle
+        destination = sections[section_name]
+        references = []
+        for name in section_bundles(sections, section_name):
+            # clear makes new deques, a shallow copy keeps the content (and doesn't compile lazy sections)
+            sections[name] = copy.copy(sections[name])
+            references.append(section_reference(ruledata, bundle_template(template_name, name), name, sections))
+        destination.clear()
+        destination.extend(references)
+
+def record_source_keys(template_name, main, sections, pipeline, rules=EXTERNIFY_SECTION_RULES):
+    """
+    externify's prepare: keeps the source keys of the sections of source keyed rules as
+    sections.source_keys, from their input before any processor changed it. A section's inputs
+    are the section and the ones processors add to it (their section_inputs attribute). Processors
+    whose output depends on more than the inputs add key parts: their section_key_parts attribute
+    maps section names to functions of the section returning a string.
+    Sections made by processors (e.g bundles) have no source key.
+    """
+    names = [name for name, rule in rules.items()
+             if name in sections and getattr(rule.reference, 'source_keyed', False)]
+    if not names:
+        return
+    fingerprint = pipeline_fingerprint(pipeline)
+    section_inputs = dict()
+    key_parts = dict()
+    for processor in pipeline:
+        for name, others in getattr(processor, 'section_inputs', {}).items():
+            section_inputs.setdefault(name, set()).update(others)
+        for name, part in getattr(processor, 'section_key_parts', {}).items():
+            key_parts.setdefault(name, []).append(part)
+    sections.source_keys = dict(
+        (name, source_key(fingerprint, name, [(input_name, sections[input_name])
+                                              for input_name in [name] + sorted(section_inputs.get(name, ()))
+                                              if input_name in sections],
+                          [part(sections[name]) for part in key_parts.get(name, ())]))
+        for name in names)
+externify.prepare = record_source_keys
 
-scss_compiler = None
-def get_scss_compiler():
-    global scss_compiler
-    if scss_compiler:
-        return scss_compiler
+def bundle_template(template_name, section_name):
+    """ The common bundle is referenced through the same template from every page """
+    base_name = base_section_name(section_name)
+    if section_name == bundle_name(base_name, COMMON_BUNDLE):
+        return get_layout().owner(base_name)
+    return template_name
 
+def make_scss_compiler():
     import scss
     # Use our own logger instead of their default
     scss.log = logging.getLogger('reloc.scss')
-    scss_compiler = scss.Scss()
-    return scss_compiler
+    return scss.Scss()
+
+# scss.Scss keeps its compilation state on the instance, each thread checks out its own
+scss_pool = CompilerPool(make_scss_compiler, size=getattr(settings, 'RELOCATION_SCSS_POOL_SIZE', 4),
+                         warm_up=lambda compiler: compiler.compile(u'a { b: c; }'))
+
+def compile_scss(data):
+    with scss_pool.compiler() as compiler:
+        return compiler.compile(data)
+
+def scss_errors():
+    """
+    relocation_cache_get_or_set's errors for scss compiles: pyScss (1.2+) raises SassSyntaxError and
+    SassError when the source doesn't compile, older versions have nothing telling them apart.
+    Missing imports and dependencies are never remembered.
+    """
+    try:
+        from scss import errors
+    except ImportError:
+        return dict()
+    names = lambda *names: tuple(getattr(errors, name) for name in names if hasattr(errors, name))
+    return dict(errors=names('SassSyntaxError', 'SassError'), ignored=names('SassImportError', 'SassMissingDependency'))
 
 def scss(template_name, main, sections):
-    scss_sections = ('css',)
+    scss_sections = section_bundles(sections, 'css')
     for section in scss_sections:
-        if section not in sections:
-            continue
-        scssed = relocation_cache_get_or_set('scss', buf_to_unicode(sections[section]), lambda data: get_scss_compiler().compile(data))
-        sections[section].clear()
-        sections[section].append(scssed)
+        data = buf_to_unicode(sections[section])
+        signature = scssdeps.signature(data)
+        transform(sections[section], step_identity('scss', signature), lambda items, data=data, signature=signature: [
+            relocation_cache_get_or_set('scss', data, compile_scss, key_suffix=signature, **scss_errors())])
+# The compiled css depends on the files it imports too
+scss.section_key_parts = dict(css=lambda section: scssdeps.signature(buf_to_unicode(section)))
+
+def coffee_errors(pejis):
+    """
+    relocation_cache_get_or_set's errors for coffee compiles: pejis raises ProgramError (or RuntimeError
+    for a SyntaxError) when the source doesn't compile. A missing runtime or one that failed (e.g a
+    node process killed mid-compile) has nothing to do with the source, they're never remembered.
+    """
+    return dict(errors=pejis.Error, ignored=(pejis.RuntimeUnavailable, pejis.RuntimeFailure))
+
+# The coffee fragments of a document are compiled concurrently by up to this many threads
+COFFEE_THREADS = getattr(settings, 'RELOCATION_COFFEE_THREADS', 4)
 
 def coffee(template_name, main, sections):
-    from .coffeeutils import coffee as compile_coffeescript
+    from .coffeeutils import coffee as compile_coffeescript, pejis
     if not all(section in sections for section in ('coffee', 'javascript')):
         return
 
-    sections['javascript'].append(buf_to_unicode(
-        relocation_cache_get_or_set('coffee', part, compile_coffeescript) for part in sections['coffee']))
+    parts = [to_unicode(part) for part in sections['coffee']]
+    compile_parts = lambda: thread_map(lambda part: relocation_cache_get_or_set(
+        'coffee', part, compile_coffeescript, **coffee_errors(pejis)), parts, COFFEE_THREADS)
+    if LAZY_PROCESSING:
+        LazySection.of(sections['javascript']).defer(step_identity('coffee', buf_md5(parts).hexdigest()),
+                                                     lambda items: list(items) + compile_parts())
+        return
+
+    # Compiled fragments are kept apart so they can be bundled
+    sections['javascript'].extend(compile_parts())
+coffee.section_inputs = dict(javascript=('coffee',))
 
 def minify_js(template_name, main, sections):
     import slimit
-    section = 'javascript'
-    if section not in sections:
-        return
-    minified = relocation_cache_get_or_set('minify', buf_to_unicode(sections[section]), slimit.minify)
-    sections[section].clear()
-    sections[section].append(minified)
+    for section in section_bundles(sections, 'javascript'):
+        # slimit raises SyntaxError for sources it can't parse
+        transform(sections[section], step_identity('slimit'), lambda items: [
+            relocation_cache_get_or_set('minify', buf_to_unicode(items), slimit.minify, errors=SyntaxError)])
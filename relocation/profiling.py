@@ -0,0 +1,302 @@
+"""
+Memory profiling of the relocation pipeline, per stage (render, deserialize, prepare, each
+processor, join):
+
+ * with tracemalloc (python 3.4+): the allocations retained and the peak above the stage's
+   start (peak needs python 3.9, it's None before), top reports allocation sites.
+ * otherwise (python 2): the growth of the process' resident size (retained, from /proc where
+   there's one) and of its high-water mark (peak, reset per stage on linux, else from getrusage
+   which only grows), and of the number of objects the garbage collector tracks. top reports the
+   object types whose count grew the most.
+
+    DJANGO_SETTINGS_MODULE=mysite.settings python -m relocation.profiling main.html --context fixture.json --top 5
+
+The context fixture is a JSON object. With RELOCATION_PROFILE_MEMORY perform_relocation
+profiles every document (locally, never in the worker) and logs the reports to the
+'relocation.profiling' logger as JSON, they're also kept as sections.memory_report.
+"""
+import gc
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from . import load_processors, prepare_processors
+from .engine import RelocationSerializer
+from .utils import buf_to_bytes, buf_to_unicode
+
+def stage_name(processor):
+    if isinstance(processor, str):
+        return processor
+    return '%s.%s' % (getattr(processor, '__module__', None), getattr(processor, '__name__', type(processor).__name__))
+
+class StageProfiler(object):
+    """ top: the number of allocation sites (file:line) reported per stage, by retained size """
+    method = 'tracemalloc'
+
+    def __init__(self, top=0):
+        if tracemalloc is None:
+            raise RuntimeError('StageProfiler needs tracemalloc (python 3.4+), see make_profiler')
+        self.top = top
+        self.stages = []
+        self.started = False
+
+    def __enter__(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started = True
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.started:
+            tracemalloc.stop()
+            self.started = False
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    @contextmanager
+    def stage(self, name):
+        before_snapshot = self._snapshot() if self.top else None
+        resets_peak = hasattr(tracemalloc, 'reset_peak')
+        if resets_peak:
+            tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.time()
+        yield
+        elapsed = time.time() - start
+        current, peak = tracemalloc.get_traced_memory()
+        entry = OrderedDict((
+            ('stage', name),
+            ('seconds', elapsed),
+            ('retained', current - before),
+            ('peak', peak - before if resets_peak else None),
+        ))
+        if self.top:
+            entry['top'] = [OrderedDict((
+                ('location', '%s:%d' % (stat.traceback[0].filename, stat.traceback[0].lineno)),
+                ('size', stat.size_diff),
+                ('count', stat.count_diff),
+            )) for stat in self._snapshot().compare_to(before_snapshot, 'lineno') if stat.size_diff][:self.top]
+        self.stages.append(entry)
+
+    def report(self, **meta):
+        ret = OrderedDict(sorted(meta.items()))
+        ret['method'] = self.method
+        ret['stages'] = self.stages
+        retained = [stage['retained'] for stage in self.stages if stage['retained'] is not None]
+        ret['retained'] = sum(retained) if retained else None
+        peaks = [stage['peak'] for stage in self.stages if stage['peak'] is not None]
+        ret['peak'] = max(peaks) if peaks else None
+        return ret
+
+def resident_size():
+    """ The process' resident size in bytes, None where there's no /proc """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, ValueError, IndexError):
+        return None
+
+_malloc_trim = []
+def trim_heap():
+    """ Returns the free heap memory to the system (glibc), so reusing it shows in the resident size """
+    if not _malloc_trim:
+        try:
+            import ctypes
+            _malloc_trim.append(ctypes.CDLL(None).malloc_trim)
+        except (ImportError, OSError, AttributeError):
+            _malloc_trim.append(None)
+    if _malloc_trim[0] is not None:
+        _malloc_trim[0](0)
+
+def reset_max_resident_size():
+    """ Resets the high-water mark to the current resident size (linux 4.0+), False when it can't """
+    gc.collect()
+    trim_heap()
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except (IOError, OSError):
+        return False
+
+def max_resident_size():
+    """ The process' resident size high-water mark in bytes, None without /proc and the resource module """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes, but bytes on OS X
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+class RusageProfiler(StageProfiler):
+    """ StageProfiler without tracemalloc, top: the number of object types reported per stage, by count growth """
+    method = 'rusage'
+
+    def __init__(self, top=0):
+        self.top = top
+        self.stages = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def _types(self):
+        return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+    @contextmanager
+    def stage(self, name):
+        before_types = self._types() if self.top else None
+        before_objects = len(gc.get_objects())
+        reset_max_resident_size()
+        before, before_peak = resident_size(), max_resident_size()
+        start = time.time()
+        yield
+        elapsed = time.time() - start
+        current, peak = resident_size(), max_resident_size()
+        delta = lambda after, before: None if after is None or before is None else after - before
+        entry = OrderedDict((
+            ('stage', name),
+            ('seconds', elapsed),
+            ('retained', delta(current, before)),
+            ('peak', delta(peak, before_peak)),
+            ('objects', len(gc.get_objects()) - before_objects),
+        ))
+        if self.top:
+            growth = self._types()
+            growth.subtract(before_types)
+            entry['top'] = [OrderedDict((('location', type_name), ('size', None), ('count', count)))
+                            for type_name, count in growth.most_common(self.top) if count > 0]
+        self.stages.append(entry)
+
+    def report(self, **meta):
+        ret = StageProfiler.report(self, **meta)
+        ret['objects'] = sum(stage['objects'] for stage in self.stages)
+        return ret
+
+def make_profiler(top=0):
+    """ A StageProfiler with tracemalloc when it's there, else a RusageProfiler """
+    return (StageProfiler if tracemalloc is not None else RusageProfiler)(top)
+
+def profile_stages(profiler, template_name, rendered_template, processors, sections=None):
+    """ run_processors and the join of the main document, each in a stage of profiler (already tracing) """
+    with profiler.stage('deserialize'):
+        serializer = RelocationSerializer.for_document(rendered_template)
+        main, sections = serializer.deserialize(rendered_template, sections)
+    pipeline = load_processors(processors)
+    with profiler.stage('prepare'):
+        prepare_processors(template_name, main, sections, pipeline)
+    for name, processor in zip(processors, pipeline):
+        with profiler.stage(stage_name(name)):
+            processor(template_name, main, sections)
+    with profiler.stage('join'):
+        output = buf_to_unicode(main) if isinstance(rendered_template, type(u'')) else buf_to_bytes(main)
+    return main, sections, output
+
+def profile_relocation(template_name, rendered_template, processors, sections=None, top=0):
+    """ returns (main, sections, report) """
+    with make_profiler(top) as profiler:
+        main, sections, output = profile_stages(profiler, template_name, rendered_template, processors, sections)
+        report = profiler.report(template=template_name, input_size=len(rendered_template),
+                                 output_size=len(output))
+    return main, sections, report
+
+def perform_profiled_relocation(template_name, rendered_template, processors, sections=None):
+    """
+    perform_relocation with RELOCATION_PROFILE_MEMORY. Profiling never fails a relocation: None when
+    no profiler could be made (perform_relocation then relocates as usual), and a report which can't be
+    logged is skipped. The processors' errors are raised as they are.
+    """
+    log = logging.getLogger('relocation.profiling')
+    try:
+        profiler = make_profiler()
+    except Exception:
+        log.warning('Could not profile %s', template_name, exc_info=True)
+        return None
+    with profiler:
+        main, sections, output = profile_stages(profiler, template_name, rendered_template, processors, sections)
+    try:
+        report = profiler.report(template=template_name, input_size=len(rendered_template), output_size=len(output))
+        log.info(json.dumps(report))
+    except Exception:
+        log.warning('Could not report the profile of %s', template_name, exc_info=True)
+    else:
+        sections.memory_report = report
+    return main, sections
+
+def format_report(report):
+    size = lambda n: '-' if n is None else '%.1fKB' % (n / 1024.0)
+    lines = ['%s: %s in, %s out' % (report['template'], size(report['input_size']), size(report['output_size'])),
+             '%-50s %10s %12s %12s' % ('stage', 'seconds', 'retained', 'peak')]
+    for stage in report['stages']:
+        lines.append('%-50s %10.4f %12s %12s' % (stage['stage'], stage['seconds'], size(stage['retained']),
+                                                 size(stage['peak'])))
+        for site in stage.get('top', ()):
+            lines.append('    %-60s %12s %8d' % (site['location'], size(site['size']), site['count']))
+    lines.append('%-50s %10s %12s %12s' % ('total', '', size(report['retained']), size(report['peak'])))
+    if report.get('method') == 'rusage':
+        lines.append('(resident size and its high-water mark, %d objects tracked by the gc)' % report['objects'])
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='relocation memory profile of a django template')
+    parser.add_argument('template', help='template name, as given to the template loaders')
+    parser.add_argument('--context', help='JSON object fixture for the template context')
+    parser.add_argument('--top', type=int, default=0, help='allocation sites (object types without tracemalloc) reported per stage')
+    parser.add_argument('--format', choices=('json', 'text'), default='text')
+    parser.add_argument('-o', '--output', help='write the report to this file (default: stdout)')
+    args = parser.parse_args(argv)
+
+    from django.conf import settings
+    from django.template import Context
+    from .djangoutils import load_template, relocatable, relocation_add_to_builtins
+    from .djangoutils.templatetags import install_section_collector
+    relocation_add_to_builtins()
+    context_data = {}
+    if args.context:
+        with open(args.context) as f:
+            context_data = json.load(f)
+
+    template = load_template(args.template)
+    with make_profiler(args.top) as profiler:
+        with profiler.stage('render'):
+            context = Context(context_data)
+            sections = install_section_collector(context)
+            rendered = relocatable(template.render(context))
+        main, sections, output = profile_stages(profiler, args.template, rendered, settings.RELOCATION_PROCESSORS,
+                                                sections)
+        report = profiler.report(template=args.template, input_size=len(rendered), output_size=len(output))
+
+    text = json.dumps(report, indent=2) if args.format == 'json' else format_report(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,132 @@
+"""
+Tracks the files a scss compile reads through @import, so cache keys can include them.
+
+The signature is built from the imported files' content digests (not their mtimes, which
+every deploy changes). Both the digests and the resolved import graph are memoized per
+process and revalidated with a stat of each file, and of each candidate path that was
+looked up before it (or in vain), so a file added later in the load paths is picked up.
+The import graphs of the MAX_IMPORTS most recently compiled sources are kept.
+"""
+import os
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+IMPORT_RE = re.compile(r'@import\s+([^;]+);?')
+SCSS_EXTENSIONS = ('.scss', '.sass')
+MAX_IMPORTS = 1024
+
+_lock = threading.Lock()
+_digests = {}   # path -> (stat, digest)
+_imports = OrderedDict()   # source and load paths digest -> (stats of the paths looked up, dependencies), LRU
+
+def get_load_paths():
+    from django.conf import settings
+    load_paths = getattr(settings, 'RELOCATION_SCSS_LOAD_PATHS', None)
+    if load_paths is None:
+        try:
+            from scss import config
+            load_paths = config.LOAD_PATHS
+        except ImportError:
+            try:
+                import scss
+            except ImportError:
+                # Nothing to track, compiling will fail anyway
+                return []
+            load_paths = getattr(scss, 'LOAD_PATHS', ())
+    if isinstance(load_paths, string_types):
+        load_paths = load_paths.split(',')
+    return [path.strip() for path in load_paths if path.strip()]
+
+def parse_imports(source):
+    for match in IMPORT_RE.finditer(source):
+        for name in match.group(1).split(','):
+            name = name.strip().strip('"\'')
+            if not name or name.startswith(('url(', 'http://', 'https://', '//')) or name.endswith('.css'):
+                continue
+            yield name
+
+def candidates(name):
+    directory, basename = os.path.split(name)
+    if basename.endswith(SCSS_EXTENSIONS):
+        names = (basename, '_' + basename)
+    else:
+        names = [prefix + basename + ext for ext in SCSS_EXTENSIONS for prefix in ('_', '')]
+    return [os.path.join(directory, n) for n in names]
+
+def resolve(name, directories, looked_up=None):
+    """ The absolute path of the file imported as name, the missing candidates are added to looked_up """
+    for directory in directories:
+        for candidate in candidates(name):
+            path = os.path.abspath(os.path.join(directory, candidate))
+            if os.path.isfile(path):
+                return path
+            if looked_up is not None:
+                looked_up.add(path)
+    return None
+
+def file_stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
+
+def file_digest(path):
+    stat = file_stat(path)
+    cached = _digests.get(path)
+    if cached and cached[0] == stat:
+        return cached[1]
+    if stat is None:
+        digest = None
+    else:
+        with open(path, 'rb') as f:
+            digest = hashlib.md5(f.read()).hexdigest()
+    with _lock:
+        _digests[path] = (stat, digest)
+    return digest
+
+def dependencies(source, load_paths=None):
+    """ returns the sorted absolute paths of all the files (transitively) imported by source """
+    if load_paths is None:
+        load_paths = get_load_paths()
+    key = hashlib.md5(('%s\0%s' % ('\0'.join(load_paths), source)).encode('utf8')).hexdigest()
+    with _lock:
+        cached = _imports.pop(key, None)
+        if cached:
+            _imports[key] = cached
+    if cached and all(file_stat(path) == stat for path, stat in cached[0]):
+        return cached[1]
+
+    found = set()
+    missing = set()
+    pending = [(source, load_paths)]
+    while pending:
+        text, directories = pending.pop()
+        for name in parse_imports(text):
+            path = resolve(name, directories, missing)
+            if path is None or path in found:
+                continue
+            found.add(path)
+            with open(path, 'rb') as f:
+                pending.append((f.read().decode('utf8'), [os.path.dirname(path)] + load_paths))
+    deps = sorted(found)
+    stats = [(path, file_stat(path)) for path in deps] + [(path, None) for path in sorted(missing - found)]
+    with _lock:
+        _imports[key] = (stats, deps)
+        while len(_imports) > MAX_IMPORTS:
+            _imports.popitem(last=False)
+    return deps
+
+def signature(source, load_paths=None):
+    """ A digest of the contents of every file imported by source ('' when it imports nothing) """
+    deps = dependencies(source, load_paths)
+    if not deps:
+        return ''
+    return hashlib.md5(''.join('%s:%s\n' % (path, file_digest(path)) for path in deps).encode('utf8')).hexdigest()
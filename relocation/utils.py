@@ -1,12 +1,63 @@
 import io
+import hashlib
+import threading
+from functools import reduce
 from importlib import import_module
+from contextlib import contextmanager
+try:
+    from queue import LifoQueue, Empty
+except ImportError:
+    from Queue import LifoQueue, Empty
 
-buf_to_unicode = lambda buf: u''.join(buf)
+text_type = type(u'')
+
+# Buffers of documents relocated as bytes (see engine.BytesRelocationSerializer) hold UTF-8
+# memoryview slices next to text, decoded only when text is needed
+def to_unicode(item):
+    if isinstance(item, text_type):
+        return item
+    if isinstance(item, memoryview):
+        item = item.tobytes()
+    return item.decode('utf8')
+
+def to_bytes(item):
+    return item.encode('utf8') if isinstance(item, text_type) else item
+
+def buf_to_unicode(buf):
+    try:
+        return u''.join(buf)
+    except (TypeError, UnicodeDecodeError):
+        return u''.join(to_unicode(item) for item in buf)
+
+def buf_to_bytes(buf):
+    """ The UTF-8 encoding of a buffer, bytes items are copied once and never decoded """
+    try:
+        # python 3 joins memoryviews, python 2 promotes ascii bytes joined with text to text
+        ret = b''.join(buf)
+    except (TypeError, UnicodeDecodeError):
+        out = io.BytesIO()
+        write = out.write
+        for item in buf:
+            write(item.encode('utf8') if isinstance(item, text_type) else item)
+        return out.getvalue()
+    return ret.encode('utf8') if isinstance(ret, text_type) else ret
+
+def buf_md5(buf):
+    """ md5 of the UTF-8 encoded buffer, without joining it """
+    digest = hashlib.md5()
+    update = digest.update
+    for item in buf:
+        update(item.encode('utf8') if isinstance(item, text_type) else item)
+    return digest
 
 class SearchableStringStream(io.IOBase):
     def __init__(self, s=u''):
         self.s = s
         self.pos = 0
+    def slice(self, start, end):
+        return self.s[start:end]
+    def slice_text(self, start, end):
+        return self.s[start:end]
     def seek(self, pos, whence = 0):
         if whence == 0:
             new_pos = pos
@@ -31,7 +82,7 @@ class SearchableStringStream(io.IOBase):
             end = None
         else:
             end = self.pos + size
-        ret = self.s[self.pos:end]
+        ret = self.slice(self.pos, end)
         self.pos += len(ret)
         return ret
 
@@ -46,13 +97,46 @@ class SearchableStringStream(io.IOBase):
         if count < 0:
             raise EOFError("Couldn't find '%s' in buffer (start=%r, end=%r)"%(sub, start, end))
         ret = self.read(count)
-        self.seek(len(sub), 1)
+        # found, so within the string
+        self.pos += len(sub)
+        return ret
+
+    def readcopy(self, size):
+        """ read, as a copy of the string's type (the markers' types) """
+        ret = self.s[self.pos:self.pos + size]
+        self.pos += len(ret)
+        return ret
+
+    def readtext(self, size):
+        """ read, as text (the markers' names) """
+        end = min(self.pos + size, len(self.s))
+        ret = self.slice_text(self.pos, end)
+        self.pos = end
+        return ret
+
+    def readtextuntil(self, sub):
+        """ readuntil, as text """
+        count = self.find(sub)
+        if count < 0:
+            raise EOFError("Couldn't find '%s' in buffer"%(sub,))
+        ret = self.readtext(count)
+        self.pos += len(sub)
         return ret
 
     def expect(self, expected):
         got = self.read(len(expected))
         assert got == expected, 'Expected: "%s". Got: "%s".'%(expected, got)
 
+class MemoryViewStream(SearchableStringStream):
+    """ SearchableStringStream over bytes whose reads are zero-copy memoryview slices """
+    def __init__(self, s=b''):
+        SearchableStringStream.__init__(self, s)
+        self.view = memoryview(s)
+    def slice(self, start, end):
+        return self.view[start:end]
+    def slice_text(self, start, end):
+        return self.s[start:end].decode('utf8')
+
 
 def smart_import(import_path):
     def resolve_part(base, part):
@@ -70,3 +154,80 @@ def load_function(function_or_name):
     else:
         return smart_import(function_or_name)
 
+
+_thread_pools = dict()
+_thread_pools_lock = threading.Lock()
+def thread_map(func, items, threads):
+    """ map over a shared pool of threads (made once per size), in order, for blocking calls like compiles """
+    items = list(items)
+    if threads <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with _thread_pools_lock:
+        if threads not in _thread_pools:
+            from multiprocessing.pool import ThreadPool
+            _thread_pools[threads] = ThreadPool(threads)
+    return _thread_pools[threads].map(func, items)
+
+class CompilerPool(object):
+    """
+    Up to size compilers made by factory (and passed to warm_up once made), for compilers
+    which can't be used by two threads at once. A compiler whose compile raised is discarded.
+    """
+    def __init__(self, factory, size=4, warm_up=None):
+        self.factory = factory
+        self.size = size
+        self.warm_up = warm_up
+        # The most recently used (warmest) compiler is checked out first
+        self.idle = LifoQueue()
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def _create(self):
+        try:
+            compiler = self.factory()
+            if self.warm_up:
+                self.warm_up(compiler)
+            return compiler
+        except:
+            with self.lock:
+                self.created -= 1
+            raise
+
+    def _reserve(self):
+        with self.lock:
+            if self.created >= self.size:
+                return False
+            self.created += 1
+            return True
+
+    def _checkout(self):
+        while True:
+            try:
+                return self.idle.get_nowait()
+            except Empty:
+                pass
+            if self._reserve():
+                return self._create()
+            # Rechecks every once in a while, in case a failed compiler was discarded
+            try:
+                return self.idle.get(timeout=0.1)
+            except Empty:
+                pass
+
+    @contextmanager
+    def compiler(self):
+        compiler = self._checkout()
+        try:
+            yield compiler
+        except:
+            with self.lock:
+                self.created -= 1
+            raise
+        self.idle.put(compiler)
+
+    def prefill(self, count=None):
+        """ Makes (and warms up) compilers ahead of the first requests """
+        for _ in range(self.size if count is None else count):
+            if not self._reserve():
+                break
+            self.idle.put(self._create())
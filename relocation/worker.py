@@ -0,0 +1,251 @@
+"""
+Runs the relocation pipeline in a separate service, so processing doesn't compete with
+request handling and compilers stay warm in long lived processes:
+
+    DJANGO_SETTINGS_MODULE=mysite.settings python -m relocation.worker /var/run/relocation.sock --processes 4
+
+and in the app servers' settings:
+
+    RELOCATION_WORKER_ADDRESS = '/var/run/relocation.sock'    # or 'host:port'
+
+perform_relocation then sends (template_name, rendered, sections) to the worker and gets
+(main, sections) back. Whenever the worker is busy (more than --max-pending documents in
+flight), unreachable or too slow the document is processed locally instead.
+
+Documents are pickled over the connection, keep the socket private (or set
+RELOCATION_WORKER_AUTHKEY on both ends). A host:port worker won't start without
+RELOCATION_WORKER_AUTHKEY: whoever can reach the port could run code on the host.
+"""
+import sys
+import time
+import logging
+import argparse
+import threading
+import multiprocessing
+from multiprocessing.connection import Client, Listener
+try:
+    from queue import LifoQueue, Empty
+except ImportError:
+    from Queue import LifoQueue, Empty
+try:
+    import copyreg
+except ImportError:
+    import copy_reg as copyreg
+
+from . import run_processors, section_collector
+
+OK, BUSY, ERROR = 'ok', 'busy', 'error'
+
+# Documents relocated as bytes hold memoryview slices, which are sent as bytes
+copyreg.pickle(memoryview, lambda view: (bytes, (view.tobytes(),)))
+
+def parse_address(address):
+    """ 'host:port' -> (host, port), anything else is a unix socket path """
+    host, separator, port = address.rpartition(':')
+    if separator and port.isdigit():
+        return (host, int(port))
+    return address
+
+## worker processes
+
+def warm_up():
+    """ Loads the compilers once per worker process """
+    from .processors import scss_pool
+    from .coffeeutils import coffee_context, pejis
+    try:
+        scss_pool.prefill(1)
+    except ImportError:
+        pass
+    try:
+        coffee_context()
+    except pejis.RuntimeUnavailable:
+        pass
+
+def process(template_name, rendered_template, sections):
+    from django.conf import settings
+    main, sections = run_processors(template_name, rendered_template, settings.RELOCATION_PROCESSORS,
+                                    section_collector(sections))
+    # Deferred processing (RELOCATION_LAZY_PROCESSING) can't be pickled, it's done here
+    for section in sections.values():
+        for item in section:
+            pass
+    return main, sections
+
+## server
+
+class WorkerServer(object):
+    def __init__(self, address, processes=None, max_pending=None, authkey=None):
+        if isinstance(address, tuple) and not authkey:
+            raise ValueError('A worker listening on %s:%s needs RELOCATION_WORKER_AUTHKEY' % address)
+        self.address = address
+        self.processes = processes or multiprocessing.cpu_count()
+        self.max_pending = max_pending or self.processes * 2
+        self.pending = threading.BoundedSemaphore(self.max_pending)
+        self.authkey = authkey
+        self.metrics = dict(processed=0, busy=0, errors=0)
+
+    def serve_forever(self):
+        self.pool = multiprocessing.Pool(self.processes, initializer=warm_up)
+        listener = Listener(self.address, authkey=self.authkey)
+        logging.getLogger('relocation.worker').info('Serving on %s with %d processes', self.address, self.processes)
+        try:
+            while True:
+                try:
+                    connection = listener.accept()
+                except (IOError, EOFError):
+                    # e.g a client failing authentication
+                    logging.getLogger('relocation.worker').warning('Refused a connection', exc_info=True)
+                    continue
+                thread = threading.Thread(target=self.handle, args=(connection,))
+                thread.daemon = True
+                thread.start()
+        finally:
+            listener.close()
+            self.pool.terminate()
+
+    def handle(self, connection):
+        try:
+            while True:
+                try:
+                    request = connection.recv()
+                except (EOFError, IOError):
+                    break
+                connection.send(self.respond(request))
+        finally:
+            connection.close()
+
+    def respond(self, request):
+        if not self.pending.acquire(False):
+            self.metrics['busy'] += 1
+            return BUSY, None
+        try:
+            result = self.pool.apply(process, request)
+        except Exception as e:
+            self.metrics['errors'] += 1
+            return ERROR, e
+        finally:
+            self.pending.release()
+        self.metrics['processed'] += 1
+        return OK, result
+
+## client
+
+class WorkerUnavailable(Exception):
+    pass
+
+class WorkerClient(object):
+    """
+    Keeps up to size connections to the worker. relocate returns None whenever the document
+    should be processed locally: all connections are busy, the worker is busy, unreachable
+    (it's then left alone for retry_after seconds), didn't answer within timeout or failed.
+    """
+    def __init__(self, address, size=8, timeout=5.0, retry_after=5.0, authkey=None):
+        self.address = address
+        self.size = size
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.authkey = authkey
+        self.idle = LifoQueue()
+        self.connections = 0
+        self.down_until = 0
+        self.lock = threading.Lock()
+        self.metrics = dict(remote=0, busy=0, unavailable=0, timeouts=0, errors=0)
+
+    def _checkout(self):
+        try:
+            return self.idle.get_nowait()
+        except Empty:
+            pass
+        with self.lock:
+            if self.connections >= self.size or time.time() < self.down_until:
+                return None
+            self.connections += 1
+        try:
+            return Client(self.address, authkey=self.authkey)
+        except Exception:
+            with self.lock:
+                self.connections -= 1
+                self.down_until = time.time() + self.retry_after
+            logging.getLogger('relocation.worker').warning('Relocation worker %s is unreachable', self.address,
+                                                           exc_info=True)
+            return None
+
+    def _discard(self, connection):
+        with self.lock:
+            self.connections -= 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _request(self, connection, request):
+        connection.send(request)
+        if not connection.poll(self.timeout):
+            self.metrics['timeouts'] += 1
+            raise WorkerUnavailable('No answer within %ss' % self.timeout)
+        return connection.recv()
+
+    def relocate(self, template_name, rendered_template, sections=None):
+        request = (template_name, rendered_template, sections)
+        # A pooled connection may have been closed by a restarted worker, a new one gets a second try
+        for attempt in range(2):
+            connection = self._checkout()
+            if connection is None:
+                self.metrics['unavailable'] += 1
+                return None
+            try:
+                status, result = self._request(connection, request)
+            except WorkerUnavailable:
+                self._discard(connection)
+                return None
+            except (EOFError, IOError, OSError):
+                self._discard(connection)
+                continue
+            self.idle.put(connection)
+            if status == BUSY:
+                self.metrics['busy'] += 1
+                return None
+            if status == ERROR:
+                self.metrics['errors'] += 1
+                logging.getLogger('relocation.worker').warning('Relocation worker %s failed on %s: %r', self.address,
+                                                               template_name, result)
+                return None
+            self.metrics['remote'] += 1
+            return result
+        self.metrics['unavailable'] += 1
+        return None
+
+_client = []
+_client_lock = threading.Lock()
+def get_client():
+    """ The WorkerClient configured by the RELOCATION_WORKER_* settings """
+    with _client_lock:
+        if not _client:
+            from django.conf import settings
+            _client.append(WorkerClient(
+                parse_address(settings.RELOCATION_WORKER_ADDRESS),
+                size=getattr(settings, 'RELOCATION_WORKER_CONNECTIONS', 8),
+                timeout=getattr(settings, 'RELOCATION_WORKER_TIMEOUT', 5.0),
+                authkey=getattr(settings, 'RELOCATION_WORKER_AUTHKEY', None),
+            ))
+        return _client[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='relocation pipeline worker')
+    parser.add_argument('address', help='unix socket path or host:port')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes (default: cpu count)')
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help='documents in flight before answering busy (default: twice the processes)')
+    args = parser.parse_args(argv)
+
+    from django.conf import settings
+    logging.basicConfig(level=logging.INFO)
+    try:
+        server = WorkerServer(parse_address(args.address), args.processes, args.max_pending,
+                              getattr(settings, 'RELOCATION_WORKER_AUTHKEY', None))
+    except ValueError as e:
+        parser.error(str(e))
+    server.serve_forever()
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
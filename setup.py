@@ -6,6 +6,7 @@ setup(
     author='Alon Hammerman',
     author_email='the.alonso@gmail.com',
     packages=find_packages(),
+    package_data={'relocation.coffeeutils': ['*.js']},
     url='https://github.com/m0she/template-relocation',
     license='New BSD License',
     description='Write web modules using HTML, Javascript (CoffeeScript) and CSS (Scss) all in the same file. And have them dynamically and efficiently served',